@@ -13,11 +13,17 @@ Retry Strategy:
 
 import logging
 import random
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Iterator, List, Any
 import requests
 
+from api.dispatcharr_refresh import RefreshCoordinator, RefreshHandle
+from api.dispatcharr_store import IndexedStore
+from api.dispatcharr_sync import SYNC_WORKERS, ChannelOperation, ChannelSyncPlan
+
 logger = logging.getLogger(__name__)
 
 
@@ -396,6 +402,128 @@ class DispatcharrAuth:
         return self.request("POST", endpoint, data)
 
 
+# =============================================================================
+# Pagination
+# =============================================================================
+
+# Concurrent page requests after the first page
+PAGE_FETCH_WORKERS = 4
+
+
+def _relative_url(url: str) -> str:
+    """Path+query of a pagination link (Dispatcharr returns absolute URLs)."""
+    from urllib.parse import urlparse
+
+    if url.startswith('http'):
+        parsed = urlparse(url)
+        return f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+    return url
+
+
+def _remaining_page_urls(next_url: Optional[str], count: Optional[int], page_size: int) -> Optional[List[str]]:
+    """
+    URLs of pages 2..N, built from the first page's `next` link.
+
+    Returns:
+        List of endpoints, or None if the link isn't page-numbered (follow it instead)
+    """
+    from urllib.parse import parse_qs, urlencode, urlparse
+
+    if not next_url:
+        return []
+    if not count or not page_size:
+        return None
+
+    parsed = urlparse(next_url)
+    query = parse_qs(parsed.query, keep_blank_values=True)
+    if query.get('page') != ['2']:
+        return None
+
+    total_pages = -(-count // page_size)
+    urls = []
+    for page in range(2, total_pages + 1):
+        query['page'] = [str(page)]
+        urls.append(f"{parsed.path}?{urlencode(query, doseq=True)}")
+    return urls
+
+
+def iter_paginated(
+    auth: 'DispatcharrAuth',
+    initial_endpoint: str,
+    error_context: str = "items",
+    max_workers: int = PAGE_FETCH_WORKERS
+) -> Iterator[List[Dict]]:
+    """
+    Yield the pages of a paginated API endpoint, fetching pages concurrently.
+
+    The first page's `count` and size give the URLs of all remaining pages,
+    which are requested in parallel. Pages are yielded in order as soon as
+    each one arrives, so callers can work on page 1 while the rest are in
+    flight. Stopping early cancels the requests not yet started.
+
+    Handles paginated dict responses (with 'results', 'count' and 'next')
+    and simple list responses. Links that aren't page-numbered are followed
+    one at a time.
+
+    Args:
+        auth: DispatcharrAuth for the requests
+        initial_endpoint: Starting endpoint with page_size (e.g., "/api/channels/channels/?page_size=1000")
+        error_context: Context for error logging (e.g., "channels", "EPG data")
+        max_workers: Concurrent page requests
+
+    Yields:
+        List of items per page
+    """
+    def fetch(endpoint: str):
+        response = auth.get(endpoint)
+        if response is None or response.status_code != 200:
+            logger.error(f"Failed to get {error_context}: {response.status_code if response else 'No response'}")
+            return None
+        return response.json()
+
+    def follow(next_url: Optional[str]):
+        while next_url:
+            data = fetch(_relative_url(next_url))
+            if isinstance(data, list):
+                yield data
+                return
+            if not isinstance(data, dict) or 'results' not in data:
+                return
+            yield data['results']
+            next_url = data.get('next')
+
+    data = fetch(initial_endpoint)
+    if isinstance(data, list):
+        yield data
+        return
+    if not isinstance(data, dict) or 'results' not in data:
+        return
+    yield data['results']
+
+    remaining = _remaining_page_urls(data.get('next'), data.get('count'), len(data['results']))
+    if remaining is None:
+        yield from follow(data.get('next'))
+        return
+    if not remaining:
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(remaining)))
+    try:
+        futures = [executor.submit(fetch, endpoint) for endpoint in remaining]
+        for future in futures:
+            data = future.result()
+            if not isinstance(data, dict) or 'results' not in data:
+                return
+            yield data['results']
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Items added since the first page was counted
+    yield from follow(data.get('next'))
+
+
 class EPGManager:
     """
     High-level EPG management interface for Dispatcharr.
@@ -499,111 +627,132 @@ class EPGManager:
                 msg = f"HTTP {response.status_code}"
             return {"success": False, "message": msg}
 
-    def wait_for_refresh(
+    def _sources_by_id(self) -> Optional[Dict[int, Dict]]:
+        """All EPG sources keyed by ID (one request per refresh poll), or None if the request failed."""
+        response = self.auth.get("/api/epg/sources/")
+        if response is None or response.status_code != 200:
+            return None
+        return {source.get('id'): source for source in response.json()}
+
+    def start_refresh(
         self,
         epg_id: int,
         timeout: int = 60,
-        poll_interval: int = 2
-    ) -> Dict[str, Any]:
+        poll_interval: Optional[float] = None
+    ) -> RefreshHandle:
         """
-        Trigger EPG refresh and wait for completion.
+        Trigger EPG refresh and return a handle that resolves when it completes.
 
-        Dispatcharr's EPG import is async (returns 202). This method triggers
-        the refresh and polls until completion by monitoring status and updated_at.
+        Completion is detected by the shared RefreshCoordinator (status
+        success with a new updated_at, or status error). If this source is
+        already being refreshed, the pending handle is returned instead of
+        triggering again.
 
         EPG status values: idle, fetching, parsing, error, success, disabled
 
         Args:
             epg_id: EPG source ID to refresh
             timeout: Maximum seconds to wait (default: 60)
-            poll_interval: Seconds between status checks (default: 2)
+            poll_interval: Longest wait between status checks (default: adaptive, up to 5s)
 
         Returns:
-            Result dict with:
-            - success: bool
-            - message: str
-            - duration: float (seconds taken)
-            - source: dict (final EPG source state if successful)
+            RefreshHandle - wait() returns the wait_for_refresh() result
         """
-        import time
+        coordinator = RefreshCoordinator.get(self.auth.url, 'epg')
+        pending = coordinator.pending(epg_id)
+        if pending:
+            return pending
 
         # Get current state before refresh
         before = self.get_source(epg_id)
         if not before:
-            return {"success": False, "message": f"EPG source {epg_id} not found"}
+            return RefreshHandle(epg_id, {"success": False, "message": f"EPG source {epg_id} not found"})
 
         before_updated = before.get('updated_at')
 
         # Trigger refresh
         trigger_result = self.refresh(epg_id)
         if not trigger_result.get('success'):
-            return trigger_result
-
-        # Poll until status changes to success/error or updated_at changes
-        start_time = time.time()
-        last_logged_status = None
-        last_status = None
-        last_message = None
-
-        while time.time() - start_time < timeout:
-            time.sleep(poll_interval)
+            return RefreshHandle(epg_id, trigger_result)
 
-            current = self.get_source(epg_id)
-            if not current:
-                logger.debug(f"EPG refresh poll: could not get source {epg_id}")
-                continue
+        logged = {'status': None}
 
+        def check(current: Dict, elapsed: float) -> Optional[Dict[str, Any]]:
             current_status = current.get('status', '')
-            current_updated = current.get('updated_at')
-            current_message = current.get('last_message', '')
-            last_status = current_status
-            last_message = current_message
 
             # Log status changes
-            if current_status != last_logged_status:
-                elapsed = time.time() - start_time
-                logger.debug(f"EPG refresh poll: status={current_status}, message='{current_message}', elapsed={elapsed:.1f}s")
-                last_logged_status = current_status
-
-            # Check if refresh completed (status is success and updated_at changed)
-            if current_status == 'success' and current_updated != before_updated:
-                duration = time.time() - start_time
+            if current_status != logged['status']:
+                logger.debug(f"EPG refresh poll: status={current_status}, "
+                             f"message='{current.get('last_message', '')}', elapsed={elapsed:.1f}s")
+                logged['status'] = current_status
+
+            # Refresh completed (status is success and updated_at changed)
+            if current_status == 'success' and current.get('updated_at') != before_updated:
                 return {
                     "success": True,
                     "message": current.get('last_message', 'EPG refresh completed'),
-                    "duration": duration,
+                    "duration": elapsed,
                     "source": current
                 }
             elif current_status == 'error':
-                duration = time.time() - start_time
                 return {
                     "success": False,
                     "message": current.get('last_message', 'EPG refresh failed'),
-                    "duration": duration,
+                    "duration": elapsed,
                     "source": current
                 }
 
             # Still in progress (fetching, parsing, idle)
-            # Continue polling
+            return None
+
+        def on_timeout(last: Optional[Dict]) -> Dict[str, Any]:
+            last_status = last.get('status') if last else None
+            last_message = last.get('last_message') if last else None
+
+            # When no channels are mapped, Dispatcharr completes instantly but updated_at doesn't change
+            # Status 'success' means the EPG was parsed - "No channels mapped" is informational
+            if last_status == 'success':
+                return {
+                    "success": True,
+                    "message": last_message or 'EPG refresh completed (no channels mapped yet)',
+                    "duration": timeout,
+                    "source": None  # Don't have final source state
+                }
 
-        # Timeout - but check if status is actually success
-        # When no channels are mapped, Dispatcharr completes instantly but updated_at doesn't change
-        # Status 'success' means the EPG was parsed - "No channels mapped" is informational
-        if last_status == 'success':
             return {
-                "success": True,
-                "message": last_message or 'EPG refresh completed (no channels mapped yet)',
+                "success": False,
+                "message": f"EPG refresh timed out after {timeout} seconds (last status: {last_status}, message: {last_message})",
                 "duration": timeout,
-                "source": None  # Don't have final source state
+                "last_status": last_status,
+                "last_message": last_message
             }
 
-        return {
-            "success": False,
-            "message": f"EPG refresh timed out after {timeout} seconds (last status: {last_status}, message: {last_message})",
-            "duration": timeout,
-            "last_status": last_status,
-            "last_message": last_message
-        }
+        return coordinator.watch(epg_id, self._sources_by_id, check, on_timeout, timeout, poll_interval)
+
+    def wait_for_refresh(
+        self,
+        epg_id: int,
+        timeout: int = 60,
+        poll_interval: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Trigger EPG refresh and wait for completion.
+
+        Dispatcharr's EPG import is async (returns 202). See start_refresh().
+
+        Args:
+            epg_id: EPG source ID to refresh
+            timeout: Maximum seconds to wait (default: 60)
+            poll_interval: Longest wait between status checks (default: adaptive, up to 5s)
+
+        Returns:
+            Result dict with:
+            - success: bool
+            - message: str
+            - duration: float (seconds taken)
+            - source: dict (final EPG source state if successful)
+        """
+        return self.start_refresh(epg_id, timeout, poll_interval).wait()
 
     def refresh_by_name(self, name: str) -> Dict[str, Any]:
         """
@@ -660,6 +809,10 @@ class EPGManager:
             }
 
 
+# Concurrent refresh triggers in M3UManager.start_refreshes()
+REFRESH_TRIGGER_WORKERS = 4
+
+
 class M3UManager:
     """
     M3U account and stream management for Dispatcharr.
@@ -715,16 +868,16 @@ class M3UManager:
         group = next((g for g in (self._groups_cache or []) if g.get('id') == group_id), None)
         return group.get('name') if group else None
 
-    def list_streams(
+    def iter_streams(
         self,
         group_name: Optional[str] = None,
         group_id: Optional[int] = None,
-        account_id: Optional[int] = None,
-        limit: Optional[int] = None
-    ) -> List[Dict]:
+        account_id: Optional[int] = None
+    ) -> Iterator[Dict]:
         """
-        List streams from Dispatcharr.
+        Iterate over streams from Dispatcharr as their pages arrive.
 
+        Follows pagination (remaining pages are fetched concurrently).
         Filter by group using exact group_name (preferred) or group_id (requires lookup).
         The API's channel_group_name filter requires exact match including emoji.
 
@@ -732,10 +885,9 @@ class M3UManager:
             group_name: Exact group name (e.g., "NFL Game Pass 🏈")
             group_id: Group ID (will lookup name if group_name not provided)
             account_id: Filter by M3U account ID
-            limit: Maximum streams to return
 
-        Returns:
-            List of stream dicts with id, name, url, channel_group, tvg_id, etc.
+        Yields:
+            Stream dicts with id, name, url, channel_group, tvg_id, etc.
         """
         import urllib.parse
 
@@ -750,22 +902,37 @@ class M3UManager:
         if account_id is not None:
             params.append(f"m3u_account={account_id}")
 
-        response = self.auth.get(f"/api/channels/streams/?{'&'.join(params)}")
-        if response is None or response.status_code != 200:
-            logger.error(f"Failed to list streams: {response.status_code if response else 'No response'}")
-            return []
-
-        data = response.json()
-        streams = data.get('results', []) if isinstance(data, dict) else data
+        for page in iter_paginated(self.auth, f"/api/channels/streams/?{'&'.join(params)}", error_context="streams"):
+            for stream in page:
+                # Fix double-encoded UTF-8 in stream names
+                if 'name' in stream:
+                    stream['name'] = fix_double_encoded_utf8(stream['name'])
+                yield stream
 
-        # Fix double-encoded UTF-8 in stream names
-        for stream in streams:
-            if 'name' in stream:
-                stream['name'] = fix_double_encoded_utf8(stream['name'])
+    def list_streams(
+        self,
+        group_name: Optional[str] = None,
+        group_id: Optional[int] = None,
+        account_id: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        List streams from Dispatcharr (all pages).
 
-        if limit:
-            streams = streams[:limit]
+        Args:
+            group_name: Exact group name (e.g., "NFL Game Pass 🏈")
+            group_id: Group ID (will lookup name if group_name not provided)
+            account_id: Filter by M3U account ID
+            limit: Maximum streams to return (later pages aren't fetched)
 
+        Returns:
+            List of stream dicts with id, name, url, channel_group, tvg_id, etc.
+        """
+        streams = []
+        for stream in self.iter_streams(group_name=group_name, group_id=group_id, account_id=account_id):
+            streams.append(stream)
+            if limit and len(streams) >= limit:
+                break
         return streams
 
     def get_group_with_streams(self, group_id: int, stream_limit: int = None) -> Optional[Dict]:
@@ -812,298 +979,228 @@ class M3UManager:
             return None
         return response.json()
 
-    def wait_for_refresh(
-        self,
-        account_id: int,
-        timeout: int = 120,
-        poll_interval: int = 2,
-        skip_if_recent_minutes: int = 60
-    ) -> Dict[str, Any]:
-        """
-        Trigger M3U refresh and wait for completion.
+    def _accounts_by_id(self) -> Optional[Dict[int, Dict]]:
+        """All M3U accounts keyed by ID (one request per refresh poll), or None if the request failed."""
+        response = self.auth.get("/api/m3u/accounts/")
+        if response is None or response.status_code != 200:
+            return None
+        return {account.get('id'): account for account in response.json()}
 
-        This ensures streams are updated before we fetch them for EPG generation.
-        Uses polling to detect when refresh completes by monitoring updated_at.
-        Skips refresh if account was updated within skip_if_recent_minutes.
+    @staticmethod
+    def _skip_recent_result(account: Dict, skip_if_recent_minutes: int) -> Optional[Dict[str, Any]]:
+        """Skipped result if the account was refreshed within skip_if_recent_minutes."""
+        updated_at = account.get('updated_at')
+        if skip_if_recent_minutes <= 0 or not updated_at:
+            return None
+        try:
+            # Parse ISO timestamp (handle both Z and +00:00 formats)
+            updated_dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
+            age_minutes = (datetime.now(timezone.utc) - updated_dt).total_seconds() / 60
+        except (ValueError, TypeError) as e:
+            logger.debug(f"Could not parse updated_at '{updated_at}': {e}")
+            return None
 
-        Args:
-            account_id: M3U account ID to refresh
-            timeout: Maximum seconds to wait (default: 120)
-            poll_interval: Seconds between status checks (default: 2)
-            skip_if_recent_minutes: Skip refresh if updated within this many minutes (default: 60)
+        if age_minutes >= skip_if_recent_minutes:
+            return None
+        logger.info(f"M3U account {account.get('id')} refreshed {age_minutes:.1f} min ago, skipping refresh")
+        return {
+            "success": True,
+            "message": f"Skipped - refreshed {age_minutes:.0f} min ago",
+            "duration": 0,
+            "skipped": True,
+            "account": account
+        }
 
-        Returns:
-            Result dict with:
-            - success: bool
-            - message: str
-            - duration: float (seconds taken)
-            - account: dict (final account state if successful)
-            - skipped: bool (True if refresh was skipped due to recent update)
+    def _start_refresh(
+        self,
+        account_id: int,
+        before: Optional[Dict],
+        timeout: int,
+        poll_interval: Optional[float],
+        skip_if_recent_minutes: int,
+        require_final_status: bool
+    ) -> RefreshHandle:
         """
-        import time
-        from datetime import datetime, timezone
-
-        # Get current state
-        before = self.get_account(account_id)
-        if not before:
-            return {"success": False, "message": f"Account {account_id} not found"}
-
-        before_updated = before.get('updated_at')
+        Skip, or trigger and watch, one account's refresh.
 
-        # Check if recently refreshed - skip if within threshold
-        if skip_if_recent_minutes > 0 and before_updated:
-            try:
-                # Parse ISO timestamp (handle both Z and +00:00 formats)
-                updated_str = before_updated.replace('Z', '+00:00')
-                updated_dt = datetime.fromisoformat(updated_str)
-                now = datetime.now(timezone.utc)
-                age_minutes = (now - updated_dt).total_seconds() / 60
-
-                if age_minutes < skip_if_recent_minutes:
-                    logger.info(f"M3U account {account_id} refreshed {age_minutes:.1f} min ago, skipping refresh")
-                    return {
-                        "success": True,
-                        "message": f"Skipped - refreshed {age_minutes:.0f} min ago",
-                        "duration": 0,
-                        "skipped": True,
-                        "account": before
-                    }
-            except (ValueError, TypeError) as e:
-                logger.debug(f"Could not parse updated_at '{before_updated}': {e}")
+        Args:
+            before: Account state before the refresh (None = unknown - any
+                updated_at counts as changed)
+            require_final_status: Once updated_at changes, keep waiting for
+                status success/error (otherwise any other status counts as success)
+        """
+        coordinator = RefreshCoordinator.get(self.auth.url, 'm3u')
+        pending = coordinator.pending(account_id)
+        if pending:
+            return pending
+
+        if before:
+            skipped = self._skip_recent_result(before, skip_if_recent_minutes)
+            if skipped:
+                return RefreshHandle(account_id, skipped)
+        before_updated = before.get('updated_at') if before else None
 
         # Trigger refresh
-        trigger_result = self.refresh_m3u_account(account_id)
+        try:
+            trigger_result = self.refresh_m3u_account(account_id)
+        except Exception as e:
+            trigger_result = {"success": False, "message": str(e)}
         if not trigger_result.get('success'):
-            return trigger_result
-
-        # Poll until updated_at changes or status indicates completion/error
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            time.sleep(poll_interval)
-
-            current = self.get_account(account_id)
-            if not current:
-                continue
+            return RefreshHandle(account_id, {
+                "success": False,
+                "message": trigger_result.get('message', 'Failed to trigger refresh')
+            })
 
+        def check(current: Dict, elapsed: float) -> Optional[Dict[str, Any]]:
             current_status = current.get('status', '')
-            current_updated = current.get('updated_at')
 
-            # Check if refresh completed (updated_at changed)
-            if current_updated != before_updated:
-                duration = time.time() - start_time
+            # Refresh completed (updated_at changed)
+            if current.get('updated_at') != before_updated:
                 if current_status == 'success':
                     return {
                         "success": True,
                         "message": current.get('last_message', 'Refresh completed'),
-                        "duration": duration,
+                        "duration": elapsed,
                         "account": current
                     }
                 elif current_status == 'error':
                     return {
                         "success": False,
                         "message": current.get('last_message', 'Refresh failed'),
-                        "duration": duration,
+                        "duration": elapsed,
+                        "account": current
+                    }
+                elif not require_final_status:
+                    # Status unclear but updated_at changed - assume success
+                    return {
+                        "success": True,
+                        "message": "Refresh completed",
+                        "duration": elapsed,
                         "account": current
                     }
 
-            # Check for error status even if updated_at hasn't changed
+            # Error status even if updated_at hasn't changed
             if current_status == 'error':
                 return {
                     "success": False,
                     "message": current.get('last_message', 'Refresh failed'),
-                    "duration": time.time() - start_time
+                    "duration": elapsed
                 }
+            return None
 
-        # Timeout
-        return {
-            "success": False,
-            "message": f"Refresh timed out after {timeout} seconds",
-            "duration": timeout
-        }
+        def on_timeout(last: Optional[Dict]) -> Dict[str, Any]:
+            return {
+                "success": False,
+                "message": f"Refresh timed out after {timeout} seconds",
+                "duration": timeout
+            }
 
-    def refresh_multiple_accounts(
+        return coordinator.watch(account_id, self._accounts_by_id, check, on_timeout, timeout, poll_interval)
+
+    def start_refresh(
         self,
-        account_ids: List[int],
+        account_id: int,
         timeout: int = 120,
-        poll_interval: int = 2,
+        poll_interval: Optional[float] = None,
         skip_if_recent_minutes: int = 60
-    ) -> Dict[str, Any]:
+    ) -> RefreshHandle:
         """
-        Refresh multiple M3U accounts in parallel and wait for all to complete.
+        Trigger M3U refresh and return a handle that resolves when it completes.
 
-        Triggers all accounts simultaneously, then polls until all complete or timeout.
-        This is more efficient than sequential refreshes when multiple event groups
-        share the same M3U provider. Skips accounts refreshed within skip_if_recent_minutes.
+        Completion is detected by the shared RefreshCoordinator (updated_at
+        changed with status success, or status error). If this account is
+        already being refreshed, the pending handle is returned instead of
+        triggering again. Skips refresh if the account was updated within
+        skip_if_recent_minutes.
 
         Args:
-            account_ids: List of unique M3U account IDs to refresh
-            timeout: Maximum seconds to wait for all (default: 120)
-            poll_interval: Seconds between status checks (default: 2)
+            account_id: M3U account ID to refresh
+            timeout: Maximum seconds to wait (default: 120)
+            poll_interval: Longest wait between status checks (default: adaptive, up to 5s)
             skip_if_recent_minutes: Skip refresh if updated within this many minutes (default: 60)
 
         Returns:
-            Result dict with:
-            - success: bool (True if ALL succeeded)
-            - results: dict mapping account_id -> result dict
-            - duration: float (total seconds taken)
-            - failed_count: int
-            - succeeded_count: int
-            - skipped_count: int
+            RefreshHandle - wait() returns the wait_for_refresh() result
         """
-        import time
-        from concurrent.futures import ThreadPoolExecutor
-        from datetime import datetime, timezone
+        before = self.get_account(account_id)
+        if not before:
+            return RefreshHandle(account_id, {"success": False, "message": f"Account {account_id} not found"})
+        return self._start_refresh(account_id, before, timeout, poll_interval, skip_if_recent_minutes,
+                                   require_final_status=True)
 
-        if not account_ids:
-            return {
-                "success": True,
-                "results": {},
-                "duration": 0,
-                "failed_count": 0,
-                "succeeded_count": 0,
-                "skipped_count": 0
-            }
+    def wait_for_refresh(
+        self,
+        account_id: int,
+        timeout: int = 120,
+        poll_interval: Optional[float] = None,
+        skip_if_recent_minutes: int = 60
+    ) -> Dict[str, Any]:
+        """
+        Trigger M3U refresh and wait for completion.
 
-        # Deduplicate account IDs
-        unique_ids = list(set(account_ids))
+        This ensures streams are updated before we fetch them for EPG generation.
+        See start_refresh().
 
-        # Get initial state for all accounts and check which need refresh
-        initial_states = {}
-        results = {}
-        ids_needing_refresh = []
-        now = datetime.now(timezone.utc)
+        Args:
+            account_id: M3U account ID to refresh
+            timeout: Maximum seconds to wait (default: 120)
+            poll_interval: Longest wait between status checks (default: adaptive, up to 5s)
+            skip_if_recent_minutes: Skip refresh if updated within this many minutes (default: 60)
 
-        for account_id in unique_ids:
-            account = self.get_account(account_id)
-            if not account:
-                initial_states[account_id] = None
-                ids_needing_refresh.append(account_id)
-                continue
+        Returns:
+            Result dict with:
+            - success: bool
+            - message: str
+            - duration: float (seconds taken)
+            - account: dict (final account state if successful)
+            - skipped: bool (True if refresh was skipped due to recent update)
+        """
+        return self.start_refresh(account_id, timeout, poll_interval, skip_if_recent_minutes).wait()
 
-            initial_states[account_id] = account.get('updated_at')
-
-            # Check if recently refreshed
-            if skip_if_recent_minutes > 0 and account.get('updated_at'):
-                try:
-                    updated_str = account['updated_at'].replace('Z', '+00:00')
-                    updated_dt = datetime.fromisoformat(updated_str)
-                    age_minutes = (now - updated_dt).total_seconds() / 60
-
-                    if age_minutes < skip_if_recent_minutes:
-                        logger.info(f"M3U account {account_id} refreshed {age_minutes:.1f} min ago, skipping")
-                        results[account_id] = {
-                            "success": True,
-                            "message": f"Skipped - refreshed {age_minutes:.0f} min ago",
-                            "duration": 0,
-                            "skipped": True
-                        }
-                        continue
-                except (ValueError, TypeError):
-                    pass
+    def start_refreshes(
+        self,
+        account_ids: List[int],
+        timeout: int = 120,
+        poll_interval: Optional[float] = None,
+        skip_if_recent_minutes: int = 60
+    ) -> Dict[int, RefreshHandle]:
+        """
+        Trigger refreshes for several M3U accounts without waiting.
 
-            ids_needing_refresh.append(account_id)
+        Account states come from one list request and the triggers are sent
+        in parallel. Each handle resolves as soon as its own account is done,
+        so callers can start on one account's streams while others are still
+        refreshing. Skips accounts refreshed within skip_if_recent_minutes.
 
-        # If all accounts were skipped, return early
-        if not ids_needing_refresh:
-            skipped_count = len(results)
-            return {
-                "success": True,
-                "results": results,
-                "duration": 0,
-                "failed_count": 0,
-                "succeeded_count": skipped_count,
-                "skipped_count": skipped_count
-            }
+        Args:
+            account_ids: M3U account IDs to refresh (duplicates are ignored)
+            timeout: Maximum seconds to wait for each (default: 120)
+            poll_interval: Longest wait between status checks (default: adaptive, up to 5s)
+            skip_if_recent_minutes: Skip refresh if updated within this many minutes (default: 60)
 
-        # Trigger refreshes in parallel (only for accounts that need it)
-        def trigger_refresh(account_id):
-            return (account_id, self.refresh_m3u_account(account_id))
-
-        trigger_results = {}
-        with ThreadPoolExecutor(max_workers=len(ids_needing_refresh)) as executor:
-            futures = {executor.submit(trigger_refresh, aid): aid for aid in ids_needing_refresh}
-            for future in futures:
-                try:
-                    account_id, result = future.result()
-                    trigger_results[account_id] = result
-                except Exception as e:
-                    account_id = futures[future]
-                    trigger_results[account_id] = {"success": False, "message": str(e)}
-
-        # Track which accounts we're waiting for
-        pending = set()
-
-        for account_id in ids_needing_refresh:
-            trigger_result = trigger_results.get(account_id, {"success": False, "message": "Trigger failed"})
-
-            if trigger_result.get('success'):
-                pending.add(account_id)
-            else:
-                results[account_id] = {
-                    "success": False,
-                    "message": trigger_result.get('message', 'Failed to trigger refresh')
-                }
+        Returns:
+            Account ID -> RefreshHandle
+        """
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Poll until all complete or timeout
-        start_time = time.time()
-        while pending and (time.time() - start_time) < timeout:
-            time.sleep(poll_interval)
-
-            # Check all pending accounts
-            still_pending = set()
-            for account_id in pending:
-                current = self.get_account(account_id)
-                if not current:
-                    still_pending.add(account_id)
-                    continue
-
-                current_status = current.get('status', '')
-                current_updated = current.get('updated_at')
-                initial_updated = initial_states.get(account_id)
-
-                # Check if refresh completed
-                if current_updated != initial_updated:
-                    duration = time.time() - start_time
-                    if current_status == 'success':
-                        results[account_id] = {
-                            "success": True,
-                            "message": current.get('last_message', 'Refresh completed'),
-                            "duration": duration
-                        }
-                    elif current_status == 'error':
-                        results[account_id] = {
-                            "success": False,
-                            "message": current.get('last_message', 'Refresh failed'),
-                            "duration": duration
-                        }
-                    else:
-                        # Status unclear but updated_at changed - assume success
-                        results[account_id] = {
-                            "success": True,
-                            "message": "Refresh completed",
-                            "duration": duration
-                        }
-                elif current_status == 'error':
-                    results[account_id] = {
-                        "success": False,
-                        "message": current.get('last_message', 'Refresh failed'),
-                        "duration": time.time() - start_time
-                    }
-                else:
-                    still_pending.add(account_id)
+        unique_ids = list(dict.fromkeys(account_ids))
+        if not unique_ids:
+            return {}
 
-            pending = still_pending
+        accounts = self._accounts_by_id()
+        if accounts is None:
+            accounts = {account_id: self.get_account(account_id) for account_id in unique_ids}
 
-        # Handle any remaining pending (timed out)
-        for account_id in pending:
-            results[account_id] = {
-                "success": False,
-                "message": f"Refresh timed out after {timeout} seconds",
-                "duration": timeout
-            }
+        def start(account_id):
+            return self._start_refresh(account_id, accounts.get(account_id), timeout, poll_interval,
+                                       skip_if_recent_minutes, require_final_status=False)
+
+        with ThreadPoolExecutor(max_workers=min(len(unique_ids), REFRESH_TRIGGER_WORKERS)) as executor:
+            return dict(zip(unique_ids, executor.map(start, unique_ids)))
 
-        # Calculate summary
-        total_duration = time.time() - start_time
+    @staticmethod
+    def summarize_refreshes(results: Dict[int, Dict[str, Any]], duration: float) -> Dict[str, Any]:
+        """Batch result (see refresh_multiple_accounts) from per-account results."""
         skipped = sum(1 for r in results.values() if r.get('skipped'))
         succeeded = sum(1 for r in results.values() if r.get('success'))
         failed = len(results) - succeeded
@@ -1111,12 +1208,44 @@ class M3UManager:
         return {
             "success": failed == 0,
             "results": results,
-            "duration": total_duration,
+            "duration": duration,
             "failed_count": failed,
             "succeeded_count": succeeded,
             "skipped_count": skipped
         }
 
+    def refresh_multiple_accounts(
+        self,
+        account_ids: List[int],
+        timeout: int = 120,
+        poll_interval: Optional[float] = None,
+        skip_if_recent_minutes: int = 60
+    ) -> Dict[str, Any]:
+        """
+        Refresh multiple M3U accounts in parallel and wait for all to complete.
+
+        Use start_refreshes() to act on each account as soon as it's done.
+
+        Args:
+            account_ids: List of unique M3U account IDs to refresh
+            timeout: Maximum seconds to wait for all (default: 120)
+            poll_interval: Longest wait between status checks (default: adaptive, up to 5s)
+            skip_if_recent_minutes: Skip refresh if updated within this many minutes (default: 60)
+
+        Returns:
+            Result dict with:
+            - success: bool (True if ALL succeeded)
+            - results: dict mapping account_id -> result dict
+            - duration: float (total seconds taken)
+            - failed_count: int
+            - succeeded_count: int
+            - skipped_count: int
+        """
+        start_time = time.time()
+        handles = self.start_refreshes(account_ids, timeout, poll_interval, skip_if_recent_minutes)
+        results = {account_id: handle.wait() for account_id, handle in handles.items()}
+        return self.summarize_refreshes(results, time.time() - start_time)
+
     def test_connection(self) -> Dict[str, Any]:
         """Test connection to Dispatcharr."""
         try:
@@ -1133,6 +1262,16 @@ class M3UManager:
             return {"success": False, "message": str(e)}
 
 
+# Secondary indexes of the channel/logo caches (keys are what find_* callers pass)
+CHANNEL_INDEXES = {
+    'tvg_id': lambda channel: channel.get('tvg_id'),
+    'number': lambda channel: str(channel['channel_number']) if channel.get('channel_number') else None,
+}
+LOGO_INDEXES = {
+    'url': lambda logo: logo.get('url'),
+}
+
+
 class ChannelManager:
     """
     Channel management for Dispatcharr.
@@ -1143,8 +1282,14 @@ class ChannelManager:
     Performance optimizations:
     - Channel cache: Avoids repeated get_channels() calls during EPG generation
     - Logo cache: Avoids repeated logo lookups for duplicate URL checks
+    - Both caches are IndexedStores: O(1) lookup by id/tvg_id/number/URL and
+      O(1) update/delete (see api/dispatcharr_store.py)
     - Caches are class-level (shared across instances) keyed by URL
     - Call clear_cache() at the start of each EPG generation cycle
+    - Sync plan: inside sync_plan(), channel updates and profile changes are
+      diffed and sent as one PATCH per channel when the plan closes
+      (see api/dispatcharr_sync.py). Plans belong to the thread that opened
+      them; worker threads join one with bind_sync_plan()
 
     Usage:
         manager = ChannelManager("http://localhost:9191", "admin", "password")
@@ -1162,6 +1307,12 @@ class ChannelManager:
     # This ensures multiple get_lifecycle_manager() calls benefit from same cache
     _caches: Dict[str, Dict] = {}
 
+    # Guards the open sync plans registry (plans nest, e.g. group refreshes inside a generation)
+    _sync_lock = threading.Lock()
+
+    # Sync plans of the current thread: URL -> [plan, depth, owner]
+    _sync_local = threading.local()
+
     def __init__(self, url: str, username: str, password: str):
         self.auth = DispatcharrAuth(url, username, password)
         self._url = url.rstrip("/")
@@ -1169,12 +1320,9 @@ class ChannelManager:
         # Initialize cache structure for this URL if not exists
         if self._url not in self._caches:
             self._caches[self._url] = {
-                'channels_cache': None,
-                'channels_by_id': {},
-                'channels_by_tvg_id': {},
-                'channels_by_number': {},
-                'logos_cache': None,
-                'logos_by_url': {},
+                'channels': None,   # IndexedStore, loaded on first use
+                'logos': None,      # IndexedStore, loaded on first use
+                'open_plans': [],   # Sync plans open on any thread (snapshots are shared)
             }
 
     @property
@@ -1183,124 +1331,247 @@ class ChannelManager:
         return self._caches[self._url]
 
     @property
-    def _channels_cache(self) -> Optional[List[Dict]]:
-        return self._cache['channels_cache']
-
-    @_channels_cache.setter
-    def _channels_cache(self, value):
-        self._cache['channels_cache'] = value
-
-    @property
-    def _channels_by_id(self) -> Dict[int, Dict]:
-        return self._cache['channels_by_id']
-
-    @_channels_by_id.setter
-    def _channels_by_id(self, value):
-        self._cache['channels_by_id'] = value
-
-    @property
-    def _channels_by_tvg_id(self) -> Dict[str, Dict]:
-        return self._cache['channels_by_tvg_id']
-
-    @_channels_by_tvg_id.setter
-    def _channels_by_tvg_id(self, value):
-        self._cache['channels_by_tvg_id'] = value
-
-    @property
-    def _channels_by_number(self) -> Dict[str, Dict]:
-        return self._cache['channels_by_number']
-
-    @_channels_by_number.setter
-    def _channels_by_number(self, value):
-        self._cache['channels_by_number'] = value
+    def _channels(self) -> Optional[IndexedStore]:
+        return self._cache['channels']
 
     @property
-    def _logos_cache(self) -> Optional[List[Dict]]:
-        return self._cache['logos_cache']
-
-    @_logos_cache.setter
-    def _logos_cache(self, value):
-        self._cache['logos_cache'] = value
-
-    @property
-    def _logos_by_url(self) -> Dict[str, Dict]:
-        return self._cache['logos_by_url']
-
-    @_logos_by_url.setter
-    def _logos_by_url(self, value):
-        self._cache['logos_by_url'] = value
+    def _logos(self) -> Optional[IndexedStore]:
+        return self._cache['logos']
 
     def clear_cache(self):
         """
         Clear all caches. Call at the start of each EPG generation cycle.
         """
-        self._cache['channels_cache'] = None
-        self._cache['channels_by_id'] = {}
-        self._cache['channels_by_tvg_id'] = {}
-        self._cache['channels_by_number'] = {}
-        self._cache['logos_cache'] = None
-        self._cache['logos_by_url'] = {}
+        self._cache['channels'] = None
+        self._cache['logos'] = None
         logger.debug("ChannelManager caches cleared")
 
-    def _ensure_channels_cache(self) -> List[Dict]:
+    def _ensure_channels_cache(self) -> IndexedStore:
         """
-        Ensure channels cache is populated. Returns cached channels list.
+        Ensure channels cache is populated. Returns the channel store.
         """
-        if self._channels_cache is None:
-            self._channels_cache = self._paginated_get(
+        if self._channels is None:
+            channels = self._paginated_get(
                 "/api/channels/channels/?page_size=1000",
                 error_context="channels"
             )
-            # Build lookup indexes
-            self._channels_by_id = {}
-            self._channels_by_tvg_id = {}
-            self._channels_by_number = {}
-            for ch in self._channels_cache:
-                ch_id = ch.get('id')
-                if ch_id:
-                    self._channels_by_id[ch_id] = ch
-                tvg_id = ch.get('tvg_id')
-                if tvg_id:
-                    self._channels_by_tvg_id[tvg_id] = ch
-                ch_num = ch.get('channel_number')
-                if ch_num:
-                    self._channels_by_number[str(ch_num)] = ch
-            logger.debug(f"Cached {len(self._channels_cache)} channels")
-        return self._channels_cache
+            self._cache['channels'] = IndexedStore(channels, CHANNEL_INDEXES)
+            logger.debug(f"Cached {len(channels)} channels")
+            for plan in self._open_sync_plans():
+                plan.remember(channels)
+        return self._channels
 
     def _invalidate_channel_in_cache(self, channel_id: int):
         """
         Remove a channel from cache after deletion.
         """
-        if channel_id in self._channels_by_id:
-            channel = self._channels_by_id.pop(channel_id)
-            tvg_id = channel.get('tvg_id')
-            if tvg_id and tvg_id in self._channels_by_tvg_id:
-                del self._channels_by_tvg_id[tvg_id]
-            ch_num = channel.get('channel_number')
-            if ch_num and str(ch_num) in self._channels_by_number:
-                del self._channels_by_number[str(ch_num)]
-            if self._channels_cache:
-                self._channels_cache = [c for c in self._channels_cache if c.get('id') != channel_id]
+        if self._channels is not None:
+            self._channels.remove(channel_id)
 
     def _update_channel_in_cache(self, channel: Dict):
         """
         Update a channel in cache after create/update.
         """
-        ch_id = channel.get('id')
-        if ch_id:
-            # Remove old version first
-            self._invalidate_channel_in_cache(ch_id)
-            # Add new version
-            self._channels_by_id[ch_id] = channel
-            tvg_id = channel.get('tvg_id')
-            if tvg_id:
-                self._channels_by_tvg_id[tvg_id] = channel
-            ch_num = channel.get('channel_number')
-            if ch_num:
-                self._channels_by_number[str(ch_num)] = channel
-            if self._channels_cache is not None:
-                self._channels_cache.append(channel)
+        if self._channels is not None:
+            self._channels.upsert(channel)
+
+    # =========================================================================
+    # SYNC PLAN - Deferred, diffed channel writes (see api/dispatcharr_sync.py)
+    # =========================================================================
+
+    def _thread_sync_plans(self) -> Dict[str, list]:
+        plans = getattr(self._sync_local, 'plans', None)
+        if plans is None:
+            plans = self._sync_local.plans = {}
+        return plans
+
+    def _active_sync_plan(self) -> Optional[ChannelSyncPlan]:
+        """The current thread's sync plan for this Dispatcharr, if any."""
+        entry = self._thread_sync_plans().get(self._url)
+        return entry[0] if entry else None
+
+    def _open_sync_plans(self) -> List[ChannelSyncPlan]:
+        """Sync plans open on any thread (they all track Dispatcharr's state)."""
+        with self._sync_lock:
+            return list(self._cache['open_plans'])
+
+    def begin_sync_plan(self, dry_run: bool = False) -> ChannelSyncPlan:
+        """
+        Start deferring this thread's channel updates and profile changes.
+
+        Plans are scoped to the thread that opens them: other threads using
+        the ChannelManager (e.g. UI actions during a generation) are not
+        affected unless they join with bind_sync_plan(). Plans nest: if this
+        thread already has one open, it is joined and only the outermost
+        end_sync_plan() flushes it.
+
+        Args:
+            dry_run: Log the operations when flushing instead of sending them
+                (ignored when joining an open plan)
+
+        Returns:
+            The open ChannelSyncPlan
+        """
+        plans = self._thread_sync_plans()
+        entry = plans.get(self._url)
+        if entry is None:
+            plan = ChannelSyncPlan(dry_run=dry_run)
+            if self._channels is not None:
+                plan.remember(self._channels.list())
+            with self._sync_lock:
+                self._cache['open_plans'].append(plan)
+            entry = plans[self._url] = [plan, 0, True]
+        entry[1] += 1
+        return entry[0]
+
+    def end_sync_plan(self) -> Optional[ChannelSyncPlan]:
+        """
+        Close this thread's sync plan, flushing it if this was the outermost.
+
+        Returns:
+            The flushed plan, or None if a plan is still open (or none was)
+        """
+        plans = self._thread_sync_plans()
+        entry = plans.get(self._url)
+        if entry is None:
+            return None
+        entry[1] -= 1
+        if entry[1] > 0 or not entry[2]:
+            return None
+        del plans[self._url]
+
+        plan = entry[0]
+        try:
+            self._flush_sync_plan(plan)
+        finally:
+            with self._sync_lock:
+                self._cache['open_plans'].remove(plan)
+        return plan
+
+    @contextmanager
+    def sync_plan(self, dry_run: bool = False):
+        """Context manager for begin_sync_plan()/end_sync_plan()."""
+        plan = self.begin_sync_plan(dry_run=dry_run)
+        try:
+            yield plan
+        finally:
+            self.end_sync_plan()
+
+    def flush_sync_channels(self, channel_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Send this thread's pending updates for these channels now.
+
+        For callers that record a write as done (e.g. sync status) inside a
+        plan that is flushed later. Profile changes stay in the plan.
+
+        Returns:
+            Errors for these channels (also kept in the plan's errors)
+        """
+        plan = self._active_sync_plan()
+        if plan is None or not channel_ids:
+            return []
+        first_error = len(plan.errors)
+        self._apply_sync_operations(plan, plan.take_operations(channel_ids=channel_ids))
+        wanted = set(channel_ids)
+        return [error for error in plan.errors[first_error:] if error['channel_id'] in wanted]
+
+    @contextmanager
+    def bind_sync_plan(self, plan: Optional[ChannelSyncPlan]):
+        """
+        Stage this thread's channel writes in a plan opened by another thread.
+
+        Used by generation worker threads. The plan is only flushed by the
+        thread that opened it. With plan None this does nothing.
+        """
+        if plan is None:
+            yield
+            return
+        plans = self._thread_sync_plans()
+        previous = plans.get(self._url)
+        plans[self._url] = [plan, 1, False]
+        try:
+            yield
+        finally:
+            if previous is None:
+                plans.pop(self._url, None)
+            else:
+                plans[self._url] = previous
+
+    def _flush_sync_plan(self, plan: ChannelSyncPlan):
+        """Diff a closed plan against Dispatcharr and apply what's left."""
+        if not plan.writes_staged:
+            return
+
+        profile_members = None
+        if plan.has_profile_changes:
+            # Profiles list their channels - one request covers every membership check
+            profile_members = {
+                profile.get('id'): set(profile['channels'])
+                for profile in self.get_channel_profiles()
+                if isinstance(profile.get('channels'), list)
+            }
+
+        self._apply_sync_operations(plan, plan.take_operations(profile_members))
+
+        summary = plan.summary()
+        skipped = summary['writes_staged'] - summary['channel_updates'] - summary['profile_changes']
+        logger.info(
+            f"Channel sync{' (dry run)' if plan.dry_run else ''}: "
+            f"{summary['channel_updates']} channel updates, {summary['profile_changes']} profile changes "
+            f"from {summary['writes_staged']} writes ({max(skipped, 0)} coalesced or unchanged)"
+            + (f", {summary['errors']} failed" if summary['errors'] else "")
+        )
+
+    def _apply_sync_operations(self, plan: ChannelSyncPlan, operations: List[ChannelOperation]):
+        """Send operations concurrently and bring the cache in line with the results."""
+        if not operations:
+            return
+        plan.operations.extend(operations)
+
+        if plan.dry_run:
+            for operation in operations:
+                logger.info(f"Channel sync (dry run): {operation.describe()}")
+                if not operation.is_profile:
+                    self._restore_from_snapshot(plan, operation.channel_id)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(SYNC_WORKERS, len(operations))) as executor:
+            results = list(executor.map(self._send_sync_operation, operations))
+
+        # Cache updates stay on this thread
+        for operation, result in zip(operations, results):
+            if result.get('success'):
+                if not operation.is_profile:
+                    self._channel_written(result['channel'])
+                continue
+
+            plan.errors.append({
+                'channel_id': operation.channel_id,
+                'operation': operation.describe(),
+                'error': result.get('error')
+            })
+            logger.warning(f"Channel sync failed for {operation.describe()}: {result.get('error')}")
+            if not operation.is_profile:
+                self._restore_from_snapshot(plan, operation.channel_id)
+
+    def _channel_written(self, channel: Dict):
+        """Record a channel Dispatcharr confirmed writing (cache and every open plan's snapshot)."""
+        for plan in self._open_sync_plans():
+            plan.replace_snapshot(channel)
+        self._update_channel_in_cache(channel)
+
+    def _send_sync_operation(self, operation: ChannelOperation) -> Dict[str, Any]:
+        if operation.is_profile:
+            return self._set_profile_membership(operation.profile_id, operation.channel_id, operation.enabled)
+        return self._patch_channel(operation.channel_id, operation.changes)
+
+    def _restore_from_snapshot(self, plan: ChannelSyncPlan, channel_id: int):
+        """Put Dispatcharr's actual state of a channel back in the cache."""
+        snapshot = plan.snapshot(channel_id)
+        if snapshot is not None:
+            self._update_channel_in_cache(snapshot)
 
     # =========================================================================
     # HELPER METHODS - Consolidated patterns for pagination and error handling
@@ -1314,8 +1585,7 @@ class ChannelManager:
         """
         Fetch all items from a paginated API endpoint.
 
-        Handles both paginated dict responses (with 'results' and 'next')
-        and simple list responses.
+        Pages after the first are fetched concurrently (see iter_paginated()).
 
         Args:
             initial_endpoint: Starting endpoint with page_size (e.g., "/api/channels/channels/?page_size=1000")
@@ -1324,37 +1594,9 @@ class ChannelManager:
         Returns:
             List of all items from all pages
         """
-        from urllib.parse import urlparse
-
         all_items = []
-        next_page = initial_endpoint
-
-        while next_page:
-            response = self.auth.get(next_page)
-            if response is None or response.status_code != 200:
-                logger.error(f"Failed to get {error_context}: {response.status_code if response else 'No response'}")
-                break
-
-            data = response.json()
-
-            if isinstance(data, dict) and 'results' in data:
-                all_items.extend(data['results'])
-                next_url = data.get('next')
-                if next_url:
-                    # Handle absolute URLs by extracting path+query
-                    if next_url.startswith('http'):
-                        parsed = urlparse(next_url)
-                        next_page = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
-                    else:
-                        next_page = next_url
-                else:
-                    next_page = None
-            elif isinstance(data, list):
-                all_items.extend(data)
-                next_page = None
-            else:
-                next_page = None
-
+        for page in iter_paginated(self.auth, initial_endpoint, error_context=error_context):
+            all_items.extend(page)
         return all_items
 
     def _parse_api_error(self, response) -> str:
@@ -1402,7 +1644,7 @@ class ChannelManager:
             List of channel dicts
         """
         if use_cache:
-            return self._ensure_channels_cache()
+            return self._ensure_channels_cache().list()
         return self._paginated_get(
             f"/api/channels/channels/?page_size={page_size}",
             error_context="channels"
@@ -1422,8 +1664,7 @@ class ChannelManager:
             Channel dict or None if not found
         """
         if use_cache:
-            self._ensure_channels_cache()
-            cached = self._channels_by_id.get(channel_id)
+            cached = self._ensure_channels_cache().get(channel_id)
             if cached:
                 return cached
 
@@ -1432,6 +1673,8 @@ class ChannelManager:
         if response and response.status_code == 200:
             channel = response.json()
             if use_cache:
+                for plan in self._open_sync_plans():
+                    plan.remember([channel])
                 self._update_channel_in_cache(channel)
             return channel
         return None
@@ -1489,6 +1732,8 @@ class ChannelManager:
 
         if response.status_code in (200, 201):
             channel = response.json()
+            for plan in self._open_sync_plans():
+                plan.remember([channel])
             self._update_channel_in_cache(channel)
             return {"success": True, "channel": channel}
 
@@ -1498,6 +1743,11 @@ class ChannelManager:
         """
         Update an existing channel.
 
+        Inside a sync plan the update is staged: the cached channel reflects
+        it immediately and Dispatcharr gets it when the plan is flushed.
+        The result then has staged=True - failures are reported in the
+        flushed plan's errors.
+
         Args:
             channel_id: Dispatcharr channel ID
             data: Fields to update (name, channel_number, tvg_id, streams, etc.)
@@ -1505,9 +1755,26 @@ class ChannelManager:
         Returns:
             Result dict with success, channel (if successful), or error
         """
+        plan = self._active_sync_plan()
+        if plan is not None:
+            channel = self.get_channel(channel_id)
+            if channel is None:
+                return {"success": False, "error": "Channel not found"}
+            plan.stage_update(channel_id, data)
+            channel = {**channel, **data}
+            self._update_channel_in_cache(channel)
+            return {"success": True, "channel": channel, "staged": True}
+
+        result = self._patch_channel(channel_id, data)
+        if result.get('success'):
+            self._channel_written(result['channel'])
+        return result
+
+    def _patch_channel(self, channel_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a channel PATCH (no cache update - safe to call from worker threads)."""
         # Convert channel_number to string if present
         if 'channel_number' in data:
-            data['channel_number'] = str(data['channel_number'])
+            data = {**data, 'channel_number': str(data['channel_number'])}
 
         response = self.auth.request("PATCH", f"/api/channels/channels/{channel_id}/", data)
 
@@ -1515,9 +1782,7 @@ class ChannelManager:
             return {"success": False, "error": self._parse_api_error(response)}
 
         if response.status_code == 200:
-            channel = response.json()
-            self._update_channel_in_cache(channel)
-            return {"success": True, "channel": channel}
+            return {"success": True, "channel": response.json()}
 
         return {"success": False, "error": self._parse_api_error(response)}
 
@@ -1540,17 +1805,23 @@ class ChannelManager:
 
         if response.status_code in (200, 204):
             logger.debug(f"Delete channel {channel_id}: Success (status {response.status_code})")
-            self._invalidate_channel_in_cache(channel_id)
+            self._forget_channel(channel_id)
             return {"success": True}
 
         if response.status_code == 404:
             logger.debug(f"Delete channel {channel_id}: Not found (already deleted?)")
-            self._invalidate_channel_in_cache(channel_id)
+            self._forget_channel(channel_id)
             return {"success": False, "error": "Channel not found"}
 
         logger.warning(f"Delete channel {channel_id}: Failed (status {response.status_code})")
         return {"success": False, "error": self._parse_api_error(response)}
 
+    def _forget_channel(self, channel_id: int):
+        """Drop a deleted channel from the cache and from every open sync plan."""
+        self._invalidate_channel_in_cache(channel_id)
+        for plan in self._open_sync_plans():
+            plan.forget(channel_id)
+
     def assign_streams(self, channel_id: int, stream_ids: List[int]) -> Dict[str, Any]:
         """
         Assign streams to a channel (replaces existing streams).
@@ -1591,8 +1862,7 @@ class ChannelManager:
         Returns:
             Channel dict or None if not found
         """
-        self._ensure_channels_cache()
-        return self._channels_by_number.get(str(channel_number))
+        return self._ensure_channels_cache().find('number', str(channel_number))
 
     def find_channel_by_tvg_id(self, tvg_id: str) -> Optional[Dict]:
         """
@@ -1606,8 +1876,7 @@ class ChannelManager:
         Returns:
             Channel dict or None if not found
         """
-        self._ensure_channels_cache()
-        return self._channels_by_tvg_id.get(tvg_id)
+        return self._ensure_channels_cache().find('tvg_id', tvg_id)
 
     def set_channel_epg(self, channel_id: int, epg_data_id: int) -> Dict[str, Any]:
         """
@@ -1746,6 +2015,8 @@ class ChannelManager:
 
         if response.status_code in (200, 201):
             logo_data = response.json()
+            if self._logos is not None:
+                self._logos.upsert(logo_data)
             return {
                 "success": True,
                 "logo_id": logo_data.get('id'),
@@ -1770,16 +2041,16 @@ class ChannelManager:
 
         return {"success": False, "error": f"HTTP {response.status_code}", "status": "error"}
 
-    def _ensure_logos_cache(self) -> List[Dict]:
-        """Ensure logos cache is populated."""
-        if self._logos_cache is None:
-            self._logos_cache = self._paginated_get(
+    def _ensure_logos_cache(self) -> IndexedStore:
+        """Ensure logos cache is populated. Returns the logo store."""
+        if self._logos is None:
+            logos = self._paginated_get(
                 "/api/channels/logos/?page_size=500",
                 error_context="logos"
             )
-            self._logos_by_url = {logo.get('url'): logo for logo in self._logos_cache if logo.get('url')}
-            logger.debug(f"Cached {len(self._logos_cache)} logos")
-        return self._logos_cache
+            self._cache['logos'] = IndexedStore(logos, LOGO_INDEXES)
+            logger.debug(f"Cached {len(logos)} logos")
+        return self._logos
 
     def _find_logo_by_url(self, url: str) -> Optional[Dict]:
         """
@@ -1793,8 +2064,7 @@ class ChannelManager:
         Returns:
             Logo dict or None if not found
         """
-        self._ensure_logos_cache()
-        return self._logos_by_url.get(url)
+        return self._ensure_logos_cache().find('url', url)
 
     def get_logo(self, logo_id: int) -> Optional[Dict]:
         """
@@ -1833,6 +2103,12 @@ class ChannelManager:
         if not logo_id:
             return {"success": False, "error": "No logo_id provided", "status": "error"}
 
+        # Channels being moved off this logo must be written before the usage check
+        for plan in self._open_sync_plans():
+            leaving = plan.channels_leaving_logo(logo_id)
+            if leaving:
+                self._apply_sync_operations(plan, plan.take_operations(channel_ids=leaving))
+
         # First check if this logo is still used by any other channels
         # Query channels that have this logo_id
         try:
@@ -1860,10 +2136,14 @@ class ChannelManager:
 
         if response.status_code in (200, 204):
             logger.info(f"Deleted logo {logo_id}")
+            if self._logos is not None:
+                self._logos.remove(logo_id)
             return {"success": True, "status": "deleted"}
 
         if response.status_code == 404:
             logger.debug(f"Logo {logo_id} not found (already deleted?)")
+            if self._logos is not None:
+                self._logos.remove(logo_id)
             return {"success": True, "status": "not_found"}
 
         # Check for "in use" errors
@@ -2238,6 +2518,8 @@ class ChannelManager:
         Add a channel to a channel profile.
 
         Uses the per-channel endpoint to enable the channel in the profile.
+        Inside a sync plan the change is staged (and dropped if the channel
+        is already in the profile).
 
         Args:
             profile_id: Dispatcharr channel profile ID
@@ -2246,22 +2528,19 @@ class ChannelManager:
         Returns:
             Result dict with success or error
         """
-        response = self.auth.request(
-            "PATCH",
-            f"/api/channels/profiles/{profile_id}/channels/{channel_id}/",
-            {'enabled': True}
-        )
-
-        if response and response.status_code == 200:
+        plan = self._active_sync_plan()
+        if plan is not None:
+            plan.stage_profile(profile_id, channel_id, True)
             return {"success": True}
-
-        return {"success": False, "error": self._parse_api_error(response)}
+        return self._set_profile_membership(profile_id, channel_id, True)
 
     def remove_channel_from_profile(self, profile_id: int, channel_id: int) -> Dict[str, Any]:
         """
         Remove a channel from a channel profile.
 
         Uses the per-channel endpoint to disable the channel in the profile.
+        Inside a sync plan the change is staged (and dropped if the channel
+        isn't in the profile).
 
         Args:
             profile_id: Dispatcharr channel profile ID
@@ -2270,10 +2549,18 @@ class ChannelManager:
         Returns:
             Result dict with success or error
         """
+        plan = self._active_sync_plan()
+        if plan is not None:
+            plan.stage_profile(profile_id, channel_id, False)
+            return {"success": True}
+        return self._set_profile_membership(profile_id, channel_id, False)
+
+    def _set_profile_membership(self, profile_id: int, channel_id: int, enabled: bool) -> Dict[str, Any]:
+        """Enable/disable a channel in a profile (no cache access - safe from worker threads)."""
         response = self.auth.request(
             "PATCH",
             f"/api/channels/profiles/{profile_id}/channels/{channel_id}/",
-            {'enabled': False}
+            {'enabled': enabled}
         )
 
         if response and response.status_code == 200:
@@ -0,0 +1,208 @@
+"""
+Dispatcharr Refresh Coordinator - one status poller per Dispatcharr for M3U/EPG refreshes.
+
+M3U and EPG refreshes are async in Dispatcharr (the trigger returns 202).
+Each wait_for_refresh() used to poll its own source every 2 seconds, and
+refresh_multiple_accounts() fetched every pending account separately on
+each tick. Nothing could start until the whole batch was done, and a
+refresh that finished in half a second still cost a 2 second sleep.
+
+A RefreshCoordinator watches all pending refreshes of one kind on one
+Dispatcharr:
+- each tick is one request for the source list (/api/m3u/accounts/ or
+  /api/epg/sources/), however many refreshes are pending
+- polling backs off: the first check comes 0.5s after the trigger, and the
+  interval grows 1.5x per check up to 5s, so quick refreshes finish fast
+  and long ones don't flood Dispatcharr
+- each refresh gets a RefreshHandle that resolves as soon as its source
+  finishes. Callers wait on the handles they need instead of the batch.
+
+The poller thread runs only while refreshes are pending.
+
+Usage:
+    handles = m3u_manager.start_refreshes([1, 2, 3], timeout=120)
+    result = handles[2].wait()   # Returns as soon as account 2 is done
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Adaptive polling: first check after POLL_INITIAL, then x POLL_BACKOFF up to POLL_MAX (seconds)
+POLL_INITIAL = 0.5
+POLL_BACKOFF = 1.5
+POLL_MAX = 5.0
+
+# (source, seconds since trigger) -> final result, or None while still refreshing
+RefreshCheck = Callable[[Dict, float], Optional[Dict[str, Any]]]
+
+
+class RefreshHandle:
+    """Pending (or finished) refresh of one M3U account or EPG source."""
+
+    def __init__(self, source_id: int, result: Optional[Dict[str, Any]] = None):
+        self.source_id = source_id
+        self._result = result
+        self._event = threading.Event()
+        if result is not None:
+            self._event.set()
+
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Block until the refresh finishes.
+
+        Returns:
+            Result dict (same as wait_for_refresh), or None if timeout
+            elapsed first
+        """
+        self._event.wait(timeout)
+        return self._result
+
+    def _resolve(self, result: Dict[str, Any]):
+        if not self._event.is_set():
+            self._result = result
+            self._event.set()
+
+
+@dataclass
+class _Watch:
+    handle: RefreshHandle
+    check: RefreshCheck
+    on_timeout: Callable[[Optional[Dict]], Dict[str, Any]]   # Last seen source -> result
+    started: float
+    deadline: float
+    max_interval: float
+    interval: float = POLL_INITIAL
+    next_poll: float = 0.0
+    last_seen: Optional[Dict] = None
+
+
+class RefreshCoordinator:
+    """Polls one Dispatcharr source list for every pending refresh of one kind."""
+
+    # (Dispatcharr URL, kind) -> coordinator, shared like the manager caches
+    _coordinators: Dict[Tuple[str, str], 'RefreshCoordinator'] = {}
+    _coordinators_lock = threading.Lock()
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._fetch: Optional[Callable[[], Optional[Dict[int, Dict]]]] = None
+        self._watches: Dict[int, _Watch] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get(cls, url: str, kind: str) -> 'RefreshCoordinator':
+        """Coordinator for this Dispatcharr and kind ('m3u' or 'epg')."""
+        with cls._coordinators_lock:
+            key = (url, kind)
+            if key not in cls._coordinators:
+                cls._coordinators[key] = cls(kind)
+            return cls._coordinators[key]
+
+    def pending(self, source_id: int) -> Optional[RefreshHandle]:
+        """Handle of a refresh of this source still being watched, if any."""
+        with self._condition:
+            watch = self._watches.get(source_id)
+            return watch.handle if watch else None
+
+    def watch(
+        self,
+        source_id: int,
+        fetch: Callable[[], Optional[Dict[int, Dict]]],
+        check: RefreshCheck,
+        on_timeout: Callable[[Optional[Dict]], Dict[str, Any]],
+        timeout: float,
+        max_interval: Optional[float] = None
+    ) -> RefreshHandle:
+        """
+        Watch a triggered refresh until check() returns a result or timeout.
+
+        Args:
+            source_id: Account/source ID (one watch per source - a second
+                watch of the same source gets the pending handle)
+            fetch: Returns all sources keyed by ID, or None if the request
+                failed (the latest caller's fetch is used for every watch)
+            check: Result once the source is done, None while refreshing
+            on_timeout: Result when timeout elapses (given the last seen source)
+            timeout: Seconds to wait
+            max_interval: Longest wait between checks (default: POLL_MAX)
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._fetch = fetch
+            existing = self._watches.get(source_id)
+            if existing:
+                return existing.handle
+
+            handle = RefreshHandle(source_id)
+            max_interval = max_interval or POLL_MAX
+            interval = min(POLL_INITIAL, max_interval)
+            self._watches[source_id] = _Watch(
+                handle, check, on_timeout, now, now + timeout, max_interval,
+                interval=interval, next_poll=now + interval
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f'dispatcharr-{self.kind}-refresh', daemon=True
+                )
+                self._thread.start()
+            else:
+                self._condition.notify()
+            return handle
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._watches:
+                        self._thread = None
+                        return
+                    now = time.monotonic()
+                    wake = min(min(w.next_poll, w.deadline) for w in self._watches.values())
+                    if wake <= now:
+                        break
+                    self._condition.wait(wake - now)
+                fetch = self._fetch
+                watches = list(self._watches.values())
+
+            # Expired watches are resolved without another request
+            now = time.monotonic()
+            polled = [w for w in watches if w.deadline > now]
+            sources = None
+            if polled:
+                try:
+                    sources = fetch()
+                except Exception as e:
+                    logger.debug(f"{self.kind.upper()} refresh poll failed: {e}")
+
+            now = time.monotonic()
+            finished = []
+            for watch in watches:
+                result = None
+                source = sources.get(watch.handle.source_id) if sources else None
+                if source is not None and watch in polled:
+                    watch.last_seen = source
+                    result = watch.check(source, now - watch.started)
+                if result is None and now >= watch.deadline:
+                    result = watch.on_timeout(watch.last_seen)
+                if result is not None:
+                    finished.append((watch, result))
+                else:
+                    watch.interval = min(watch.interval * POLL_BACKOFF, watch.max_interval)
+                    watch.next_poll = now + watch.interval
+
+            with self._condition:
+                for watch, _ in finished:
+                    if self._watches.get(watch.handle.source_id) is watch:
+                        del self._watches[watch.handle.source_id]
+            # Resolve outside the lock - waiters may start the next refresh right away
+            for watch, result in finished:
+                watch.handle._resolve(result)
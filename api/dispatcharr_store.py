@@ -0,0 +1,94 @@
+"""
+Indexed Store - id-keyed cache with secondary indexes for Dispatcharr objects.
+
+ChannelManager used to keep channels as a list plus lookup dicts. Removing or
+updating one channel rebuilt the whole list, so cleaning up or resetting
+thousands of channels was quadratic.
+
+An IndexedStore keeps one dict keyed by id plus one dict per secondary key
+(e.g. tvg_id, channel number, logo URL):
+- upsert/remove are O(1) and keep every index in sync
+- list() is built on first use after a change. A list that was handed out
+  earlier is never modified, so callers can delete while iterating over it.
+- items keep insertion order. An updated item moves to the end, as it did
+  with the list cache.
+
+Usage:
+    from api.dispatcharr_store import IndexedStore
+
+    channels = IndexedStore(api_channels, {'tvg_id': lambda ch: ch.get('tvg_id')})
+    channels.upsert(updated_channel)
+    channel = channels.find('tvg_id', 'teamarr-event-12345')
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class IndexedStore:
+    """Dicts keyed by id with secondary indexes (last item with a key wins)."""
+
+    def __init__(self, items: Iterable[Dict] = (), indexes: Dict[str, Callable[[Dict], Any]] = None):
+        """
+        Args:
+            items: Initial items (each with an 'id')
+            indexes: Index name -> function returning an item's key (falsy = not indexed)
+        """
+        self._key_funcs = indexes or {}
+        self._items: Dict[Any, Dict] = {}
+        self._indexes: Dict[str, Dict[Any, Dict]] = {name: {} for name in self._key_funcs}
+        self._item_keys: Dict[Any, Dict[str, Any]] = {}   # id -> keys it was indexed under
+        self._list: Optional[List[Dict]] = None
+        self._lock = threading.RLock()
+        for item in items:
+            self.upsert(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id) -> bool:
+        return item_id in self._items
+
+    def upsert(self, item: Dict):
+        """Add or replace an item (by id)."""
+        item_id = item.get('id')
+        if not item_id:
+            return
+        with self._lock:
+            self.remove(item_id)
+            self._items[item_id] = item
+            keys = {}
+            for name, key_func in self._key_funcs.items():
+                key = key_func(item)
+                if key:
+                    self._indexes[name][key] = item
+                    keys[name] = key
+            self._item_keys[item_id] = keys
+            self._list = None
+
+    def remove(self, item_id) -> Optional[Dict]:
+        """Remove an item by id. Returns it, or None if it wasn't stored."""
+        with self._lock:
+            item = self._items.pop(item_id, None)
+            if item is None:
+                return None
+            for name, key in self._item_keys.pop(item_id, {}).items():
+                # Another item may have taken the key since
+                if self._indexes[name].get(key) is item:
+                    del self._indexes[name][key]
+            self._list = None
+            return item
+
+    def get(self, item_id) -> Optional[Dict]:
+        return self._items.get(item_id)
+
+    def find(self, index: str, key) -> Optional[Dict]:
+        """Item with this secondary key, or None."""
+        return self._indexes[index].get(key)
+
+    def list(self) -> List[Dict]:
+        """All items in insertion order (shared - don't modify)."""
+        with self._lock:
+            if self._list is None:
+                self._list = list(self._items.values())
+            return self._list
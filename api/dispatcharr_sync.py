@@ -0,0 +1,204 @@
+"""
+Dispatcharr Channel Sync Plan - diffed, coalesced channel writes.
+
+The channel lifecycle writes to Dispatcharr as it goes. In one generation a
+channel can get a PATCH from settings sync, another from group reassignment,
+stream cleanup, keyword placement and ordering. Every run re-sends every
+channel's profile memberships even when nothing changed. All of these
+requests run one at a time under the lifecycle lock.
+
+While a plan is open, ChannelManager.update_channel() and the profile
+add/remove calls are recorded instead of sent. The channel cache is updated
+right away, so later steps read the state they asked for. When the plan is
+closed, the desired state is diffed against the snapshot of Dispatcharr taken
+when each channel was first seen:
+- fields whose desired value equals Dispatcharr's are dropped
+- the remaining field changes for a channel become a single PATCH
+- profile changes that match the current membership are dropped
+The resulting operations are applied over a bounded thread pool.
+
+Creates, deletes, logo uploads and EPG binding are not deferred. They
+return IDs the caller needs, or must be ordered against other requests.
+
+With dry_run the operations are logged instead of sent, and the cache is
+restored to Dispatcharr's actual state.
+
+A plan belongs to the thread that opened it (ChannelManager.begin_sync_plan).
+Generation worker threads join it with bind_sync_plan(). Other threads,
+such as UI actions during a generation, write through their own plans.
+Updates that fail at flush are listed in errors. The lifecycle marks those
+channels drifted.
+
+Usage:
+    with channel_manager.sync_plan() as plan:
+        channel_manager.update_channel(channel_id, {'name': 'Giants @ Cowboys'})
+        channel_manager.update_channel(channel_id, {'channel_number': 5001})
+    # Flushed here: one PATCH with both fields (or none if nothing changed)
+"""
+
+import copy
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Concurrent requests when applying a plan
+SYNC_WORKERS = 8
+
+
+@dataclass
+class ChannelOperation:
+    """One Dispatcharr write left after diffing."""
+    channel_id: int
+    changes: Dict[str, Any] = field(default_factory=dict)    # PATCH fields -> desired value
+    previous: Dict[str, Any] = field(default_factory=dict)   # Same fields as Dispatcharr has them
+    profile_id: Optional[int] = None                         # Set for profile membership changes
+    enabled: bool = True                                     # Profile membership wanted
+
+    @property
+    def is_profile(self) -> bool:
+        return self.profile_id is not None
+
+    def describe(self) -> str:
+        if self.is_profile:
+            action = 'add to' if self.enabled else 'remove from'
+            return f"channel {self.channel_id}: {action} profile {self.profile_id}"
+        changes = ', '.join(f"{name} {self.previous.get(name)!r} -> {value!r}"
+                            for name, value in self.changes.items())
+        return f"channel {self.channel_id}: {changes}"
+
+
+def _same_value(field_name: str, current: Any, desired: Any) -> bool:
+    """Compare a Dispatcharr field with the desired value (numbers come back as "5001.0")."""
+    if field_name == 'channel_number' and current is not None and desired is not None:
+        try:
+            return float(current) == float(desired)
+        except (TypeError, ValueError):
+            pass
+    return current == desired
+
+
+class ChannelSyncPlan:
+    """Channel writes recorded during a plan, diffed against Dispatcharr when it's flushed."""
+
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self._snapshots: Dict[int, Dict] = {}              # channel id -> channel as Dispatcharr has it
+        self._staged: Dict[int, Dict[str, Any]] = {}       # channel id -> desired fields (last write wins)
+        self._profiles: Dict[Tuple[int, int], bool] = {}   # (profile id, channel id) -> enabled
+        self._lock = threading.Lock()
+
+        self.writes_staged = 0
+        self.operations: List[ChannelOperation] = []
+        self.errors: List[Dict[str, Any]] = []
+
+    def remember(self, channels: Iterable[Dict]):
+        """Snapshot channels as Dispatcharr has them (first sighting wins)."""
+        with self._lock:
+            for channel in channels:
+                channel_id = channel.get('id') if channel else None
+                if channel_id is not None and channel_id not in self._snapshots:
+                    self._snapshots[channel_id] = copy.deepcopy(channel)
+
+    def replace_snapshot(self, channel: Dict):
+        """Record a channel's state after a write was applied."""
+        with self._lock:
+            self._snapshots[channel['id']] = copy.deepcopy(channel)
+
+    def snapshot(self, channel_id: int) -> Optional[Dict]:
+        """Copy of a channel as Dispatcharr has it, or None if never seen."""
+        with self._lock:
+            snapshot = self._snapshots.get(channel_id)
+        return copy.deepcopy(snapshot) if snapshot is not None else None
+
+    def stage_update(self, channel_id: int, data: Dict[str, Any]):
+        """
+        Record desired channel fields.
+
+        Values are kept by reference: callers that modify a list after
+        staging it (e.g. a channel's streams) are diffed with the final list.
+        """
+        with self._lock:
+            self._staged.setdefault(channel_id, {}).update(data)
+            self.writes_staged += 1
+
+    def stage_profile(self, profile_id: int, channel_id: int, enabled: bool):
+        """Record desired profile membership."""
+        with self._lock:
+            self._profiles[(profile_id, channel_id)] = enabled
+            self.writes_staged += 1
+
+    def forget(self, channel_id: int):
+        """Drop pending writes for a deleted channel."""
+        with self._lock:
+            self._staged.pop(channel_id, None)
+            self._snapshots.pop(channel_id, None)
+            for key in [key for key in self._profiles if key[1] == channel_id]:
+                del self._profiles[key]
+
+    @property
+    def has_profile_changes(self) -> bool:
+        return bool(self._profiles)
+
+    def channels_leaving_logo(self, logo_id: int) -> List[int]:
+        """Channels with a pending logo change whose current logo is logo_id."""
+        with self._lock:
+            return [
+                channel_id for channel_id, fields in self._staged.items()
+                if 'logo_id' in fields and self._snapshots.get(channel_id, {}).get('logo_id') == logo_id
+            ]
+
+    def take_operations(
+        self,
+        profile_members: Optional[Dict[int, Set[int]]] = None,
+        channel_ids: Optional[List[int]] = None
+    ) -> List[ChannelOperation]:
+        """
+        Diff staged writes against the snapshot and remove them from the plan.
+
+        Args:
+            profile_members: Profile ID -> IDs of channels in it. Profiles not
+                listed (or None) get every recorded change.
+            channel_ids: Only take these channels' field updates (profile
+                changes stay in the plan)
+
+        Returns:
+            Operations to apply, field updates first
+        """
+        with self._lock:
+            if channel_ids is None:
+                staged, self._staged = self._staged, {}
+                profiles, self._profiles = self._profiles, {}
+            else:
+                staged = {cid: self._staged.pop(cid) for cid in channel_ids if cid in self._staged}
+                profiles = {}
+            snapshots = {cid: self._snapshots.get(cid, {}) for cid in staged}
+
+        operations = []
+        for channel_id, fields in staged.items():
+            snapshot = snapshots[channel_id]
+            changes = {
+                name: copy.deepcopy(value) for name, value in fields.items()
+                if name not in snapshot or not _same_value(name, snapshot[name], value)
+            }
+            if changes:
+                operations.append(ChannelOperation(
+                    channel_id, changes, {name: snapshot.get(name) for name in changes}
+                ))
+
+        for (profile_id, channel_id), enabled in sorted(profiles.items()):
+            members = profile_members.get(profile_id) if profile_members is not None else None
+            if members is not None and (channel_id in members) == enabled:
+                continue
+            operations.append(ChannelOperation(channel_id, profile_id=profile_id, enabled=enabled))
+
+        return operations
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts for generation stats."""
+        return {
+            'writes_staged': self.writes_staged,
+            'channel_updates': sum(1 for op in self.operations if not op.is_profile),
+            'profile_changes': sum(1 for op in self.operations if op.is_profile),
+            'errors': len(self.errors),
+            'dry_run': self.dry_run,
+        }
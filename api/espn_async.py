@@ -0,0 +1,213 @@
+"""
+ESPN Async Fetch Engine - batch fetching of many ESPN resources on one event loop.
+
+Used by ESPNClient.prefetch() / get_many_scoreboards() to warm the
+per-generation caches up front, instead of each worker thread fetching lazily
+(and sleeping through retries) one request at a time.
+
+Transport:
+- httpx.AsyncClient (HTTP/2 when the 'h2' package is installed) if httpx is
+  available
+- Otherwise the shared requests session, driven from the event loop through a
+  dedicated thread pool
+
+Concurrency is bounded globally and per host:
+- ESPN_MAX_CONCURRENCY (default 50)
+- ESPN_MAX_CONCURRENCY_PER_HOST (default 20)
+
+Responses go through the same persistent response cache as synchronous
+requests (see api/espn_cache.py), including conditional revalidation. Cache
+reads and writes are batched around the event loop rather than run on it.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import requests
+
+from api.espn_cache import CachedResponse, get_response_cache
+
+# httpx is optional - fall back to the requests session if not installed
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    httpx = None
+    HAS_HTTPX = False
+
+if TYPE_CHECKING:
+    from api.espn_client import ESPNClient
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENCY = int(os.environ.get('ESPN_MAX_CONCURRENCY', 50))
+MAX_CONCURRENCY_PER_HOST = int(os.environ.get('ESPN_MAX_CONCURRENCY_PER_HOST', 20))
+
+# Errors that trigger a retry (HTTP errors, timeouts, bad JSON)
+_RETRYABLE_ERRORS = (requests.exceptions.RequestException, ValueError)
+if HAS_HTTPX:
+    _RETRYABLE_ERRORS = _RETRYABLE_ERRORS + (httpx.HTTPError,)
+
+
+class ESPNAsyncFetcher:
+    """
+    Fetches a batch of ESPN URLs concurrently on a single event loop.
+
+    Usage:
+        fetcher = ESPNAsyncFetcher(espn_client)
+        results = fetcher.fetch_all({url: 'scoreboard_today', ...})
+        # results: {url: parsed JSON or None}
+        # fetcher.network_fetches: requests actually sent to ESPN
+    """
+
+    def __init__(
+        self,
+        client: 'ESPNClient',
+        max_concurrency: int = None,
+        max_per_host: int = None
+    ):
+        """
+        Args:
+            client: ESPNClient providing timeout/retry settings and the session
+            max_concurrency: Global in-flight request limit
+            max_per_host: In-flight request limit per host
+        """
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency or MAX_CONCURRENCY)
+        self.max_per_host = max(1, max_per_host or MAX_CONCURRENCY_PER_HOST)
+        self.network_fetches = 0
+
+    def fetch_all(self, requests_by_url: Dict[str, Optional[str]]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch all URLs concurrently and block until done.
+
+        Persistent cache lookups happen in one query before the event loop
+        starts, and 200/304 responses are written back in one transaction
+        after it finishes, so no SQLite work runs on the loop.
+        network_fetches is set to the number of URLs that needed a request
+        (fresh cache hits are not counted).
+
+        Args:
+            requests_by_url: Dict of URL -> persistent cache endpoint key
+                (None bypasses the persistent cache)
+
+        Returns:
+            Dict of URL -> parsed JSON response (None if the fetch failed)
+        """
+        self.network_fetches = 0
+        if not requests_by_url:
+            return {}
+
+        cache = get_response_cache()
+        cached = cache.get_many(url for url, endpoint in requests_by_url.items() if endpoint)
+        stored: List[tuple] = []
+        revalidated: List[tuple] = []
+
+        results = asyncio.run(self._fetch_all(requests_by_url, cached, stored, revalidated))
+        if stored or revalidated:
+            cache.store_many(stored=stored, revalidated=revalidated)
+        return results
+
+    async def _fetch_all(
+        self,
+        requests_by_url: Dict[str, Optional[str]],
+        cached: Dict[str, CachedResponse],
+        stored: List[tuple],
+        revalidated: List[tuple]
+    ) -> Dict[str, Optional[Dict]]:
+        global_sem = asyncio.Semaphore(self.max_concurrency)
+        host_sems: Dict[str, asyncio.Semaphore] = {}
+        for url in requests_by_url:
+            host = urlsplit(url).netloc
+            if host not in host_sems:
+                host_sems[host] = asyncio.Semaphore(self.max_per_host)
+
+        http = None
+        executor = None
+        if HAS_HTTPX:
+            limits = httpx.Limits(max_connections=self.max_concurrency)
+            try:
+                http = httpx.AsyncClient(http2=True, limits=limits, timeout=self.client.timeout)
+            except ImportError:
+                # http2=True requires the optional 'h2' package
+                http = httpx.AsyncClient(limits=limits, timeout=self.client.timeout)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+
+        async def bounded(url: str, endpoint: Optional[str]):
+            entry = cached.get(url) if endpoint else None
+            if entry is not None and entry.is_fresh():
+                return url, entry.data
+            async with global_sem, host_sems[urlsplit(url).netloc]:
+                self.network_fetches += 1
+                return url, await self._fetch_one(http, executor, url, endpoint, entry, stored, revalidated)
+
+        try:
+            results = await asyncio.gather(
+                *(bounded(url, endpoint) for url, endpoint in requests_by_url.items())
+            )
+        finally:
+            if http is not None:
+                await http.aclose()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+        return dict(results)
+
+    async def _get(self, http, executor, url: str, headers: Dict[str, str]):
+        """Issue one GET on whichever transport is available."""
+        if http is not None:
+            return await http.get(url, headers=headers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            lambda: self.client._session.get(url, timeout=self.client.timeout, headers=headers or None)
+        )
+
+    async def _fetch_one(
+        self,
+        http,
+        executor,
+        url: str,
+        endpoint: Optional[str],
+        cached: Optional[CachedResponse],
+        stored: List[tuple],
+        revalidated: List[tuple]
+    ) -> Optional[Dict]:
+        """
+        Fetch one URL with conditional revalidation and retry (async mirror of _make_request).
+
+        Cache writes are appended to stored/revalidated for fetch_all to
+        apply once the loop is done.
+        """
+        headers = cached.validators() if cached is not None else {}
+        retry_count = self.client.retry_count
+
+        for attempt in range(retry_count):
+            try:
+                response = await self._get(http, executor, url, headers)
+                if response.status_code == 304 and cached is not None:
+                    revalidated.append((url, endpoint, cached))
+                    return cached.data
+                response.raise_for_status()
+                data = response.json()
+                if endpoint:
+                    stored.append((
+                        url, endpoint, data,
+                        response.headers.get('ETag'), response.headers.get('Last-Modified')
+                    ))
+                return data
+            except _RETRYABLE_ERRORS as e:
+                if attempt < retry_count - 1:
+                    logger.warning(f"ESPN API request failed (attempt {attempt + 1}/{retry_count}): {e}")
+                    await asyncio.sleep(self.client.retry_delay * (attempt + 1))
+                    continue
+                logger.error(f"ESPN API request failed after {retry_count} attempts: {e}")
+                if cached is not None:
+                    logger.warning(f"Serving stale cached response for {url}")
+                    return cached.data
+                return None
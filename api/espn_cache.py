@@ -0,0 +1,453 @@
+"""
+ESPN Response Cache - Two-tier, TTL-aware cache for raw ESPN API responses.
+
+Sits underneath ESPNClient._make_request so that restarts and back-to-back
+generations don't refetch data that hasn't changed:
+
+- Tier 1: in-process LRU (OrderedDict) holding the most recently used responses
+- Tier 2: SQLite table `espn_response_cache` keyed by request URL
+
+Each entry stores the response's ETag / Last-Modified headers. When an entry
+expires we don't throw it away - the next request is sent as a conditional
+GET, and a 304 simply extends the entry's lifetime without re-downloading.
+
+The per-generation caches on ESPNClient (_schedule_cache, _scoreboard_cache,
+etc.) are still cleared at the start of every generation; this cache is
+governed purely by TTL.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQLite busy timeout in milliseconds (wait up to 30 seconds for lock)
+SQLITE_BUSY_TIMEOUT_MS = 30000
+
+# =============================================================================
+# PER-ENDPOINT TTLs (seconds). None = never expires.
+# =============================================================================
+# Team info carries the current record/standings, so it follows the standings
+# TTL rather than the longer roster TTL.
+# Non-final event summaries use a TTL of 0: they are always revalidated, but
+# the stored ETag still makes an unchanged response cheap.
+# =============================================================================
+
+ENDPOINT_TTLS = {
+    'schedule': 60 * 60,                 # 1 hour
+    'team_info': 6 * 60 * 60,            # 6 hours
+    'roster': 24 * 60 * 60,              # 24 hours
+    'group': 24 * 60 * 60,               # 24 hours
+    'standings': 6 * 60 * 60,            # 6 hours
+    'scoreboard_past': 24 * 60 * 60,     # Past dates: games are final
+    'scoreboard_today': 5 * 60,          # Live scores/status
+    'scoreboard_future': 60 * 60,        # Start times can still move
+    'summary': 0,                        # In progress / scheduled: always revalidate
+    'summary_final': None,               # Final games never change
+}
+
+# Keep expired rows this long so they can still be revalidated with a 304
+STALE_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+# URLs per query in get_many (stays under SQLite's bound-parameter limit)
+LOOKUP_BATCH_SIZE = 500
+
+# Maximum number of responses held in the in-process LRU tier
+MEMORY_MAX_ENTRIES = 4096
+
+
+def _is_final_summary(data: Dict) -> bool:
+    """Check whether an event summary response describes a completed game."""
+    try:
+        competitions = data.get('header', {}).get('competitions', [])
+        status_type = competitions[0].get('status', {}).get('type', {}) if competitions else {}
+        return bool(status_type.get('completed')) or status_type.get('state') == 'post'
+    except (AttributeError, IndexError):
+        return False
+
+
+def ttl_for(endpoint: str, data: Any) -> Optional[int]:
+    """
+    Resolve the TTL for a response.
+
+    Args:
+        endpoint: Endpoint key (see ENDPOINT_TTLS)
+        data: Parsed JSON response
+
+    Returns:
+        TTL in seconds, or None if the response never expires
+    """
+    if endpoint == 'summary' and isinstance(data, dict) and _is_final_summary(data):
+        return ENDPOINT_TTLS['summary_final']
+    return ENDPOINT_TTLS.get(endpoint, 0)
+
+
+class CachedResponse:
+    """A cached ESPN response plus its validators and expiry."""
+
+    __slots__ = ('data', 'etag', 'last_modified', 'expires_at')
+
+    def __init__(self, data: Any, etag: Optional[str], last_modified: Optional[str], expires_at: Optional[float]):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    def is_fresh(self) -> bool:
+        """True if the entry can be served without contacting ESPN."""
+        return self.expires_at is None or self.expires_at > time.time()
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ESPNResponseCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of ESPN responses keyed by URL.
+
+    All database errors are logged and swallowed - if the table is missing or
+    the database is unavailable the cache degrades to memory-only.
+
+    Usage:
+        cache = ESPNResponseCache(get_connection)
+
+        entry = cache.get(url)
+        if entry and entry.is_fresh():
+            return entry.data
+        # ... conditional GET with entry.validators() ...
+        cache.put(url, 'schedule', data, etag, last_modified)   # 200
+        cache.revalidate(url, 'schedule', entry)                # 304
+    """
+
+    def __init__(self, get_connection_func, max_entries: int = MEMORY_MAX_ENTRIES):
+        """
+        Initialize cache with database connection factory.
+
+        Args:
+            get_connection_func: Function that returns a database connection
+            max_entries: Maximum entries in the in-process LRU tier
+        """
+        self.get_connection = get_connection_func
+        self.max_entries = max_entries
+        self._memory: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0,
+            'db_hits': 0,
+            'misses': 0,
+            'revalidated': 0,
+            'stored': 0,
+        }
+
+    def _get_connection_with_timeout(self):
+        """Get a database connection with busy_timeout set for concurrent access."""
+        conn = self.get_connection()
+        conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+        return conn
+
+    def _remember(self, url: str, entry: CachedResponse):
+        """Insert/refresh an entry in the LRU tier, evicting the oldest if full."""
+        with self._lock:
+            self._memory[url] = entry
+            self._memory.move_to_end(url)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response (fresh or stale).
+
+        Callers check is_fresh() to decide between serving it directly and
+        revalidating it with a conditional request.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            CachedResponse if present in either tier, None otherwise
+        """
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+        if entry is not None:
+            self._stats['memory_hits'] += 1
+            return entry
+
+        try:
+            conn = self._get_connection_with_timeout()
+            try:
+                row = conn.execute("""
+                    SELECT response_data, etag, last_modified, expires_at
+                    FROM espn_response_cache
+                    WHERE url = ?
+                """, (url,)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"[ESPN CACHE] Lookup failed for {url}: {e}")
+            row = None
+
+        if not row:
+            self._stats['misses'] += 1
+            return None
+
+        try:
+            data = json.loads(row['response_data'])
+        except (TypeError, ValueError):
+            self._stats['misses'] += 1
+            return None
+
+        entry = CachedResponse(data, row['etag'], row['last_modified'], row['expires_at'])
+        self._remember(url, entry)
+        self._stats['db_hits'] += 1
+        return entry
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, CachedResponse]:
+        """
+        Look up many cached responses (fresh or stale) with one query.
+
+        Same semantics as get(); used by the async fetcher so lookups for a
+        whole batch happen before its event loop starts.
+
+        Args:
+            urls: Full request URLs
+
+        Returns:
+            Dict of URL -> CachedResponse for the URLs present in either tier
+        """
+        found: Dict[str, CachedResponse] = {}
+        missing = []
+        with self._lock:
+            for url in dict.fromkeys(urls):
+                entry = self._memory.get(url)
+                if entry is not None:
+                    self._memory.move_to_end(url)
+                    found[url] = entry
+                else:
+                    missing.append(url)
+        self._stats['memory_hits'] += len(found)
+
+        rows = []
+        try:
+            conn = self._get_connection_with_timeout()
+            try:
+                for i in range(0, len(missing), LOOKUP_BATCH_SIZE):
+                    chunk = missing[i:i + LOOKUP_BATCH_SIZE]
+                    rows.extend(conn.execute(f"""
+                        SELECT url, response_data, etag, last_modified, expires_at
+                        FROM espn_response_cache
+                        WHERE url IN ({','.join('?' * len(chunk))})
+                    """, chunk).fetchall())
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"[ESPN CACHE] Batch lookup failed: {e}")
+
+        for row in rows:
+            try:
+                data = json.loads(row['response_data'])
+            except (TypeError, ValueError):
+                continue
+            entry = CachedResponse(data, row['etag'], row['last_modified'], row['expires_at'])
+            self._remember(row['url'], entry)
+            found[row['url']] = entry
+            self._stats['db_hits'] += 1
+
+        self._stats['misses'] += sum(1 for url in missing if url not in found)
+        return found
+
+    def put(
+        self,
+        url: str,
+        endpoint: str,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> CachedResponse:
+        """
+        Store a fresh (200) response in both tiers.
+
+        Args:
+            url: Full request URL
+            endpoint: Endpoint key used to pick the TTL
+            data: Parsed JSON response
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+
+        Returns:
+            The stored CachedResponse
+        """
+        return self.store_many(stored=[(url, endpoint, data, etag, last_modified)])[url]
+
+    def revalidate(self, url: str, endpoint: str, entry: CachedResponse) -> CachedResponse:
+        """
+        Extend an entry's lifetime after a 304 Not Modified response.
+
+        Args:
+            url: Full request URL
+            endpoint: Endpoint key used to pick the TTL
+            entry: The stale entry that was revalidated
+
+        Returns:
+            The refreshed CachedResponse
+        """
+        return self.store_many(revalidated=[(url, endpoint, entry)])[url]
+
+    def store_many(
+        self,
+        stored: Iterable[Tuple[str, str, Any, Optional[str], Optional[str]]] = (),
+        revalidated: Iterable[Tuple[str, str, CachedResponse]] = ()
+    ) -> Dict[str, CachedResponse]:
+        """
+        Record 200 and 304 responses in both tiers, in one transaction.
+
+        Args:
+            stored: (url, endpoint, data, etag, last_modified) for 200 responses
+            revalidated: (url, endpoint, stale entry) for 304 responses
+
+        Returns:
+            Dict of URL -> stored or refreshed CachedResponse
+        """
+        now = time.time()
+        entries: Dict[str, CachedResponse] = {}
+        upserts = []
+        refreshes = []
+
+        for url, endpoint, data, etag, last_modified in stored:
+            ttl = ttl_for(endpoint, data)
+            entry = CachedResponse(data, etag, last_modified, None if ttl is None else now + ttl)
+            entries[url] = entry
+            upserts.append((url, endpoint, json.dumps(data), etag, last_modified, now, entry.expires_at))
+
+        for url, endpoint, stale in revalidated:
+            ttl = ttl_for(endpoint, stale.data)
+            entry = CachedResponse(
+                stale.data, stale.etag, stale.last_modified,
+                None if ttl is None else now + ttl
+            )
+            entries[url] = entry
+            refreshes.append((now, entry.expires_at, url))
+
+        for url, entry in entries.items():
+            self._remember(url, entry)
+        self._stats['revalidated'] += len(refreshes)
+
+        if not entries:
+            return entries
+
+        try:
+            conn = self._get_connection_with_timeout()
+            try:
+                if upserts:
+                    conn.executemany("""
+                        INSERT INTO espn_response_cache
+                            (url, endpoint, response_data, etag, last_modified, fetched_at, expires_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (url)
+                        DO UPDATE SET
+                            endpoint = excluded.endpoint,
+                            response_data = excluded.response_data,
+                            etag = excluded.etag,
+                            last_modified = excluded.last_modified,
+                            fetched_at = excluded.fetched_at,
+                            expires_at = excluded.expires_at
+                    """, upserts)
+                if refreshes:
+                    conn.executemany("""
+                        UPDATE espn_response_cache
+                        SET fetched_at = ?, expires_at = ?
+                        WHERE url = ?
+                    """, refreshes)
+                conn.commit()
+            finally:
+                conn.close()
+            self._stats['stored'] += len(upserts)
+        except sqlite3.Error as e:
+            logger.debug(f"[ESPN CACHE] Store failed for {len(entries)} responses: {e}")
+
+        return entries
+
+    def purge_expired(self) -> int:
+        """
+        Remove rows that expired more than STALE_RETENTION_SECONDS ago.
+
+        Recently expired rows are kept so they can still be revalidated.
+
+        Returns:
+            Number of rows purged
+        """
+        threshold = time.time() - STALE_RETENTION_SECONDS
+        try:
+            conn = self._get_connection_with_timeout()
+            try:
+                cursor = conn.execute("""
+                    DELETE FROM espn_response_cache
+                    WHERE expires_at IS NOT NULL AND expires_at < ?
+                """, (threshold,))
+                purged = cursor.rowcount
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"[ESPN CACHE] Purge failed: {e}")
+            return 0
+
+        if purged > 0:
+            logger.info(f"[ESPN CACHE] Purged {purged} expired responses")
+        return purged
+
+    def clear(self) -> int:
+        """
+        Clear both tiers. Use sparingly.
+
+        Returns:
+            Number of database rows cleared
+        """
+        with self._lock:
+            self._memory.clear()
+        try:
+            conn = self._get_connection_with_timeout()
+            try:
+                cursor = conn.execute("DELETE FROM espn_response_cache")
+                cleared = cursor.rowcount
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"[ESPN CACHE] Clear failed: {e}")
+            return 0
+
+        logger.info(f"[ESPN CACHE] Cleared {cleared} cached responses")
+        return cleared
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics for this process."""
+        return self._stats.copy()
+
+
+# Module-level cache shared by all ESPNClient instances
+_response_cache: Optional[ESPNResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ESPNResponseCache:
+    """Get or create the shared ESPN response cache."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                from database import get_connection
+                _response_cache = ESPNResponseCache(get_connection)
+    return _response_cache
@@ -3,11 +3,14 @@ import requests
 from requests.adapters import HTTPAdapter
 import json
 import threading
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Any
 import time
 from utils.logger import get_logger
 from epg.league_config import SoccerCompat
+from api.espn_cache import get_response_cache
+from api.espn_async import ESPNAsyncFetcher
 
 logger = get_logger(__name__)
 
@@ -37,6 +40,16 @@ def _get_espn_session() -> requests.Session:
     return _espn_session
 
 
+class RequestSpec(NamedTuple):
+    """Everything needed to fetch one cacheable ESPN resource."""
+    cache_name: str
+    cache: Dict[tuple, Any]
+    cache_lock: threading.Lock
+    cache_key: tuple
+    url: str
+    endpoint: str
+
+
 class ESPNClient:
     """Client for ESPN's public API
 
@@ -78,6 +91,13 @@ class ESPNClient:
     _group_cache: Dict[tuple, tuple] = {}
     _group_cache_lock = threading.Lock()
 
+    # In-flight fetch registry for single-flight deduplication.
+    # Key: (cache_name, cache_key), Value: Future resolved by the fetching thread.
+    # Concurrent callers for the same key wait on one fetch; different keys
+    # fetch in parallel (cache locks are never held during HTTP).
+    _inflight: Dict[tuple, Future] = {}
+    _inflight_lock = threading.Lock()
+
     # Cache for team stats (refreshes every 6 hours) - instance level is OK
     # since this is long-lived and not cleared per-generation
 
@@ -97,13 +117,43 @@ class ESPNClient:
         self._stats_cache_instance_lock = threading.Lock()
         self._cache_duration = timedelta(hours=6)
 
-    def _make_request(self, url: str) -> Optional[Dict]:
-        """Make HTTP request with retry logic and connection pooling"""
+    def _make_request(self, url: str, endpoint: Optional[str] = None) -> Optional[Dict]:
+        """
+        Make HTTP request with retry logic and connection pooling.
+
+        When an endpoint key is given, the response goes through the persistent
+        ESPN response cache (see api/espn_cache.py): fresh entries are served
+        without a request, stale entries are revalidated with a conditional GET.
+
+        Args:
+            url: Full request URL
+            endpoint: Optional endpoint key selecting the persistent cache TTL
+                (e.g., 'schedule', 'team_info'). None bypasses the cache.
+
+        Returns:
+            Parsed JSON response or None if failed
+        """
+        cache = get_response_cache() if endpoint else None
+        cached = cache.get(url) if cache else None
+        if cached is not None and cached.is_fresh():
+            return cached.data
+
+        headers = cached.validators() if cached is not None else {}
+
         for attempt in range(self.retry_count):
             try:
-                response = self._session.get(url, timeout=self.timeout)
+                response = self._session.get(url, timeout=self.timeout, headers=headers or None)
+                if response.status_code == 304 and cached is not None:
+                    return cache.revalidate(url, endpoint, cached).data
                 response.raise_for_status()
-                return response.json()
+                data = response.json()
+                if cache:
+                    cache.put(
+                        url, endpoint, data,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
+                return data
             except requests.exceptions.RequestException as e:
                 if attempt < self.retry_count - 1:
                     logger.warning(f"ESPN API request failed (attempt {attempt + 1}/{self.retry_count}): {e}")
@@ -111,14 +161,228 @@ class ESPNClient:
                     continue
                 else:
                     logger.error(f"ESPN API request failed after {self.retry_count} attempts: {e}")
+                    # Serve stale data rather than nothing if ESPN is unreachable
+                    if cached is not None:
+                        logger.warning(f"Serving stale cached response for {url}")
+                        return cached.data
                     return None
 
+    def _get_or_fetch(
+        self,
+        cache_name: str,
+        cache: Dict[tuple, Any],
+        cache_lock: threading.Lock,
+        cache_key: tuple,
+        fetch: Callable[[], Any]
+    ) -> Any:
+        """
+        Return a cached value, fetching it at most once across concurrent callers.
+
+        The first caller to miss becomes the leader and runs fetch() without
+        holding any lock. Callers arriving for the same key while the fetch is
+        in flight wait on the leader's Future instead of issuing a duplicate
+        request. Callers for different keys never block each other.
+
+        Args:
+            cache_name: Name used to namespace the in-flight registry
+            cache: Class-level cache dict to read from and populate
+            cache_lock: Lock guarding writes to the cache dict
+            cache_key: Key within the cache
+            fetch: Zero-arg callable that performs the fetch
+
+        Returns:
+            Cached or freshly fetched value (failures are cached too)
+        """
+        # Fast path: check cache without lock
+        if cache_key in cache:
+            return cache[cache_key]
+
+        inflight_key = (cache_name, cache_key)
+        with self._inflight_lock:
+            # Double-check after acquiring lock (another thread may have populated)
+            if cache_key in cache:
+                return cache[cache_key]
+            future = self._inflight.get(inflight_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[inflight_key] = future
+
+        if not is_leader:
+            logger.debug(f"Waiting on in-flight {cache_name} fetch for {cache_key}")
+            return future.result()
+
+        try:
+            result = fetch()
+        except Exception as e:
+            with self._inflight_lock:
+                self._inflight.pop(inflight_key, None)
+            future.set_exception(e)
+            raise
+
+        # Cache the result (even if None to avoid re-fetching failures)
+        with cache_lock:
+            cache[cache_key] = result
+        with self._inflight_lock:
+            self._inflight.pop(inflight_key, None)
+        future.set_result(result)
+        return result
+
+    def _request_spec(self, kind: str, *args) -> RequestSpec:
+        """
+        Build the cache/URL spec for a cacheable resource.
+
+        Single source of truth for URLs and cache keys, shared by the cached
+        getters and the batch prefetch API.
+
+        Args:
+            kind: 'scoreboard', 'schedule', 'team_info' or 'roster'
+            *args: (sport, league, date) for scoreboard,
+                   (sport, league, team) for schedule/team_info,
+                   (league_path, team_id) for roster
+
+        Returns:
+            RequestSpec for the resource
+
+        Raises:
+            ValueError: If kind is unknown
+        """
+        if kind == 'scoreboard':
+            sport, league, date = args
+            # Build URL with optional groups param for college sports
+            # This unlocks full D1 scoreboard (all games vs just featured)
+            url = f"{self.base_url}/{sport}/{league}/scoreboard?dates={date}"
+            if league in self.COLLEGE_SCOREBOARD_GROUPS:
+                url += f"&groups={self.COLLEGE_SCOREBOARD_GROUPS[league]}"
+
+            # Persistent cache TTL depends on how settled the date's games are
+            today = datetime.now().strftime('%Y%m%d')
+            if date < today:
+                endpoint = 'scoreboard_past'
+            elif date == today:
+                endpoint = 'scoreboard_today'
+            else:
+                endpoint = 'scoreboard_future'
+
+            return RequestSpec('scoreboard', self._scoreboard_cache, self._scoreboard_cache_lock,
+                               (sport, league, date), url, endpoint)
+
+        if kind == 'schedule':
+            sport, league, team_slug = args
+            return RequestSpec('schedule', self._schedule_cache, self._schedule_cache_lock,
+                               (sport, league, str(team_slug)),
+                               f"{self.base_url}/{sport}/{league}/teams/{team_slug}/schedule", 'schedule')
+
+        if kind == 'team_info':
+            sport, league, team_id = args
+            return RequestSpec('team_info', self._team_info_cache, self._team_info_cache_lock,
+                               (sport, league, str(team_id)),
+                               f"{self.base_url}/{sport}/{league}/teams/{team_id}", 'team_info')
+
+        if kind == 'roster':
+            league, team_id = args
+            return RequestSpec('roster', self._roster_cache, self._roster_cache_lock,
+                               (league, str(team_id)),
+                               f"{self.base_url}/{league}/teams/{team_id}/roster", 'roster')
+
+        raise ValueError(f"Unknown ESPN resource kind: {kind}")
+
+    def _fetch_spec(self, spec: RequestSpec) -> Optional[Dict]:
+        """Fetch a resource through its per-generation cache (single-flight)."""
+        return self._get_or_fetch(
+            spec.cache_name, spec.cache, spec.cache_lock, spec.cache_key,
+            lambda: self._make_request(spec.url, endpoint=spec.endpoint)
+        )
+
+    def prefetch(self, keys: Iterable[tuple]) -> int:
+        """
+        Warm the per-generation caches for many resources at once.
+
+        All requests are driven concurrently on one event loop by
+        ESPNAsyncFetcher (bounded by ESPN_MAX_CONCURRENCY and
+        ESPN_MAX_CONCURRENCY_PER_HOST). Keys already cached or in flight are
+        skipped; getters called while a prefetch is running wait on it
+        instead of issuing duplicate requests.
+
+        Args:
+            keys: Tuples of (kind, *args) as accepted by _request_spec, e.g.
+                  ('scoreboard', 'hockey', 'nhl', '20250115'),
+                  ('schedule', 'basketball', 'nba', '8'),
+                  ('team_info', 'football', 'nfl', '22'),
+                  ('roster', 'football/nfl', '22')
+
+        Returns:
+            Number of requests sent to ESPN (resources served fresh from the
+            persistent response cache are not counted)
+        """
+        claimed: List[tuple] = []
+        seen = set()
+        with self._inflight_lock:
+            for key in keys:
+                try:
+                    spec = self._request_spec(*key)
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Skipping invalid prefetch key {key}: {e}")
+                    continue
+                inflight_key = (spec.cache_name, spec.cache_key)
+                if inflight_key in seen or spec.cache_key in spec.cache or inflight_key in self._inflight:
+                    continue
+                seen.add(inflight_key)
+                future = Future()
+                self._inflight[inflight_key] = future
+                claimed.append((spec, inflight_key, future))
+
+        if not claimed:
+            return 0
+
+        fetcher = ESPNAsyncFetcher(self)
+        try:
+            results = fetcher.fetch_all(
+                {spec.url: spec.endpoint for spec, _, _ in claimed}
+            )
+        except Exception as e:
+            logger.error(f"ESPN prefetch failed: {e}")
+            with self._inflight_lock:
+                for _, inflight_key, _ in claimed:
+                    self._inflight.pop(inflight_key, None)
+            for _, _, future in claimed:
+                future.set_exception(e)
+            raise
+
+        for spec, inflight_key, future in claimed:
+            result = results.get(spec.url)
+            with spec.cache_lock:
+                spec.cache[spec.cache_key] = result
+            with self._inflight_lock:
+                self._inflight.pop(inflight_key, None)
+            future.set_result(result)
+
+        logger.debug(
+            f"ESPN prefetch warmed {len(claimed)} resources "
+            f"({fetcher.network_fetches} fetched from ESPN)"
+        )
+        return fetcher.network_fetches
+
+    def get_many_scoreboards(self, keys: Iterable[tuple]) -> Dict[tuple, Optional[Dict]]:
+        """
+        Fetch many scoreboards concurrently.
+
+        Args:
+            keys: (sport, league, date) tuples, date in YYYYMMDD format
+
+        Returns:
+            Dict mapping each (sport, league, date) to its scoreboard (or None)
+        """
+        keys = list(keys)
+        self.prefetch(('scoreboard',) + tuple(key) for key in keys)
+        return {tuple(key): self.get_scoreboard(*key) for key in keys}
+
     def _get_group_name(self, sport: str, league: str, group_id: str) -> tuple:
         """
         Fetch group (conference or division) name and abbreviation from ESPN core API.
 
         Results are cached per-generation to avoid redundant API calls.
-        Thread-safe via double-checked locking.
+        Thread-safe via per-key single-flight fetching.
 
         Args:
             sport: Sport type (e.g., 'basketball', 'football')
@@ -130,36 +394,21 @@ class ESPNClient:
         """
         cache_key = (sport, league, str(group_id))
 
-        # Fast path: check cache without lock
-        if cache_key in self._group_cache:
-            logger.debug(f"Group cache hit for {sport}/{league}/group/{group_id}")
-            return self._group_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._group_cache_lock:
-            # Double-check after acquiring lock
-            if cache_key in self._group_cache:
-                logger.debug(f"Group cache hit (after lock) for {sport}/{league}/group/{group_id}")
-                return self._group_cache[cache_key]
-
+        def fetch() -> tuple:
             try:
                 url = f"http://sports.core.api.espn.com/v2/sports/{sport}/leagues/{league}/groups/{group_id}"
-                group_data = self._make_request(url)
+                group_data = self._make_request(url, endpoint='group')
 
                 if group_data:
                     # Get both full name and abbreviation
                     name = group_data.get('shortName') or group_data.get('name', '')
                     abbrev = group_data.get('abbreviation', '')
-                    result = (name, abbrev)
-                else:
-                    result = ('', '')
+                    return (name, abbrev)
             except Exception as e:
                 logger.error(f"Error fetching group name for ID {group_id}: {e}")
-                result = ('', '')
+            return ('', '')
 
-            # Cache the result (even failures to avoid re-fetching)
-            self._group_cache[cache_key] = result
-            return result
+        return self._get_or_fetch('group', self._group_cache, self._group_cache_lock, cache_key, fetch)
 
     def _extract_record(self, record_list: List) -> Dict:
         """Extract win-loss record from competitor record array"""
@@ -205,7 +454,7 @@ class ESPNClient:
 
         Schedule data is cached per-generation to avoid redundant API calls
         when the same team is referenced multiple times (e.g., opponent lookups).
-        Thread-safe via double-checked locking.
+        Thread-safe via per-key single-flight fetching.
 
         Args:
             sport: Sport type (e.g., 'basketball', 'football', 'soccer')
@@ -216,27 +465,7 @@ class ESPNClient:
         Returns:
             Dict with team schedule data or None if failed
         """
-        cache_key = (sport, league, str(team_slug))
-
-        # Fast path: check cache without lock
-        if cache_key in self._schedule_cache:
-            logger.debug(f"Schedule cache hit for {sport}/{league}/{team_slug}")
-            return self._schedule_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._schedule_cache_lock:
-            # Double-check after acquiring lock (another thread may have populated)
-            if cache_key in self._schedule_cache:
-                logger.debug(f"Schedule cache hit (after lock) for {sport}/{league}/{team_slug}")
-                return self._schedule_cache[cache_key]
-
-            # Fetch from API
-            url = f"{self.base_url}/{sport}/{league}/teams/{team_slug}/schedule"
-            result = self._make_request(url)
-
-            # Cache the result (even if None to avoid re-fetching failures)
-            self._schedule_cache[cache_key] = result
-            return result
+        return self._fetch_spec(self._request_spec('schedule', sport, league, team_slug))
 
     def clear_schedule_cache(self):
         """Clear the schedule cache. Call this at the start of each EPG generation."""
@@ -268,6 +497,15 @@ class ESPNClient:
             ESPNClient._scoreboard_cache.clear()
         logger.debug("Scoreboard cache cleared")
 
+    def purge_response_cache(self) -> int:
+        """
+        Purge long-expired entries from the persistent ESPN response cache.
+
+        Unlike the clear_*_cache methods, this does not drop fresh entries -
+        the persistent cache is governed by per-endpoint TTLs.
+        """
+        return get_response_cache().purge_expired()
+
     def get_team_info(self, sport: str, league: str, team_id: str) -> Optional[Dict]:
         """
         Fetch team information (name, logo, colors, etc.) with caching.
@@ -275,7 +513,7 @@ class ESPNClient:
         Team info is cached per-generation to avoid redundant API calls
         when the same team is referenced multiple times (e.g., opponent lookups,
         stats fetches that call get_team_info internally).
-        Thread-safe via double-checked locking.
+        Thread-safe via per-key single-flight fetching.
 
         Args:
             sport: Sport type
@@ -285,27 +523,7 @@ class ESPNClient:
         Returns:
             Dict with team info or None if failed
         """
-        cache_key = (sport, league, str(team_id))
-
-        # Fast path: check cache without lock
-        if cache_key in self._team_info_cache:
-            logger.debug(f"Team info cache hit for {sport}/{league}/{team_id}")
-            return self._team_info_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._team_info_cache_lock:
-            # Double-check after acquiring lock (another thread may have populated)
-            if cache_key in self._team_info_cache:
-                logger.debug(f"Team info cache hit (after lock) for {sport}/{league}/{team_id}")
-                return self._team_info_cache[cache_key]
-
-            # Fetch from API
-            url = f"{self.base_url}/{sport}/{league}/teams/{team_id}"
-            result = self._make_request(url)
-
-            # Cache the result (even if None to avoid re-fetching failures)
-            self._team_info_cache[cache_key] = result
-            return result
+        return self._fetch_spec(self._request_spec('team_info', sport, league, team_id))
 
     def get_team_roster(self, league: str, team_id: str) -> Optional[Dict]:
         """
@@ -313,7 +531,7 @@ class ESPNClient:
 
         Roster data is cached per-generation to avoid redundant API calls
         when the same team's roster is needed multiple times (e.g., coach lookups).
-        Thread-safe via double-checked locking.
+        Thread-safe via per-key single-flight fetching.
 
         Args:
             league: League path (e.g., 'football/nfl', 'basketball/nba')
@@ -322,27 +540,7 @@ class ESPNClient:
         Returns:
             Dict with roster data or None if failed
         """
-        cache_key = (league, str(team_id))
-
-        # Fast path: check cache without lock
-        if cache_key in self._roster_cache:
-            logger.debug(f"Roster cache hit for {league}/{team_id}")
-            return self._roster_cache[cache_key]
-
-        # Slow path: acquire lock for cache miss
-        with self._roster_cache_lock:
-            # Double-check after acquiring lock
-            if cache_key in self._roster_cache:
-                logger.debug(f"Roster cache hit (after lock) for {league}/{team_id}")
-                return self._roster_cache[cache_key]
-
-            # Fetch from API
-            url = f"{self.base_url}/{league}/teams/{team_id}/roster"
-            result = self._make_request(url)
-
-            # Cache the result (even if None to avoid re-fetching failures)
-            self._roster_cache[cache_key] = result
-            return result
+        return self._fetch_spec(self._request_spec('roster', league, team_id))
 
     def get_team_record(self, sport: str, league: str, team_id: str) -> Optional[Dict]:
         """
@@ -607,7 +805,7 @@ class ESPNClient:
 
         Scoreboard data is cached per-generation to avoid redundant API calls
         during multi-sport disambiguation (same league/date checked many times).
-        Thread-safe via double-checked locking.
+        Thread-safe via per-key single-flight fetching.
 
         Args:
             sport: Sport type
@@ -620,31 +818,11 @@ class ESPNClient:
         if date is None:
             date = datetime.now().strftime('%Y%m%d')
 
-        cache_key = (sport, league, date)
-
-        # Fast path: check cache without lock
-        if cache_key in self._scoreboard_cache:
-            logger.debug(f"Scoreboard cache hit for {sport}/{league}/{date}")
-            return self._scoreboard_cache[cache_key]
+        return self._fetch_spec(self._request_spec('scoreboard', sport, league, date))
 
-        # Slow path: acquire lock for cache miss
-        with self._scoreboard_cache_lock:
-            # Double-check after acquiring lock
-            if cache_key in self._scoreboard_cache:
-                logger.debug(f"Scoreboard cache hit (after lock) for {sport}/{league}/{date}")
-                return self._scoreboard_cache[cache_key]
-
-            # Build URL with optional groups param for college sports
-            # This unlocks full D1 scoreboard (all games vs just featured)
-            url = f"{self.base_url}/{sport}/{league}/scoreboard?dates={date}"
-            if league in self.COLLEGE_SCOREBOARD_GROUPS:
-                url += f"&groups={self.COLLEGE_SCOREBOARD_GROUPS[league]}"
-
-            result = self._make_request(url)
-
-            # Cache the result (even if None to avoid re-fetching failures)
-            self._scoreboard_cache[cache_key] = result
-            return result
+    def is_scoreboard_cached(self, sport: str, league: str, date: str) -> bool:
+        """Check whether a scoreboard is already in the per-generation cache."""
+        return (sport, league, date) in self._scoreboard_cache
 
     def get_event_summary(self, sport: str, league: str, event_id: str) -> Optional[Dict]:
         """
@@ -662,7 +840,7 @@ class ESPNClient:
             Dict with event data (same structure as scoreboard events)
         """
         url = f"{self.base_url}/{sport}/{league}/summary?event={event_id}"
-        data = self._make_request(url)
+        data = self._make_request(url, endpoint='summary')
 
         if not data:
             return None
@@ -854,7 +1032,7 @@ class ESPNClient:
             Dict with standings data
         """
         url = f"{self.base_url}/{sport}/{league}/standings"
-        return self._make_request(url)
+        return self._make_request(url, endpoint='standings')
 
     def extract_team_from_url(self, url: str) -> Optional[Dict]:
         """
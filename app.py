@@ -199,6 +199,31 @@ scheduler_thread = None
 scheduler_running = False
 last_run_time = None
 
+# Scheduler election - only the process holding the 'scheduler' lease runs
+# scheduled generation, so several processes can share one database
+SCHEDULER_LEASE = 'scheduler'
+SCHEDULER_LEASE_TTL = 90  # Seconds without a heartbeat before another process takes over
+SCHEDULER_HEARTBEAT_INTERVAL = 30
+scheduler_owner = None
+scheduler_is_leader = threading.Event()
+
+# One EPG generation at a time across all processes sharing the database
+GENERATION_LEASE = 'generation'
+# Scheduled and queued generations take turns in the scheduler process
+generation_lock = threading.Lock()
+
+# Production mode: manual/API generations are queued in the database and run by
+# the scheduler process (see run_generation_request); web workers stream progress
+GENERATION_REQUEST_POLL_INTERVAL = 1    # Scheduler: seconds between queue checks
+GENERATION_PROGRESS_POLL_INTERVAL = 0.5  # Web: seconds between progress reads
+GENERATION_PROGRESS_WRITE_INTERVAL = 0.5  # Scheduler: min seconds between 'progress' writes
+SCHEDULER_WATCHDOG_INTERVAL = 10  # gunicorn master: seconds between scheduler process checks
+
+
+def generation_runs_in_scheduler() -> bool:
+    """True when manual/API generation is queued for the scheduler process (production mode)"""
+    return os.environ.get('TEAMARR_GENERATION_PROCESS') == 'scheduler'
+
 # =============================================================================
 # CONTEXT PROCESSORS
 # =============================================================================
@@ -224,7 +249,8 @@ def inject_globals():
 # CORE EPG GENERATION FUNCTIONS
 # =============================================================================
 
-def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_start_datetime=None, progress_callback=None, generation=None):
+def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_start_datetime=None, progress_callback=None, generation=None, matchup_memo=None,
+                             wait_for_turn=None, stream_executor=None, m3u_refresh=None):
     """
     Core function to refresh a single event EPG group.
 
@@ -238,24 +264,30 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         epg_start_datetime: Optional datetime for EPG start (for multi-day filler)
         progress_callback: Optional callable(processed, total, group_name) for stream progress
         generation: EPG generation counter for fingerprint cache (None = no caching)
+        matchup_memo: Generation-scoped MatchupMemo shared across multi-sport groups (None = no memo)
+        wait_for_turn: Optional callable that blocks until earlier groups are done - called
+                       before anything touching shared channel state (see epg.group_scheduler)
+        stream_executor: Optional shared executor for stream matching (None = own pool)
+        m3u_refresh: Optional RefreshHandle of a batch refresh of the group's account -
+                     waited on before fetching streams (with skip_m3u_refresh)
 
     Returns:
         dict with keys: success, stream_count, matched_count, matched_streams,
                        epg_result, channel_results, error
     """
-    from epg.team_matcher import create_matcher
-    from epg.event_matcher import create_event_matcher
     from epg.event_epg_generator import generate_event_epg
+    from epg.event_template_engine import EventTemplateEngine
     from epg.epg_consolidator import get_data_dir, after_event_epg_generation
     from database import get_template, update_event_epg_group_stats, save_failed_matches_batch, save_matched_streams_batch
     from utils.stream_filter import filter_game_streams
-    from epg.stream_match_cache import StreamMatchCache, refresh_cached_event
+    from epg.stream_match_cache import StreamMatchCache, refresh_cached_event, fetch_fresh_events
 
     group_id = group['id']
     group_name = group.get('group_name', f'Group {group_id}')
 
     # Initialize fingerprint cache if generation provided
-    stream_cache = StreamMatchCache(get_connection) if generation is not None else None
+    # Writes are buffered and flushed once after matching (one transaction per group)
+    stream_cache = StreamMatchCache(get_connection, buffer_writes=True) if generation is not None else None
     cache_stats = {'hits': 0, 'misses': 0, 'stored': 0}
 
     # Collect matches for debugging
@@ -281,6 +313,15 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
                     'error': f"M3U refresh failed: {refresh_result.get('message')}",
                     'step': 'refresh'
                 }
+        elif m3u_refresh is not None:
+            # Batch refresh of this group's account - other accounts may still be refreshing
+            refresh_result = m3u_refresh.wait()
+            if refresh_result.get('success'):
+                app.logger.debug(f"M3U account {group['dispatcharr_account_id']} ready for group {group_id}")
+            else:
+                app.logger.warning(
+                    f"M3U refresh failed for group {group_id}, using current streams: {refresh_result.get('message')}"
+                )
         else:
             app.logger.debug(f"Skipping M3U refresh for group {group_id} (already refreshed in batch)")
 
@@ -329,6 +370,7 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
 
         # Step 3: Match streams to ESPN events (PARALLEL for speed)
         from concurrent.futures import ThreadPoolExecutor
+        from contextlib import nullcontext
 
         # Check if any individual custom regex fields are enabled
         teams_enabled = bool(group.get('custom_regex_teams_enabled'))
@@ -366,6 +408,38 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
                 app.logger.warning(f"Multi-sport mode enabled but no leagues configured")
                 is_multi_sport = False  # Fall back to single-league mode
 
+        # Matchers are shared by all match threads (and, during generation, all
+        # groups) - their caches are lock-guarded, see epg.matcher_pool
+        from epg.matcher_pool import MatcherPool
+        shared_team_matcher, shared_event_matcher = MatcherPool.get(generation, lookahead_days)
+
+        if is_multi_sport:
+            from epg.league_detector import LeagueDetector
+            from epg.multi_sport_matcher import MultiSportMatcher, MatcherConfig
+
+            # Configure the matcher once per group
+            multi_sport_matcher = MultiSportMatcher(
+                team_matcher=shared_team_matcher,
+                event_matcher=shared_event_matcher,
+                league_detector=LeagueDetector(
+                    espn_client=shared_event_matcher.espn,
+                    enabled_leagues=enabled_leagues,
+                    lookahead_days=lookahead_days
+                ),
+                config=MatcherConfig(
+                    enabled_leagues=enabled_leagues,
+                    soccer_enabled=soccer_enabled,
+                    custom_regex_teams=group.get('custom_regex_teams'),
+                    custom_regex_teams_enabled=teams_enabled,
+                    custom_regex_date=group.get('custom_regex_date'),
+                    custom_regex_date_enabled=date_enabled,
+                    custom_regex_time=group.get('custom_regex_time'),
+                    custom_regex_time_enabled=time_enabled,
+                    include_final_events=include_final_events
+                ),
+                memo=matchup_memo
+            )
+
         def match_single_stream_single_league(stream):
             """Match a single stream to ESPN event in assigned league - called in parallel.
 
@@ -373,10 +447,6 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
             """
             from epg.stream_matcher import match_stream_single_league, MatchConfig
 
-            # Create matchers per-thread for thread safety
-            thread_team_matcher = create_matcher()
-            thread_event_matcher = create_event_matcher(lookahead_days=lookahead_days)
-
             # Build config from group settings
             config = MatchConfig(
                 league=group['assigned_league'],
@@ -392,7 +462,7 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
 
             # Use shared matching function
             result = match_stream_single_league(
-                stream, config, thread_team_matcher, thread_event_matcher,
+                stream, config, shared_team_matcher, shared_event_matcher,
                 stream_cache=stream_cache,
                 internal_group_id=group_id,
                 current_generation=generation
@@ -433,41 +503,10 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
               Tier 3a-c: Cache lookup + schedule disambiguation
               Tier 4a-b: Single-team schedule fallback (NAIA vs NCAA)
             """
-            from epg.league_detector import LeagueDetector
-            from epg.multi_sport_matcher import MultiSportMatcher, MatcherConfig
             from database import find_any_channel_for_event
 
-            # Create per-thread instances
-            thread_team_matcher = create_matcher()
-            thread_event_matcher = create_event_matcher(lookahead_days=lookahead_days)
-            thread_league_detector = LeagueDetector(
-                espn_client=thread_event_matcher.espn,
-                enabled_leagues=enabled_leagues,
-                lookahead_days=lookahead_days
-            )
-
-            # Configure the matcher
-            config = MatcherConfig(
-                enabled_leagues=enabled_leagues,
-                soccer_enabled=soccer_enabled,
-                custom_regex_teams=group.get('custom_regex_teams'),
-                custom_regex_teams_enabled=teams_enabled,
-                custom_regex_date=group.get('custom_regex_date'),
-                custom_regex_date_enabled=date_enabled,
-                custom_regex_time=group.get('custom_regex_time'),
-                custom_regex_time_enabled=time_enabled,
-                include_final_events=include_final_events
-            )
-
-            matcher = MultiSportMatcher(
-                team_matcher=thread_team_matcher,
-                event_matcher=thread_event_matcher,
-                league_detector=thread_league_detector,
-                config=config
-            )
-
             # Run the consolidated matching logic
-            result = matcher.match_stream(stream)
+            result = multi_sport_matcher.match_stream(stream)
 
             # Handle the result
             if result.error:
@@ -579,9 +618,11 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         # Select the matching function based on mode
         match_single_stream_base = match_single_stream_multi_sport if is_multi_sport else match_single_stream_single_league
 
-        # Create ESPN client for cache refreshes (shared across threads via get_event_summary)
-        from api.espn_client import ESPNClient
-        espn_for_cache = ESPNClient()
+        # ESPN client for cache refreshes (shared across threads via get_event_summary)
+        espn_for_cache = shared_event_matcher.espn
+
+        # Fresh dynamic data for all cache hits, fetched in bulk before matching
+        fresh_events = {}
 
         def match_with_cache(stream):
             """
@@ -607,7 +648,8 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
                         espn_for_cache,
                         cached_data,
                         league,
-                        get_connection
+                        get_connection,
+                        fresh_events=fresh_events
                     )
 
                     if refreshed:
@@ -708,7 +750,21 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
             total_streams = len(streams)
             processed_count = 0
 
-            with ThreadPoolExecutor(max_workers=min(total_streams, 100)) as executor:
+            # Load all cached matches in one query so worker threads don't hit the DB,
+            # then refresh their dynamic fields from scoreboards (one summary per
+            # event only for events missing from the scoreboards)
+            if stream_cache:
+                cache_hits = stream_cache.get_many(group_id, streams)
+                if cache_hits:
+                    fresh_events.update(fetch_fresh_events(
+                        espn_for_cache,
+                        [(league, cached_data) for _, league, cached_data in cache_hits.values()],
+                        get_connection
+                    ))
+
+            # Concurrent groups share one pool so they don't each spin up 100 threads
+            executor_context = nullcontext(stream_executor) if stream_executor else ThreadPoolExecutor(max_workers=min(total_streams, 100))
+            with executor_context as executor:
                 futures = {executor.submit(match_with_cache, s): s for s in streams}
                 for future in as_completed(futures):
                     result = future.result()
@@ -727,6 +783,10 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
                             stream_status=status_icon
                         )
 
+            # Write buffered cache sets/touches in a single transaction
+            if stream_cache:
+                stream_cache.flush()
+
         # Process results
         for result in results:
             if result['type'] == 'matched':
@@ -831,13 +891,18 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
             except Exception as e:
                 app.logger.warning(f"Could not save matched streams: {e}")
 
+        # Everything from here on touches shared state (channel numbers, channels,
+        # the merged EPG) - wait until earlier groups are done with it
+        if wait_for_turn:
+            wait_for_turn()
+
         # Step 3.5: Include existing managed channels that weren't matched
         # This ensures EPG continues for channels until they're actually deleted
         # (e.g., game went final but channel hasn't been deleted yet)
         from database import get_managed_channels_for_group
 
-        # Create event_matcher for fetching events by ID (outside thread pool)
-        event_matcher = create_event_matcher(lookahead_days=lookahead_days)
+        # Reuse the shared event_matcher for fetching events by ID
+        event_matcher = shared_event_matcher
 
         existing_channels = get_managed_channels_for_group(group_id)
         matched_event_ids = {m['event'].get('id') for m in matched_streams}
@@ -942,6 +1007,8 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
         # Step 4: Generate XMLTV (or add streams to parent for child groups)
         epg_result = None
         channel_results = None
+        # One engine for this group's EPG and channel names - variables are built once per event
+        event_template_engine = EventTemplateEngine()
 
         if matched_streams:
             # Sort matched streams by event start time (earliest first)
@@ -970,7 +1037,8 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
                     data_dir=get_data_dir(output_path),
                     settings=settings,
                     template=event_template,
-                    epg_start_datetime=epg_start_datetime
+                    epg_start_datetime=epg_start_datetime,
+                    template_engine=event_template_engine
                 )
 
                 if not epg_result.get('success'):
@@ -1061,7 +1129,8 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
                     channel_results = lifecycle_mgr.process_matched_streams(
                         matched_streams=sorted_matched,
                         group=group,
-                        template=event_template
+                        template=event_template,
+                        template_engine=event_template_engine
                     )
 
                     if channel_results['created']:
@@ -1127,6 +1196,47 @@ def refresh_event_group_core(group, m3u_manager, skip_m3u_refresh=False, epg_sta
 
 
 def generate_all_epg(progress_callback=None, settings=None, save_history=True, team_progress_callback=None, triggered_by='manual'):
+    """
+    Run _generate_all_epg() while holding the cross-process generation lease.
+
+    A generation already running in this or any other process sharing the
+    database makes this return an error result instead of overlapping it.
+    Arguments and result are those of _generate_all_epg().
+    """
+    import socket
+    import uuid
+    from database import acquire_process_lease, release_process_lease
+
+    owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    if not acquire_process_lease(GENERATION_LEASE, owner, SCHEDULER_LEASE_TTL):
+        message = 'EPG generation already in progress'
+        app.logger.warning(f"⚠️ {message} - {triggered_by} generation not started")
+        if progress_callback:
+            progress_callback('error', message, None)
+        return {'success': False, 'error': message}
+
+    # Renew the lease for as long as the generation runs
+    finished = threading.Event()
+
+    def renew_lease():
+        while not finished.wait(SCHEDULER_HEARTBEAT_INTERVAL):
+            try:
+                acquire_process_lease(GENERATION_LEASE, owner, SCHEDULER_LEASE_TTL)
+            except Exception as e:
+                app.logger.warning(f"Generation lease heartbeat failed: {e}")
+
+    threading.Thread(target=renew_lease, daemon=True, name='generation-lease').start()
+    try:
+        return _generate_all_epg(progress_callback, settings, save_history, team_progress_callback, triggered_by)
+    finally:
+        finished.set()
+        try:
+            release_process_lease(GENERATION_LEASE, owner)
+        except Exception:
+            pass
+
+
+def _generate_all_epg(progress_callback=None, settings=None, save_history=True, team_progress_callback=None, triggered_by='manual'):
     """
     AUTHORITATIVE EPG generation function - single source of truth for ALL EPG generation.
 
@@ -1203,11 +1313,17 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
         'filtered_final': 0,
         'filtered_league_not_enabled': 0,
         'filtered_unsupported_sport': 0,
-        'eligible_streams': 0
+        'eligible_streams': 0,
+        # Multi-sport matchup memo (shared across groups for this generation)
+        'matchup_memo_lookups': 0,
+        'matchup_memo_hits': 0
     }
     lifecycle_stats = {
         'channels_deleted': 0
     }
+    # ChannelManager holding this generation's Dispatcharr sync plan (flushed after phase 3)
+    channel_sync_api = None
+    channel_sync_plan = None
 
     try:
         # Get settings if not provided
@@ -1238,13 +1354,50 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
         epg_orchestrator.espn.clear_roster_cache()
         epg_orchestrator.espn.clear_group_cache()
         epg_orchestrator.espn.clear_scoreboard_cache()
+        epg_orchestrator.espn.purge_response_cache()
         epg_orchestrator.api_calls = 0
 
+        # League configs / team IDs resolved during multi-sport schedule searches
+        from epg.league_detector import LeagueDetector
+        LeagueDetector.clear_resolution_cache()
+
+        # Team name indexes - the caches may have been refreshed from a web
+        # worker since this process built them
+        from epg.team_league_cache import TeamLeagueCache
+        from epg.soccer_multi_league import SoccerMultiLeague
+        TeamLeagueCache.invalidate_stale_index()
+        SoccerMultiLeague.invalidate_stale_name_index()
+
         # Clear Dispatcharr caches for fresh channel/logo lookups
         # (caches are still used within this generation cycle for performance)
         lifecycle_mgr = get_lifecycle_manager()
         if lifecycle_mgr:
             lifecycle_mgr.clear_cache()
+            # Channel updates from all groups and lifecycle steps are diffed and sent
+            # as one batch after phase 3 (TEAMARR_CHANNEL_SYNC_DRY_RUN=1 only logs them)
+            channel_sync_api = lifecycle_mgr.channel_api
+            channel_sync_plan = channel_sync_api.begin_sync_plan(
+                dry_run=os.environ.get('TEAMARR_CHANNEL_SYNC_DRY_RUN', '').lower() in ('1', 'true', 'yes')
+            )
+
+        # Prefetch every scoreboard this generation will read in one concurrent burst.
+        # Team EPG, event matching and enrichment all read from this shared snapshot.
+        try:
+            from epg.scoreboard_plan import plan_generation_scoreboards, prefetch_generation_scoreboards
+            from database import get_all_teams
+            scoreboard_plan = plan_generation_scoreboards(
+                get_connection,
+                # Flat team rows - the league must be the team's own (as EPGOrchestrator resolves it)
+                teams=[t for t in get_all_teams() if t.get('active') and t.get('template_id')],
+                groups=get_all_event_epg_groups(enabled_only=True),
+                days_ahead=days_ahead,
+                lookahead_days=settings.get('event_lookahead_days', 7),
+                epg_timezone=epg_timezone
+            )
+            prefetch_generation_scoreboards(epg_orchestrator.espn, scoreboard_plan)
+        except Exception as e:
+            # Not fatal - consumers fall back to fetching on first use
+            app.logger.warning(f"Scoreboard prefetch failed: {e}")
 
         # ============================================
         # PHASE 1: Team-based EPG
@@ -1329,69 +1482,57 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
             if m3u_manager:
                 total_groups = len(event_groups_with_templates)
 
-                # Step 2a: Batch refresh all unique M3U accounts in parallel
+                # Step 2a: Start refreshing all unique M3U accounts in parallel
+                # Each group waits only for its own account (see process_group)
                 unique_account_ids = list(set(
                     g['dispatcharr_account_id']
                     for g in event_groups_with_templates
                     if g.get('dispatcharr_account_id')
                 ))
+                refresh_handles = {}
 
                 if unique_account_ids:
                     account_count = len(unique_account_ids)
                     report_progress('progress', f'Refreshing {account_count} M3U provider(s)...', 52)
                     app.logger.info(f"🔄 Batch refreshing {account_count} unique M3U account(s) for {total_groups} event group(s)")
 
-                    batch_refresh_result = m3u_manager.refresh_multiple_accounts(
+                    refresh_handles = m3u_manager.start_refreshes(
                         unique_account_ids,
                         timeout=120
                     )
 
-                    if batch_refresh_result.get('success'):
-                        skipped = batch_refresh_result.get('skipped_count', 0)
-                        refreshed = batch_refresh_result.get('succeeded_count', 0) - skipped
-                        if skipped > 0:
-                            app.logger.info(
-                                f"✅ M3U batch refresh: {refreshed} refreshed, {skipped} skipped (recently updated) "
-                                f"in {batch_refresh_result.get('duration', 0):.1f}s"
-                            )
-                        else:
-                            app.logger.info(
-                                f"✅ M3U batch refresh completed in {batch_refresh_result.get('duration', 0):.1f}s "
-                                f"({batch_refresh_result.get('succeeded_count', 0)} succeeded)"
-                            )
-                    else:
-                        failed = batch_refresh_result.get('failed_count', 0)
-                        succeeded = batch_refresh_result.get('succeeded_count', 0)
-                        skipped = batch_refresh_result.get('skipped_count', 0)
-                        app.logger.warning(
-                            f"⚠️ M3U batch refresh partial: {succeeded} succeeded, {failed} failed, {skipped} skipped"
-                        )
-                        # Log individual failures
-                        for account_id, result in batch_refresh_result.get('results', {}).items():
-                            if not result.get('success') and not result.get('skipped'):
-                                app.logger.warning(f"  Account {account_id}: {result.get('message')}")
-
-                # Step 2b: Process groups sequentially (parents first, then children)
-                # Sequential processing allows stream-level progress reporting during large groups
-                # Streams within each group are still processed in parallel for speed
+                # Step 2b: Process groups concurrently (parents first, then children)
+                # Fetching and matching overlap across groups; channel numbering, channel
+                # lifecycle and EPG merging still run one group at a time in list order,
+                # and multi-sport groups (which match against other groups' channels)
+                # run entirely in their turn - see epg.group_scheduler
+                from contextlib import nullcontext
+                from epg.group_scheduler import run_event_groups
                 report_progress('progress', f'Processing {total_groups} event group(s)...', 55)
 
-                group_results = []
                 completed_count = 0
                 all_groups = single_league_parents + single_league_children + multi_sport_groups
 
-                def make_stream_progress_callback(group_idx, total_groups):
+                # Same matchup across providers/feeds is matched once per generation
+                from epg.multi_sport_matcher import MatchupMemo
+                matchup_memo = MatchupMemo()
+
+                # Fraction of streams processed per group, summed for overall progress
+                group_progress = {}
+                group_progress_lock = threading.Lock()
+
+                def report_group_progress(group_idx, fraction, message, **extra):
+                    """Record a group's progress and report the overall 55-85% position."""
+                    with group_progress_lock:
+                        group_progress[group_idx] = fraction
+                        progress_percent = 55 + int(30 * sum(group_progress.values()) / total_groups)
+                        # Report under the lock so concurrent groups never move the bar backwards
+                        report_progress('progress', message, progress_percent, **extra)
+
+                def make_stream_progress_callback(group_idx):
                     """Create a callback for stream-level progress within a group."""
                     def callback(processed_streams, total_streams, group_name, **kwargs):
-                        # Calculate overall progress: 55-85% range divided among groups
-                        # Each group gets a slice of the progress bar proportional to its position
-                        group_base_percent = 55 + int(30 * group_idx / total_groups)
-                        group_end_percent = 55 + int(30 * (group_idx + 1) / total_groups)
-                        group_range = group_end_percent - group_base_percent
-
-                        # Within this group's slice, show stream progress
                         stream_progress = processed_streams / total_streams if total_streams > 0 else 1
-                        progress_percent = group_base_percent + int(group_range * stream_progress)
 
                         # Build message with stream name and status if available
                         stream_name = kwargs.get('stream_name', '')
@@ -1401,10 +1542,11 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                         else:
                             message = f"Processing {group_name}: {processed_streams}/{total_streams} streams"
 
-                        report_progress(
-                            'progress',
+                        # Stop just short of 1 - a group is only complete once its channels and EPG are done
+                        report_group_progress(
+                            group_idx,
+                            min(stream_progress, 0.99),
                             message,
-                            progress_percent,
                             group_name=group_name,
                             streams_processed=processed_streams,
                             streams_total=total_streams,
@@ -1414,35 +1556,34 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                         )
                     return callback
 
-                for group_idx, group in enumerate(all_groups):
-                    try:
-                        # Create stream progress callback for this group
-                        stream_callback = make_stream_progress_callback(group_idx, total_groups)
-
-                        # Initial progress message for this group
-                        group_base_percent = 55 + int(30 * group_idx / total_groups)
-                        report_progress(
-                            'progress',
-                            f"Starting group: {group['group_name']}",
-                            group_base_percent,
-                            group_name=group['group_name']
-                        )
-
-                        # Process the group with stream-level progress callback
-                        refresh_result = refresh_event_group_core(
+                def process_group(group_idx, group, wait_for_turn, stream_executor):
+                    """Refresh one group with stream-level progress (runs on a group worker)."""
+                    report_group_progress(
+                        group_idx, 0,
+                        f"Starting group: {group['group_name']}",
+                        group_name=group['group_name']
+                    )
+                    # Channel writes on this worker join the generation's sync plan
+                    bound_plan = (channel_sync_api.bind_sync_plan(channel_sync_plan)
+                                  if channel_sync_api else nullcontext())
+                    with bound_plan:
+                        return refresh_event_group_core(
                             group, m3u_manager,
                             skip_m3u_refresh=True,
                             epg_start_datetime=epg_start_datetime,
-                            progress_callback=stream_callback,
-                            generation=current_generation
+                            progress_callback=make_stream_progress_callback(group_idx),
+                            generation=current_generation,
+                            matchup_memo=matchup_memo,
+                            wait_for_turn=wait_for_turn,
+                            stream_executor=stream_executor,
+                            m3u_refresh=refresh_handles.get(group.get('dispatcharr_account_id'))
                         )
-                        error = None
-                    except Exception as e:
-                        app.logger.warning(f"Error refreshing event group '{group['group_name']}': {e}")
-                        refresh_result = None
-                        error = str(e)
 
-                    group_results.append((group, refresh_result, error))
+                for group_idx, group, refresh_result, error in run_event_groups(
+                    all_groups,
+                    process_group,
+                    exclusive=lambda g: bool(g.get('is_multi_sport'))
+                ):
                     completed_count += 1
 
                     # Aggregate stats
@@ -1468,15 +1609,56 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                             update_event_epg_group_last_refresh(group['id'])
 
                     # Report group completion
-                    progress_percent = 55 + int(30 * completed_count / total_groups)
-                    report_progress(
-                        'progress',
+                    report_group_progress(
+                        group_idx, 1,
                         f"Completed {completed_count}/{total_groups} groups ({group['group_name']})",
-                        progress_percent,
                         group_name=group['group_name'],
                         current=completed_count,
                         total=total_groups
                     )
+
+                if refresh_handles:
+                    # Groups have waited for their own accounts - these are already done
+                    refresh_results = {account_id: handle.wait() for account_id, handle in refresh_handles.items()}
+                    # Longest refresh (the batch itself overlapped with group processing)
+                    batch_refresh_result = m3u_manager.summarize_refreshes(
+                        refresh_results,
+                        max(result.get('duration') or 0 for result in refresh_results.values())
+                    )
+
+                    if batch_refresh_result.get('success'):
+                        skipped = batch_refresh_result.get('skipped_count', 0)
+                        refreshed = batch_refresh_result.get('succeeded_count', 0) - skipped
+                        if skipped > 0:
+                            app.logger.info(
+                                f"✅ M3U batch refresh: {refreshed} refreshed, {skipped} skipped (recently updated) "
+                                f"in {batch_refresh_result.get('duration', 0):.1f}s"
+                            )
+                        else:
+                            app.logger.info(
+                                f"✅ M3U batch refresh completed in {batch_refresh_result.get('duration', 0):.1f}s "
+                                f"({batch_refresh_result.get('succeeded_count', 0)} succeeded)"
+                            )
+                    else:
+                        failed = batch_refresh_result.get('failed_count', 0)
+                        succeeded = batch_refresh_result.get('succeeded_count', 0)
+                        skipped = batch_refresh_result.get('skipped_count', 0)
+                        app.logger.warning(
+                            f"⚠️ M3U batch refresh partial: {succeeded} succeeded, {failed} failed, {skipped} skipped"
+                        )
+                        # Log individual failures
+                        for account_id, result in batch_refresh_result.get('results', {}).items():
+                            if not result.get('success') and not result.get('skipped'):
+                                app.logger.warning(f"  Account {account_id}: {result.get('message')}")
+
+                memo_stats = matchup_memo.stats()
+                event_stats['matchup_memo_lookups'] = memo_stats['lookups']
+                event_stats['matchup_memo_hits'] = memo_stats['hits']
+                if memo_stats['lookups']:
+                    app.logger.info(
+                        f"🧠 Matchup memo: {memo_stats['hits']}/{memo_stats['lookups']} hits "
+                        f"({memo_stats['hit_rate']:.0%})"
+                    )
             else:
                 report_progress('progress', 'M3U manager not available, skipping event groups...', 85)
                 app.logger.warning("M3U manager not available - skipping event groups")
@@ -1557,6 +1739,17 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
         except Exception as e:
             app.logger.warning(f"Channel lifecycle processing error: {e}")
 
+        # Send the generation's channel updates: one PATCH per changed channel
+        if channel_sync_api:
+            report_progress('progress', 'Syncing channels to Dispatcharr...', 94)
+            sync_plan = channel_sync_api.end_sync_plan()
+            channel_sync_api = None
+            if sync_plan:
+                lifecycle_stats['channel_sync'] = sync_plan.summary()
+                # Failed writes were already recorded as done - flag them for reconciliation
+                from epg.channel_lifecycle import record_sync_plan_errors
+                record_sync_plan_errors(sync_plan)
+
         # ============================================
         # PHASE 4: Final consolidation & History
         # ============================================
@@ -1625,6 +1818,8 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
                 'event_filtered_unsupported_sport': event_stats['filtered_unsupported_sport'],
                 'event_eligible_streams': event_stats['eligible_streams'],
                 'event_matched_streams': event_stats['streams_matched'],
+                'event_matchup_memo_lookups': event_stats['matchup_memo_lookups'],
+                'event_matchup_memo_hits': event_stats['matchup_memo_hits'],
                 # Quality stats (not tracked here, defaults to 0)
                 'unresolved_vars_count': 0,
                 'coverage_gaps_count': 0,
@@ -1738,6 +1933,14 @@ def generate_all_epg(progress_callback=None, settings=None, save_history=True, t
         app.logger.error(f"EPG generation error: {e}", exc_info=True)
         generation_time = (datetime.now() - start_time).total_seconds()
 
+        # Still send channel updates staged before the failure
+        if channel_sync_api:
+            try:
+                from epg.channel_lifecycle import record_sync_plan_errors
+                record_sync_plan_errors(channel_sync_api.end_sync_plan())
+            except Exception as sync_error:
+                app.logger.warning(f"Channel sync error: {sync_error}")
+
         report_progress('error', f'EPG generation failed: {str(e)}', None)
 
         # Save error to history
@@ -1774,7 +1977,7 @@ def run_scheduled_generation():
     try:
         app.logger.info(f"🕐 Scheduled EPG generation started at {datetime.now()}")
 
-        with app.app_context():
+        with generation_lock, app.app_context():
             result = generate_all_epg(triggered_by='scheduler')
 
             if result.get('success'):
@@ -1883,6 +2086,10 @@ def scheduler_loop():
 
     while scheduler_running:
         try:
+            if not scheduler_is_leader.is_set():
+                time.sleep(10)  # Another process is the elected scheduler
+                continue
+
             conn = get_connection()
             settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
             conn.close()
@@ -1964,23 +2171,169 @@ def scheduler_loop():
 
     app.logger.info("🛑 EPG Auto-Generation Scheduler stopped")
 
+def scheduler_lease_loop():
+    """Background thread that keeps (or tries to win) the scheduler lease"""
+    from database import acquire_process_lease, release_process_lease
+
+    while scheduler_running:
+        try:
+            if acquire_process_lease(SCHEDULER_LEASE, scheduler_owner, SCHEDULER_LEASE_TTL):
+                if not scheduler_is_leader.is_set():
+                    app.logger.info(f"👑 Elected as scheduler process ({scheduler_owner})")
+                    scheduler_is_leader.set()
+            elif scheduler_is_leader.is_set():
+                app.logger.warning("⚠️ Scheduler lease taken over by another process")
+                scheduler_is_leader.clear()
+        except Exception as e:
+            # Can't confirm the lease - stand down rather than risk two schedulers
+            app.logger.warning(f"Scheduler lease heartbeat failed: {e}")
+            scheduler_is_leader.clear()
+
+        time.sleep(SCHEDULER_HEARTBEAT_INTERVAL)
+
+    scheduler_is_leader.clear()
+    try:
+        release_process_lease(SCHEDULER_LEASE, scheduler_owner)
+    except Exception:
+        pass
+
+def run_generation_request(request_info):
+    """Run a queued manual/API generation, recording its progress and result in the database"""
+    from database import update_generation_request
+
+    request_id = request_info['id']
+    last_progress_write = [0.0]
+    app.logger.info(f"🚀 Running queued EPG generation #{request_id} ({request_info['triggered_by']})")
+
+    def progress_callback(status, message, percent=None, **extra):
+        now = time.time()
+        # Stream-level progress is frequent - a few writes per second are enough for the UI
+        if status == 'progress' and now - last_progress_write[0] < GENERATION_PROGRESS_WRITE_INTERVAL:
+            return
+        last_progress_write[0] = now
+        progress = {'status': status, 'message': message, **extra}
+        if percent is not None:
+            progress['percent'] = percent
+        try:
+            update_generation_request(request_id, progress=progress)
+        except Exception as e:
+            app.logger.debug(f"Could not record generation progress: {e}")
+
+    def team_progress_callback(current, total, team_name, message):
+        """Per-team progress callback - scales to 10-45% range"""
+        base_percent = 10 + int((current / total) * 35) if total > 0 else 10
+        progress_callback('progress', message, base_percent, current=current, total=total, team_name=team_name)
+
+    try:
+        with generation_lock, app.app_context():
+            result = generate_all_epg(
+                progress_callback=progress_callback,
+                team_progress_callback=team_progress_callback,
+                save_history=True,
+                triggered_by=request_info['triggered_by']
+            )
+    except Exception as e:
+        app.logger.error(f"❌ Queued EPG generation #{request_id} failed: {e}", exc_info=True)
+        result = {'success': False, 'error': str(e)}
+
+    update_generation_request(request_id, status='complete' if result.get('success') else 'error', result=result)
+
+def generation_request_loop():
+    """Background thread (scheduler process) that runs manual/API generations queued by web workers"""
+    from database import claim_generation_request, fail_generation_requests
+
+    leading = False
+    while scheduler_running:
+        try:
+            if scheduler_is_leader.is_set():
+                if not leading:
+                    # Only the leader runs requests - any still 'running' lost their process
+                    fail_generation_requests(('running',), 'EPG generation was interrupted (scheduler process stopped)')
+                    leading = True
+                request_info = claim_generation_request()
+                if request_info:
+                    run_generation_request(request_info)
+                    continue
+            else:
+                leading = False
+        except Exception as e:
+            app.logger.error(f"❌ Generation request loop error: {e}", exc_info=True)
+
+        time.sleep(GENERATION_REQUEST_POLL_INTERVAL)
+
+def follow_generation_request(request_id):
+    """
+    Follow a generation request run by the scheduler process (production mode).
+
+    Yields:
+        ('progress', dict) when the recorded progress changes, ('waiting', None)
+        otherwise, and finally ('done', result dict)
+    """
+    from database import get_generation_request, get_process_lease, update_generation_request
+
+    last_progress = None
+    last_leader_check = time.time()
+    while True:
+        request_info = get_generation_request(request_id)
+        if request_info is None:
+            yield 'done', {'success': False, 'error': f'Generation request {request_id} not found'}
+            return
+
+        progress = request_info.get('progress')
+        if progress and progress != last_progress:
+            last_progress = progress
+            yield 'progress', progress
+        else:
+            yield 'waiting', None
+
+        if request_info['status'] not in ('queued', 'running'):
+            yield 'done', request_info.get('result') or {'success': False, 'error': 'EPG generation failed'}
+            return
+
+        # Nobody will pick the request up if the scheduler process is gone
+        if time.time() - last_leader_check >= SCHEDULER_HEARTBEAT_INTERVAL:
+            last_leader_check = time.time()
+            lease = get_process_lease(SCHEDULER_LEASE)
+            if lease is None or time.time() - lease['heartbeat_at'] > SCHEDULER_LEASE_TTL:
+                result = {'success': False, 'error': 'No scheduler process is running'}
+                update_generation_request(request_id, status='error', result=result)
+                yield 'done', result
+                return
+
+        time.sleep(GENERATION_PROGRESS_POLL_INTERVAL)
+
 def start_scheduler():
-    """Start the scheduler background thread"""
-    global scheduler_thread, scheduler_running
+    """Start the scheduler background thread (runs only while this process holds the scheduler lease)"""
+    global scheduler_thread, scheduler_running, scheduler_owner
+    import socket
+    import uuid
 
     if scheduler_thread and scheduler_thread.is_alive():
         app.logger.warning("⚠️  Scheduler already running")
         return
 
+    # Unique per process (and per start) - pids repeat across containers
+    scheduler_owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
     scheduler_running = True
+    threading.Thread(target=scheduler_lease_loop, daemon=True).start()
     scheduler_thread = threading.Thread(target=scheduler_loop, daemon=True)
     scheduler_thread.start()
+    if generation_runs_in_scheduler():
+        threading.Thread(target=generation_request_loop, daemon=True).start()
     app.logger.info("✅ Scheduler thread started")
 
 def stop_scheduler():
-    """Stop the scheduler background thread"""
+    """Stop the scheduler background thread and give up the scheduler lease"""
     global scheduler_running
+    from database import release_process_lease
+
     scheduler_running = False
+    scheduler_is_leader.clear()
+    if scheduler_owner:
+        try:
+            release_process_lease(SCHEDULER_LEASE, scheduler_owner)
+        except Exception:
+            pass
     app.logger.info("⏹️  Scheduler stopping...")
 
 # =============================================================================
@@ -2703,25 +3056,31 @@ def epg_management():
             with open(epg_path, 'r', encoding='utf-8') as f:
                 epg_content = f.read()
                 epg_total_lines = epg_content.count('\n')
-
-            # Analyze EPG content
-            epg_analysis = _analyze_epg_content(epg_content)
-
-            # Override counts with authoritative values from epg_history
-            # (the analysis function guesses using keywords, but we know the real counts from generation)
-            if latest_epg:
-                if latest_epg.get('num_events') is not None:
-                    epg_analysis['total_events'] = latest_epg['num_events']
-                if latest_epg.get('num_pregame') is not None:
-                    epg_analysis['filler_programs']['pregame'] = latest_epg['num_pregame']
-                if latest_epg.get('num_postgame') is not None:
-                    epg_analysis['filler_programs']['postgame'] = latest_epg['num_postgame']
-                if latest_epg.get('num_idle') is not None:
-                    epg_analysis['filler_programs']['idle'] = latest_epg['num_idle']
         except Exception as e:
             app.logger.error(f"Error reading EPG file: {e}")
             epg_content = None
 
+        # Analyze EPG content (summary cached until the file changes). A
+        # malformed guide leaves the analysis empty but keeps the preview.
+        import xml.etree.ElementTree as ET
+        from epg.epg_index import get_epg_index
+        try:
+            epg_analysis = get_epg_index(epg_path).get_analysis()
+        except (OSError, ET.ParseError) as e:
+            app.logger.error(f"Error analyzing EPG file: {e}")
+
+        # Override counts with authoritative values from epg_history
+        # (the analysis function guesses using keywords, but we know the real counts from generation)
+        if epg_analysis is not None and latest_epg:
+            if latest_epg.get('num_events') is not None:
+                epg_analysis['total_events'] = latest_epg['num_events']
+            if latest_epg.get('num_pregame') is not None:
+                epg_analysis['filler_programs']['pregame'] = latest_epg['num_pregame']
+            if latest_epg.get('num_postgame') is not None:
+                epg_analysis['filler_programs']['postgame'] = latest_epg['num_postgame']
+            if latest_epg.get('num_idle') is not None:
+                epg_analysis['filler_programs']['idle'] = latest_epg['num_idle']
+
     # Generate EPG URL
     epg_url = f"{request.url_root}teamarr.xml"
 
@@ -2997,6 +3356,7 @@ def settings_update():
 
         conn.commit()
         conn.close()
+        invalidate_epg_output_path()
 
         flash('Settings updated successfully!', 'success')
     except Exception as e:
@@ -3169,7 +3529,15 @@ def generate_epg():
 
     # For JSON API clients, run synchronously and return result
     if request.accept_mimetypes.accept_json and not request.accept_mimetypes.accept_html:
-        result = generate_all_epg(triggered_by='api')
+        if generation_runs_in_scheduler():
+            # Run by the scheduler process - wait for its result
+            from database import queue_generation_request
+            result = {}
+            for kind, data in follow_generation_request(queue_generation_request('api')):
+                if kind == 'done':
+                    result = data
+        else:
+            result = generate_all_epg(triggered_by='api')
 
         if result.get('success'):
             return jsonify({
@@ -3207,6 +3575,12 @@ def generate_epg_stream():
 
     global generation_status
 
+    if generation_runs_in_scheduler():
+        return Response(_follow_generation_stream(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        })
+
     def generate():
         """Generator function for SSE stream"""
         progress_queue = queue.Queue()
@@ -3300,6 +3674,21 @@ def generate_epg_stream():
     })
 
 
+def _follow_generation_stream():
+    """SSE stream of a generation queued for the scheduler process (production mode)"""
+    from database import queue_generation_request
+
+    saw_error = False
+    for kind, data in follow_generation_request(queue_generation_request('manual')):
+        if kind == 'progress':
+            saw_error = saw_error or data.get('status') == 'error'
+            yield f"data: {json.dumps(data)}\n\n"
+        elif kind == 'waiting':
+            yield f": heartbeat\n\n"
+        elif not data.get('success') and not saw_error:
+            yield f"data: {json.dumps({'status': 'error', 'message': data.get('error', 'EPG generation failed')})}\n\n"
+
+
 @app.route('/api/generation/status')
 def get_generation_status():
     """
@@ -3311,7 +3700,25 @@ def get_generation_status():
     - message: str - human-readable message
     - percent: int - progress percentage (0-100)
     - extra: dict - additional data (team_name, current, total, etc.)
+
+    In production mode this is the latest generation request run by the
+    scheduler process.
     """
+    if generation_runs_in_scheduler():
+        from database import get_latest_generation_request
+        request_info = get_latest_generation_request()
+        if request_info is None:
+            return jsonify(generation_status)
+        in_progress = request_info['status'] in ('queued', 'running')
+        progress = dict(request_info.get('progress') or {})
+        extra = {k: v for k, v in progress.items() if k not in ('status', 'message', 'percent')}
+        return jsonify({
+            'in_progress': in_progress,
+            'status': progress.get('status') or ('starting' if in_progress else request_info['status']),
+            'message': progress.get('message') or ('Waiting for the scheduler process...' if in_progress else ''),
+            'percent': progress.get('percent', 0),
+            'extra': extra
+        })
     return jsonify(generation_status)
 
 @app.route('/download')
@@ -3338,24 +3745,83 @@ def download_epg():
         flash(f"Error downloading EPG: {str(e)}", 'error')
         return redirect(url_for('index'))
 
+# epg_output_path is needed on every guide poll - cache it per process.
+# settings_update clears it; other worker processes pick changes up within the TTL.
+EPG_OUTPUT_PATH_TTL = 30
+_epg_output_path_cache = {'path': None, 'expires_at': 0.0}
+
+
+def get_epg_output_path():
+    """Get the configured final EPG path (cached for EPG_OUTPUT_PATH_TTL seconds)"""
+    now = time.time()
+    if _epg_output_path_cache['path'] and now < _epg_output_path_cache['expires_at']:
+        return _epg_output_path_cache['path']
+
+    conn = get_connection()
+    try:
+        result = conn.execute("SELECT epg_output_path FROM settings WHERE id = 1").fetchone()
+    finally:
+        conn.close()
+
+    output_path = (result[0] if result else None) or '/app/data/teamarr.xml'
+    _epg_output_path_cache['path'] = output_path
+    _epg_output_path_cache['expires_at'] = now + EPG_OUTPUT_PATH_TTL
+    return output_path
+
+
+def invalidate_epg_output_path():
+    """Forget the cached EPG path (call after settings change)"""
+    _epg_output_path_cache['path'] = None
+
+
+def send_epg_file(path):
+    """
+    Send a served XMLTV file with a content-hash ETag and precompressed encoding.
+
+    Clients sending a matching If-None-Match get a 304. Otherwise the .br/.gz
+    sibling written by epg.precompressed is sent if the client accepts it.
+
+    Returns:
+        Response, or None if the file doesn't exist
+    """
+    from epg.precompressed import get_published, ENCODING_SUFFIXES
+
+    published = get_published(path)
+    if published is None:
+        return None
+
+    accepted = [encoding for encoding in ENCODING_SUFFIXES if request.accept_encodings[encoding]]
+    file_path, encoding = published.select(accepted)
+
+    response = send_file(
+        file_path,
+        mimetype='application/xml',
+        etag=published.etag_for(encoding),
+        conditional=True,
+        max_age=0
+    )
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
 @app.route('/teamarr.xml')
 def serve_epg():
     """Serve EPG file for IPTV clients"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT epg_output_path FROM settings WHERE id = 1")
-        result = cursor.fetchone()
-        conn.close()
+        output_path = get_epg_output_path()
 
-        output_path = result[0] if result else '/app/data/teamarr.xml'
-
-        if not os.path.exists(output_path):
+        response = send_epg_file(output_path)
+        if response is None:
             app.logger.warning(f'EPG file not found at {output_path}')
             return "EPG file not found. Generate it first.", 404
 
-        app.logger.info(f'📡 Serving EPG file: {output_path}')
-        return send_file(output_path, mimetype='application/xml')
+        if response.status_code == 304:
+            app.logger.debug(f'📡 EPG unchanged for client: {output_path}')
+        else:
+            app.logger.info(f'📡 Serving EPG file: {output_path}')
+        return response
     except Exception as e:
         app.logger.error(f"❌ Error serving EPG: {str(e)}", exc_info=True)
         return f"Error serving EPG: {str(e)}", 500
@@ -3465,10 +3931,10 @@ def api_epg_stats_live():
     Query params:
         type: 'team' or 'event' (default: both)
     """
-    import xml.etree.ElementTree as ET
-    from datetime import datetime, timedelta, timezone
+    from datetime import datetime, timedelta
     from zoneinfo import ZoneInfo
     from utils.time_format import format_time, get_time_settings
+    from epg.epg_index import get_epg_index
 
     try:
         # Get settings for timezone and EPG path
@@ -3488,93 +3954,30 @@ def api_epg_stats_live():
             'event': {'games_today': 0, 'live_now': 0, 'today_events': []}
         }
 
-        # Check if EPG file exists
-        if not os.path.exists(epg_path):
+        # Game programmes from the guide's stats index (parsed once per guide version)
+        epg_index = get_epg_index(epg_path)
+        if epg_index is None:
             return jsonify({'success': True, 'stats': stats, 'message': 'No EPG file found'})
 
-        # Parse the EPG XML with comments enabled
-        parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
-        tree = ET.parse(epg_path, parser)
-        root = tree.getroot()
-
-        # Parse XMLTV datetime format: YYYYMMDDHHmmss +ZZZZ
-        def parse_xmltv_time(time_str):
-            if not time_str:
-                return None
-            try:
-                # Handle format like "20251129220000 -0500"
-                parts = time_str.split()
-                dt_str = parts[0]
-                tz_str = parts[1] if len(parts) > 1 else '+0000'
-
-                dt = datetime.strptime(dt_str, '%Y%m%d%H%M%S')
-
-                # Parse timezone offset
-                tz_sign = 1 if tz_str[0] == '+' else -1
-                tz_hours = int(tz_str[1:3])
-                tz_mins = int(tz_str[3:5])
-                tz_offset = timedelta(hours=tz_sign * tz_hours, minutes=tz_sign * tz_mins)
-                dt = dt.replace(tzinfo=timezone(tz_offset))
-
-                return dt.astimezone(user_tz)
-            except Exception:
-                return None
-
-        # Track seen programmes to avoid counting duplicates
-        # (same event from different groups would have same channel+start+stop)
-        seen_programmes = set()
-
-        # Process each programme element
-        for programme in root.findall('.//programme'):
-            # Look for teamarr metadata comment
-            teamarr_type = None
-            for child in programme:
-                if callable(child.tag):  # Comments have callable tag (ET.Comment)
-                    comment_text = child.text or ''
-                    if comment_text.startswith('teamarr:'):
-                        teamarr_type = comment_text[8:]  # Remove 'teamarr:' prefix
-                        break
-
-            # Skip if no teamarr metadata or if it's filler
-            if not teamarr_type or 'filler' in teamarr_type:
-                continue
-
-            # Determine stat key from metadata (teams-event or event-event)
-            stat_key = 'team' if teamarr_type == 'teams-event' else 'event'
-
-            start_str = programme.get('start')
-            stop_str = programme.get('stop')
-            channel_id = programme.get('channel', '')
-            title_elem = programme.find('title')
-            title = title_elem.text if title_elem is not None else ''
-
-            # Skip duplicate programmes (same channel+start+stop)
-            prog_key = (channel_id, start_str, stop_str)
-            if prog_key in seen_programmes:
-                continue
-            seen_programmes.add(prog_key)
-
-            start_time = parse_xmltv_time(start_str)
-            stop_time = parse_xmltv_time(stop_str)
-
-            if not start_time or not stop_time:
-                continue
-
-            start_date = start_time.date()
-
-            # Games Today: events scheduled for today
-            if start_date == today:
-                stats[stat_key]['games_today'] += 1
-                stats[stat_key]['today_events'].append({
-                    'title': title,
-                    'start': format_time(start_time, time_fmt, show_tz),
-                    'start_ts': start_time.timestamp(),  # For sorting
-                    'channel': channel_id
-                })
+        day_start = datetime(today.year, today.month, today.day, tzinfo=user_tz)
+        day_end = day_start + timedelta(days=1)
+        now_ts = now.timestamp()
+
+        # Games Today: events scheduled for today
+        for start_ts, stop_ts, stat_key, channel_id, title in epg_index.games_between(
+            day_start.timestamp(), day_end.timestamp()
+        ):
+            stats[stat_key]['games_today'] += 1
+            stats[stat_key]['today_events'].append({
+                'title': title,
+                'start': format_time(datetime.fromtimestamp(start_ts, user_tz), time_fmt, show_tz),
+                'start_ts': start_ts,  # For sorting
+                'channel': channel_id
+            })
 
-                # Live Now: currently in progress
-                if start_time <= now <= stop_time:
-                    stats[stat_key]['live_now'] += 1
+            # Live Now: currently in progress
+            if start_ts <= now_ts <= stop_ts:
+                stats[stat_key]['live_now'] += 1
 
         # Sort events by start time (earliest first)
         for key in ['team', 'event']:
@@ -4746,8 +5149,6 @@ def api_event_epg_dispatcharr_streams_sse(group_id):
                 is_multi_sport = bool(db_group.get('is_multi_sport')) if db_group else False
 
                 if league or is_multi_sport:
-                    from epg.team_matcher import create_matcher
-                    from epg.event_matcher import create_event_matcher
                     from utils.stream_filter import has_game_indicator
                     from epg.stream_match_cache import StreamMatchCache, refresh_cached_event, get_generation_counter
 
@@ -4794,6 +5195,10 @@ def api_event_epg_dispatcharr_streams_sse(group_id):
 
                     send_progress('progress', f'Matching {len(streams)} streams...', percent=50)
 
+                    # One matcher set for all match threads (see epg.matcher_pool)
+                    from epg.matcher_pool import MatcherPool
+                    shared_team_matcher, shared_event_matcher = MatcherPool.get(None, lookahead_days)
+
                     def match_single_stream_single(stream):
                         """Match a single stream to single league - called in parallel.
 
@@ -4823,9 +5228,8 @@ def api_event_epg_dispatcharr_streams_sse(group_id):
                                 'filter_reason': get_display_text(FilterReason.EXCLUDE_REGEX_MATCHED)
                             }
 
-                        # Create matchers per-thread for thread safety
-                        thread_team_matcher = create_matcher()
-                        thread_event_matcher = create_event_matcher(lookahead_days=lookahead_days)
+                        thread_team_matcher = shared_team_matcher
+                        thread_event_matcher = shared_event_matcher
 
                         # Build config from group settings
                         config = MatchConfig(
@@ -4914,8 +5318,7 @@ def api_event_epg_dispatcharr_streams_sse(group_id):
                         # Check fingerprint cache first
                         cached = stream_cache.get(internal_group_id, stream_id, stream_name)
                         if cached:
-                            # Create minimal matcher just for ESPN client access
-                            thread_event_matcher = create_event_matcher(lookahead_days=lookahead_days)
+                            thread_event_matcher = shared_event_matcher
                             event_id, cached_league, cached_data = cached
                             # Refresh dynamic fields from ESPN
                             refreshed = refresh_cached_event(
@@ -4940,9 +5343,8 @@ def api_event_epg_dispatcharr_streams_sse(group_id):
                                     'from_cache': True
                                 }
 
-                        # Create per-thread instances
-                        thread_team_matcher = create_matcher()
-                        thread_event_matcher = create_event_matcher(lookahead_days=lookahead_days)
+                        thread_team_matcher = shared_team_matcher
+                        thread_event_matcher = shared_event_matcher
                         thread_league_detector = LeagueDetector(
                             espn_client=thread_event_matcher.espn,
                             enabled_leagues=enabled_leagues,
@@ -6273,7 +6675,8 @@ def serve_event_epg(group_id):
             os.path.dirname(__file__), 'data', f'event_epg_{group_id}.xml'
         )
 
-        if not os.path.exists(epg_path):
+        response = send_epg_file(epg_path)
+        if response is None:
             # EPG not generated yet - return minimal valid XMLTV
             app.logger.warning(f"Event EPG file not found for group {group_id}, returning empty XMLTV")
             empty_xml = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -6283,7 +6686,7 @@ def serve_event_epg(group_id):
             return Response(empty_xml, mimetype='application/xml')
 
         app.logger.debug(f"Serving event EPG file for group {group_id}")
-        return send_file(epg_path, mimetype='application/xml')
+        return response
 
     except Exception as e:
         app.logger.error(f"Error serving event EPG for group {group_id}: {e}")
@@ -7478,122 +7881,6 @@ def api_channel_lifecycle_scheduler():
 # HELPER FUNCTIONS
 # =============================================================================
 
-def _analyze_epg_content(xml_content):
-    """
-    Analyze EPG XML content and return statistics
-
-    Returns:
-        dict: Analysis results with counts and findings
-    """
-    import re
-    from datetime import datetime, timedelta
-    import xml.etree.ElementTree as ET
-
-    analysis = {
-        'total_programs': 0,
-        'total_events': 0,
-        'filler_programs': {
-            'pregame': 0,
-            'postgame': 0,
-            'idle': 0
-        },
-        'unreplaced_variables': [],
-        'channels': 0,
-        'coverage_gaps': [],
-        'date_range': None
-    }
-
-    try:
-        # Parse XML
-        root = ET.fromstring(xml_content)
-
-        # Count channels
-        analysis['channels'] = len(root.findall('channel'))
-
-        # Analyze programs
-        programs = root.findall('.//programme')
-        analysis['total_programs'] = len(programs)
-
-        # Track program times per channel for gap detection
-        channel_programs = {}
-
-        for programme in programs:
-            channel = programme.get('channel', '')
-            start = programme.get('start', '')
-            stop = programme.get('stop', '')
-
-            # Get title and description
-            title_elem = programme.find('title')
-            desc_elem = programme.find('desc')
-            title = title_elem.text if title_elem is not None else ''
-            desc = desc_elem.text if desc_elem is not None else ''
-
-            # Check for unreplaced variables in title and description
-            for text in [title, desc]:
-                if text:
-                    vars_found = re.findall(r'\{[^}]+\}', text)
-                    for var in vars_found:
-                        if var not in analysis['unreplaced_variables']:
-                            analysis['unreplaced_variables'].append(var)
-
-            # Track for gap detection
-            if channel not in channel_programs:
-                channel_programs[channel] = []
-            channel_programs[channel].append({
-                'start': start,
-                'stop': stop,
-                'title': title
-            })
-
-        # Detect coverage gaps (programs that don't connect properly)
-        for channel, progs in channel_programs.items():
-            # Sort by start time
-            progs_sorted = sorted(progs, key=lambda x: x['start'])
-            for i in range(len(progs_sorted) - 1):
-                current_stop = progs_sorted[i]['stop']
-                next_start = progs_sorted[i + 1]['start']
-
-                # If there's a gap (stop time doesn't match next start time)
-                if current_stop != next_start:
-                    try:
-                        # Parse times (format: YYYYMMDDHHMMSS +0000)
-                        stop_time = datetime.strptime(current_stop[:14], '%Y%m%d%H%M%S')
-                        start_time = datetime.strptime(next_start[:14], '%Y%m%d%H%M%S')
-                        gap_minutes = (start_time - stop_time).total_seconds() / 60
-
-                        # Only report gaps > 1 minute (to avoid floating point rounding)
-                        if gap_minutes > 1:
-                            analysis['coverage_gaps'].append({
-                                'channel': channel,
-                                'gap_minutes': int(gap_minutes),
-                                'after_program': progs_sorted[i]['title'],
-                                'after_stop': progs_sorted[i]['stop'],
-                                'before_program': progs_sorted[i + 1]['title'],
-                                'before_start': progs_sorted[i + 1]['start']
-                            })
-                    except:
-                        pass
-
-        # Calculate date range
-        if programs:
-            try:
-                start_times = [p.get('start', '') for p in programs]
-                stop_times = [p.get('stop', '') for p in programs]
-                if start_times and stop_times:
-                    earliest = min(start_times)
-                    latest = max(stop_times)
-                    analysis['date_range'] = {
-                        'start': earliest[:8],  # YYYYMMDD
-                        'end': latest[:8]
-                    }
-            except:
-                pass
-
-    except Exception as e:
-        app.logger.error(f"Error analyzing EPG: {e}")
-
-    return analysis
-
 def _generate_channel_id(format_template, **kwargs):
     """
     Generate a channel ID based on the format template from settings
@@ -7805,6 +8092,116 @@ def initialize_team_league_cache():
         app.logger.warning(f"⚠️ Team-league cache initialization skipped: {e}")
 
 
+# =============================================================================
+# PRODUCTION SERVER
+# =============================================================================
+# TEAMARR_SERVER=production serves the app with gunicorn (threaded workers)
+# instead of the Werkzeug debug server. All generation (scheduled, manual and
+# API) runs in the scheduler process so EPG requests aren't competing with the
+# generation thread pools. Web workers queue manual/API generations in the
+# database and stream their progress from it.
+#
+#   TEAMARR_SERVER        development (default) | production
+#   WEB_CONCURRENCY       Web worker processes (default 1)
+#   TEAMARR_WEB_THREADS   Request threads per web worker (default 16)
+# =============================================================================
+
+def run_scheduler_process():
+    """Entry point of the dedicated scheduler process (production mode)"""
+    import signal
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopped.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stopped.set())
+
+    start_scheduler()
+    stopped.wait()
+    stop_scheduler()
+
+
+def run_production_server(port):
+    """Serve with gunicorn web workers plus one scheduler process"""
+    import multiprocessing
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        app.logger.warning("⚠️ gunicorn is not installed - serving with the threaded Werkzeug server instead")
+        start_scheduler()
+        app.run(host='0.0.0.0', port=port, debug=False, threaded=True, use_reloader=False)
+        return
+
+    # Inherited by the scheduler process and the gunicorn workers
+    os.environ['TEAMARR_GENERATION_PROCESS'] = 'scheduler'
+
+    class TeamarrServer(BaseApplication):
+        """gunicorn application serving the already-imported Flask app"""
+
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    def start_scheduler_process():
+        process = multiprocessing.Process(target=run_scheduler_process, name='teamarr-scheduler', daemon=True)
+        process.start()
+        return process
+
+    def scheduler_process_alive(process) -> bool:
+        if not process.is_alive():
+            return False
+        # The gunicorn arbiter reaps unknown children with waitpid(-1), after
+        # which is_alive() can't tell - check the pid directly
+        try:
+            os.kill(process.pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    scheduler = {'process': start_scheduler_process()}
+    stopping = threading.Event()
+    app.logger.info(f"✅ Scheduler process started (pid {scheduler['process'].pid})")
+
+    def watch_scheduler():
+        """Restart the scheduler process if it dies (e.g. OOM-killed mid-generation)"""
+        while not stopping.wait(SCHEDULER_WATCHDOG_INTERVAL):
+            process = scheduler['process']
+            if stopping.is_set() or scheduler_process_alive(process):
+                continue
+            exitcode = process.exitcode if process.exitcode is not None else 'unknown'
+            scheduler['process'] = start_scheduler_process()
+            app.logger.error(
+                f"❌ Scheduler process (pid {process.pid}) exited (code {exitcode}) - "
+                f"restarted as pid {scheduler['process'].pid}"
+            )
+
+    def when_ready(server):
+        threading.Thread(target=watch_scheduler, name='scheduler-watchdog', daemon=True).start()
+
+    try:
+        TeamarrServer({
+            'bind': f'0.0.0.0:{port}',
+            'workers': int(os.environ.get('WEB_CONCURRENCY', 1)),
+            'worker_class': 'gthread',
+            'threads': int(os.environ.get('TEAMARR_WEB_THREADS', 16)),
+            # gthread workers heartbeat independently, so long SSE generation
+            # streams aren't killed by the timeout
+            'timeout': 120,
+            'accesslog': None,
+            'when_ready': when_ready,
+        }).run()
+    finally:
+        stopping.set()
+        scheduler['process'].terminate()
+        scheduler['process'].join(timeout=10)
+
+
 # =============================================================================
 # RUN APPLICATION
 # =============================================================================
@@ -7817,6 +8214,12 @@ if __name__ == '__main__':
     #initialize_soccer_cache()
     #initialize_team_league_cache()
 
+    port = int(os.environ.get('PORT', 9195))
+
+    if os.environ.get('TEAMARR_SERVER', 'development').lower() == 'production':
+        run_production_server(port)
+        sys.exit(0)
+
     # Start the auto-generation scheduler
     # Only start in main process, not in werkzeug reloader process
     # In Docker/production, WERKZEUG_RUN_MAIN won't be set, so check differently
@@ -7829,7 +8232,6 @@ if __name__ == '__main__':
         start_scheduler()
 
     try:
-        port = int(os.environ.get('PORT', 9195))
         app.run(host='0.0.0.0', port=port, debug=True, use_reloader=False)  # Disable reloader to prevent duplicates
     except KeyboardInterrupt:
         stop_scheduler()
@@ -0,0 +1,115 @@
+"""
+Micro-benchmark: TeamNameIndex vs the linear scan in TeamMatcher._find_team_in_text.
+
+Builds a synthetic college-sized league (~360 teams) and matches a batch of
+stream-like strings with both implementations, checking they agree.
+
+Usage:
+    python benchmarks/bench_team_name_index.py [num_teams] [num_queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from epg.team_matcher import TeamMatcher  # noqa: E402
+from epg.team_name_index import TeamNameIndex  # noqa: E402
+
+LOCATIONS = [
+    'alabama', 'arizona', 'arkansas', 'boston', 'california', 'carolina', 'colorado',
+    'dayton', 'delaware', 'florida', 'georgia', 'houston', 'idaho', 'illinois',
+    'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana', 'maryland', 'miami',
+    'michigan', 'minnesota', 'missouri', 'montana', 'nebraska', 'nevada', 'ohio',
+    'oregon', 'texas', 'utah', 'vermont', 'virginia', 'washington', 'wyoming',
+]
+QUALIFIERS = ['', 'state', 'tech', 'north', 'south', 'eastern', 'western', 'central']
+NICKNAMES = [
+    'bears', 'bulldogs', 'cougars', 'cowboys', 'eagles', 'falcons', 'hawks', 'huskies',
+    'knights', 'lions', 'owls', 'panthers', 'pirates', 'rams', 'rebels', 'tigers',
+    'wildcats', 'wolves',
+]
+
+
+def make_teams(matcher: TeamMatcher, count: int):
+    teams = []
+    seen = set()
+    while len(teams) < count:
+        location = ' '.join(filter(None, [random.choice(LOCATIONS), random.choice(QUALIFIERS)]))
+        nickname = random.choice(NICKNAMES)
+        display = f"{location} {nickname}".title()
+        if display in seen:
+            continue
+        seen.add(display)
+        team = {
+            'id': str(len(teams)),
+            'displayName': display,
+            'name': nickname.title(),
+            'shortName': location.title(),
+            'abbreviation': ''.join(w[0] for w in display.split()).upper() + str(len(teams) % 10),
+            'slug': display.lower().replace(' ', '-'),
+            'location': location.title(),
+        }
+        team['_search_names'] = matcher._build_search_names(team)
+        teams.append(team)
+    return teams
+
+
+def make_queries(teams, count: int):
+    queries = []
+    for _ in range(count):
+        team = random.choice(teams)
+        name = random.choice(team['_primary_names'] + team['_secondary_names'])
+        style = random.random()
+        if style < 0.3:
+            queries.append(name)
+        elif style < 0.6:
+            queries.append(f"ncaab {name} 7pm")
+        elif style < 0.8:
+            queries.append(name[:max(3, len(name) // 2)])
+        else:
+            queries.append(f"{name} {random.choice(NICKNAMES)} hd")
+    return queries
+
+
+def bench(label: str, func, queries, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for q in queries:
+            func(q)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    per_query_us = best / len(queries) * 1e6
+    print(f"  {label:<22} {best * 1000:9.1f} ms total  {per_query_us:9.1f} us/query")
+    return best
+
+
+def main():
+    num_teams = int(sys.argv[1]) if len(sys.argv) > 1 else 360
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    random.seed(42)
+
+    matcher = TeamMatcher.__new__(TeamMatcher)
+    teams = make_teams(matcher, num_teams)
+    queries = make_queries(teams, num_queries)
+
+    start = time.perf_counter()
+    index = TeamNameIndex(teams)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    mismatches = sum(
+        1 for q in queries
+        if matcher._find_team_in_text(q, teams) is not index.find(q)
+    )
+
+    print(f"{num_teams} teams, {num_queries} queries (index build: {build_ms:.1f} ms)")
+    scan = bench('linear scan (regex)', lambda q: matcher._find_team_in_text(q, teams), queries)
+    indexed = bench('TeamNameIndex', index.find, queries)
+    print(f"  speedup: {scan / indexed:.0f}x, mismatches: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Benchmark: compiled templates with lazy variables vs rebuilding every variable per resolve().
+
+Replays the template work of a team EPG generation (default 30 teams x 14
+days): each game resolves title, subtitle, art URL and description and then
+takes the variable dict for categories, like _create_program_entry(). Each
+filler resolves its templates once per time block, like
+_generate_filler_entries(). Both ways must produce identical output.
+
+Usage:
+    python benchmarks/bench_template_engine.py [teams] [days]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database  # noqa: E402
+
+database.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='teamarr-bench-'), 'teamarr.db')
+with contextlib.redirect_stdout(io.StringIO()):
+    database.init_database()
+
+from epg.template_engine import VARIABLE_PATTERN, TemplateEngine, TemplateVariables  # noqa: E402
+
+TEMPLATES = {
+    'title_format': '{league} Basketball: {team_name} {vs_at} {opponent}',
+    'subtitle_template': '{venue_full}',
+    'program_art_url': 'https://art.example.com/{league_id}/{team_abbrev}-{opponent_abbrev}.png',
+    'description': ('{team_name} ({team_record}) host the {opponent} ({opponent_record}) '
+                    '{today_tonight} at {game_time} on {broadcast_simple}. {h2h_summary}'),
+    'pregame_title': 'Pregame Coverage',
+    'pregame_description': '{team_name} vs {opponent.next} starts at {game_time.next} on {broadcast_network.next}',
+    'postgame_title': 'Postgame Recap',
+    'postgame_description': '{team_name} {result_text.last} {opponent.last} {final_score.last} {overtime_text.last}',
+    'idle_title': '{team_name} Programming',
+    'idle_description': 'Next game: {game_date.next} vs {opponent.next}. Last: {result.last} vs {opponent.last}',
+}
+
+FILLER_BLOCKS = 4  # Time blocks per filler programme
+
+
+def make_team(index: int) -> dict:
+    return {
+        'espn_team_id': str(index),
+        'team_name': f'Team {index}',
+        'team_abbrev': f'T{index}',
+        'league': 'nba',
+        'league_name': 'NBA',
+        'sport': 'basketball',
+    }
+
+
+def make_game(team: dict, opponent_id: int, start: datetime, final: bool) -> dict:
+    us = {'id': team['espn_team_id'], 'name': team['team_name'], 'abbrev': team['team_abbrev'],
+          'score': random.randint(90, 130) if final else 0, 'record': {'displayValue': '20-10'}}
+    them = {'id': str(opponent_id), 'name': f'Team {opponent_id}', 'abbrev': f'T{opponent_id}',
+            'score': random.randint(90, 130) if final else 0, 'record': {'displayValue': '15-15'}}
+    home, away = (us, them) if random.random() < 0.5 else (them, us)
+    return {
+        'date': start.strftime('%Y-%m-%dT%H:%MZ'),
+        'home_team': home,
+        'away_team': away,
+        'venue': {'name': f'Arena {home["id"]}', 'city': 'Springfield', 'state': 'IL'},
+        'status': {'name': 'STATUS_FINAL' if final else 'STATUS_SCHEDULED', 'period': 4},
+        'season': {'type': 2},
+        'competitions': [{
+            'attendance': 18000,
+            'broadcasts': [{'market': 'national', 'names': ['ESPN']}, {'market': 'home', 'names': ['FDSN']}],
+        }],
+    }
+
+
+def game_context(game: dict) -> dict:
+    return {
+        'game': game,
+        'opponent_stats': {'record': {'summary': '15-15'}, 'rank': 99, 'ppg': 110.2, 'papg': 108.9},
+        'h2h': {'season_series': {'games': []}, 'previous_game': {}},
+        'streaks': {'home_streak': 'W2', 'away_streak': 'L1', 'last_5_record': '3-2', 'last_10_record': '6-4'},
+        'head_coach': 'Coach',
+        'player_leaders': {},
+    }
+
+
+def make_workload(num_teams: int, days: int):
+    """Contexts in the order the orchestrator resolves them: ('game'|filler type, context)."""
+    team_stats = {'record': {'summary': '20-10', 'wins': 20, 'losses': 10}, 'rank': 99,
+                  'streak_count': 2, 'ppg': 112.5, 'papg': 105.1}
+    start = datetime(2026, 10, 16, 23, 0, tzinfo=timezone.utc)
+    workload = []
+    for t in range(num_teams):
+        team = make_team(t)
+        games = [make_game(team, random.randint(100, 130), start + timedelta(days=d), d < 2)
+                 for d in range(0, days, 2)]
+        for i, game in enumerate(games):
+            last_game = game_context(games[i - 1]) if i else {'game': None}
+            next_game = game_context(games[i + 1]) if i + 1 < len(games) else {'game': None}
+            base = {'team_config': team, 'team_stats': team_stats, 'epg_timezone': 'America/Detroit',
+                    'time_format_settings': {}}
+            workload.append(('game', {**base, **game_context(game), 'next_game': next_game, 'last_game': last_game}))
+            for filler_type in ('pregame', 'postgame', 'idle'):
+                workload.append((filler_type, {**base, 'opponent_stats': {}, 'h2h': {},
+                                               'game': game if filler_type != 'idle' else None,
+                                               'next_game': next_game, 'last_game': last_game}))
+    return workload
+
+
+def old_resolve(engine: TemplateEngine, template: str, context: dict) -> str:
+    """resolve() before compiled templates: every variable of every game, then re.sub."""
+    if not template:
+        return ''
+    variables = TemplateVariables(engine, context).as_dict()
+    return VARIABLE_PATTERN.sub(lambda m: str(variables.get(m.group(1), '')), template)
+
+
+def old_variable_dict(engine: TemplateEngine, context: dict) -> dict:
+    return TemplateVariables(engine, context).as_dict()
+
+
+def run(workload, resolve, variable_dict) -> list:
+    out = []
+    for kind, context in workload:
+        if kind == 'game':
+            out.append(resolve(TEMPLATES['title_format'], context))
+            out.append(resolve(TEMPLATES['subtitle_template'], context))
+            out.append(resolve(TEMPLATES['program_art_url'], context))
+            out.append(resolve(TEMPLATES['description'], context))
+            out.append(variable_dict(context))
+        else:
+            out.append(variable_dict(context))
+            for _ in range(FILLER_BLOCKS):
+                out.append(resolve(TEMPLATES[f'{kind}_title'], context))
+                out.append(resolve(TEMPLATES[f'{kind}_description'], context))
+    return out
+
+
+def make_workload_copy(workload):
+    return [(kind, dict(context)) for kind, context in workload]
+
+
+def bench(label: str, func, repeat: int = 2):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:<28} {best * 1000:9.1f} ms")
+    return best, result
+
+
+def main():
+    num_teams = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 14
+    random.seed(42)
+
+    workload = make_workload(num_teams, days)
+    engine = TemplateEngine()
+
+    print(f"{num_teams} teams x {days} days: {len(workload)} programmes "
+          f"({FILLER_BLOCKS} blocks per filler)")
+    old_time, old_out = bench('rebuild per resolve', lambda: run(
+        workload, lambda t, c: old_resolve(engine, t, c), lambda c: old_variable_dict(engine, c)))
+    # Fresh contexts each round, like a real generation (the memo is per context object)
+    new_time, new_out = bench('compiled + lazy variables', lambda: run(
+        make_workload_copy(workload), engine.resolve, engine._build_variable_dict))
+    mismatches = sum(1 for a, b in zip(old_out, new_out) if a != b)
+    print(f"  speedup: {old_time / new_time:.1f}x, mismatches: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: streaming XMLTV writer vs the old tostring -> minidom -> toprettyxml pipeline.
+
+Builds a synthetic guide (default 500 channels x 100 programmes = 50k
+programmes), serializes it both ways, checks the output is identical and
+reports time and peak memory.
+
+Usage:
+    python benchmarks/bench_xmltv_writer.py [channels] [programmes_per_channel]
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from epg.xmltv_writer import write_xmltv  # noqa: E402
+
+
+def build_guide(num_channels: int, per_channel: int) -> ET.Element:
+    tv = ET.Element('tv')
+    for c in range(num_channels):
+        channel = ET.SubElement(tv, 'channel', id=f'teamarr-event-{c}')
+        ET.SubElement(channel, 'display-name').text = f'Team {c} & Friends "Live"'
+        ET.SubElement(channel, 'icon', src=f'https://a.espncdn.com/i/teamlogos/{c}.png?w=100&h=100')
+    for c in range(num_channels):
+        for p in range(per_channel):
+            programme = ET.SubElement(tv, 'programme', start=f'20261016{p % 24:02d}0000 +0000',
+                                      stop=f'20261016{p % 24:02d}3000 +0000', channel=f'teamarr-event-{c}')
+            ET.SubElement(programme, 'title', lang='en').text = f'NBA Basketball <{p}>'
+            ET.SubElement(programme, 'sub-title', lang='en').text = f'Away {p} at Home {c}'
+            ET.SubElement(programme, 'desc', lang='en').text = f'Game {p}: records 10-2 & 8-4.\nLive from Arena {c}'
+            ET.SubElement(programme, 'category', lang='en').text = 'Sports'
+            ET.SubElement(programme, 'icon', src=f'https://example.com/art/{c}/{p}.png')
+            ET.SubElement(programme, 'new')
+            ET.SubElement(programme, 'live')
+            programme.append(ET.Comment('teamarr:teams-event'))
+    return tv
+
+
+def old_pipeline(tv: ET.Element) -> str:
+    rough_string = ET.tostring(tv, encoding='unicode')
+    reparsed = minidom.parseString(rough_string)
+    pretty = reparsed.toprettyxml(indent='  ')
+    lines = [line for line in pretty.split('\n') if line.strip()]
+    if lines and lines[0].startswith('<?xml'):
+        lines = lines[1:]
+    xml_str = '\n'.join(lines)
+    return f'<?xml version="1.0" encoding="UTF-8"?>\n<!DOCTYPE tv SYSTEM "xmltv.dtd">\n{xml_str}'
+
+
+def new_writer(tv: ET.Element) -> str:
+    out = io.StringIO()
+    write_xmltv(out, tv.attrib, tv)
+    return out.getvalue()
+
+
+def measure(label: str, func, tv: ET.Element) -> str:
+    start = time.perf_counter()
+    result = func(tv)
+    elapsed = time.perf_counter() - start
+
+    # Second pass for memory (tracemalloc slows execution down)
+    tracemalloc.start()
+    func(tv)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<28} {elapsed:7.2f} s   peak {peak / 1024 / 1024:8.1f} MiB")
+    return result
+
+
+def main():
+    num_channels = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    per_channel = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    tv = build_guide(num_channels, per_channel)
+    print(f"{num_channels} channels, {num_channels * per_channel} programmes")
+
+    old = measure('tostring + minidom', old_pipeline, tv)
+    new = measure('streaming writer', new_writer, tv)
+    print(f"  output identical: {old == new} ({len(new) / 1024 / 1024:.1f} MiB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ import sqlite3
 import os
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -378,9 +379,10 @@ def get_gracenote_category(league_code: str, league_name: str = '', sport: str =
 #   15: Team-league cache tables for non-soccer sports
 #   16: Multi-sport event groups (is_multi_sport, enabled_leagues, etc.)
 #   23: Stream fingerprint cache for EPG generation optimization
+#   35: Persistent ESPN response cache (TTL + ETag/Last-Modified)
 # =============================================================================
 
-CURRENT_SCHEMA_VERSION = 34
+CURRENT_SCHEMA_VERSION = 38
 
 
 def get_schema_version(conn) -> int:
@@ -2079,6 +2081,90 @@ def run_migrations(conn):
         except Exception as e:
             print(f"    ⚠️ Migration 34 failed: {e}")
 
+    # =========================================================================
+    # 35. PERSISTENT ESPN RESPONSE CACHE
+    # =========================================================================
+    if current_version < 35:
+        print("    🔄 Running migration 35: Create persistent ESPN response cache")
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS espn_response_cache (
+                    url TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    response_data TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL
+                )
+            """)
+            create_index_if_not_exists("idx_erc_expires", "espn_response_cache", "expires_at")
+
+            conn.commit()
+            migrations_run += 1
+        except Exception as e:
+            print(f"    ⚠️ Migration 35 failed: {e}")
+
+    # =========================================================================
+    # 36. MULTI-SPORT MATCHUP MEMO STATS
+    # =========================================================================
+    if current_version < 36:
+        print("    🔄 Running migration 36: Add matchup memo stats to epg_history")
+        try:
+            add_columns_if_missing("epg_history", [
+                ("event_matchup_memo_lookups", "INTEGER DEFAULT 0"),
+                ("event_matchup_memo_hits", "INTEGER DEFAULT 0"),
+            ])
+
+            conn.commit()
+            migrations_run += 1
+        except Exception as e:
+            print(f"    ⚠️ Migration 36 failed: {e}")
+
+    # =========================================================================
+    # 37. PROCESS LEASES (elected scheduler)
+    # =========================================================================
+    if current_version < 37:
+        print("    🔄 Running migration 37: Create process leases table")
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS process_leases (
+                    name TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    acquired_at REAL NOT NULL,
+                    heartbeat_at REAL NOT NULL
+                )
+            """)
+
+            conn.commit()
+            migrations_run += 1
+        except Exception as e:
+            print(f"    ⚠️ Migration 37 failed: {e}")
+
+    # =========================================================================
+    # 38. GENERATION REQUESTS (manual generation run by the scheduler process)
+    # =========================================================================
+    if current_version < 38:
+        print("    🔄 Running migration 38: Create generation requests table")
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS generation_requests (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    triggered_by TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    requested_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    progress TEXT,
+                    result TEXT
+                )
+            """)
+
+            conn.commit()
+            migrations_run += 1
+        except Exception as e:
+            print(f"    ⚠️ Migration 38 failed: {e}")
+
     # =========================================================================
     # UPDATE SCHEMA VERSION
     # =========================================================================
@@ -3349,6 +3435,32 @@ def update_managed_channel(channel_id: int, data: Dict[str, Any]) -> bool:
         conn.close()
 
 
+def update_managed_channels_batch(updates: List[tuple]) -> int:
+    """
+    Update several managed channel records in one transaction.
+
+    Args:
+        updates: List of (channel_id, data) tuples, data as for update_managed_channel()
+
+    Returns:
+        Number of records updated
+    """
+    updated = 0
+    with db_connection() as conn:
+        for channel_id, data in updates:
+            fields = [k for k in data.keys() if k != 'id']
+            if not fields:
+                continue
+            set_clause = ', '.join([f"{f} = ?" for f in fields])
+            cursor = conn.execute(
+                f"UPDATE managed_channels SET {set_clause} WHERE id = ?",
+                [data[f] for f in fields] + [channel_id]
+            )
+            updated += cursor.rowcount
+        conn.commit()
+    return updated
+
+
 def mark_managed_channel_deleted(channel_id: int, logo_deleted: bool = None) -> bool:
     """
     Mark a managed channel as deleted (soft delete).
@@ -3369,6 +3481,21 @@ def mark_managed_channel_deleted(channel_id: int, logo_deleted: bool = None) ->
     ) > 0
 
 
+def mark_managed_channels_deleted(channel_ids: List[int]) -> int:
+    """Soft delete several managed channels (no logo deleted). Returns number marked."""
+    if not channel_ids:
+        return 0
+    placeholders = ','.join('?' * len(channel_ids))
+    with db_connection() as conn:
+        cursor = conn.execute(
+            f"UPDATE managed_channels SET deleted_at = CURRENT_TIMESTAMP, logo_deleted = NULL "
+            f"WHERE id IN ({placeholders})",
+            list(channel_ids)
+        )
+        conn.commit()
+        return cursor.rowcount
+
+
 def delete_managed_channel(channel_id: int) -> bool:
     """Hard delete a managed channel record."""
     return db_execute("DELETE FROM managed_channels WHERE id = ?", (channel_id,)) > 0
@@ -3849,6 +3976,8 @@ def save_epg_generation_stats(stats: Dict[str, Any]) -> int:
             event_filtered_final: int - final events (when excluded)
             event_eligible_streams: int - streams that passed all filters
             event_matched_streams: int - streams matched to ESPN events
+            event_matchup_memo_lookups: int - multi-sport streams checked against the matchup memo
+            event_matchup_memo_hits: int - multi-sport streams that reused a memoized matchup result
 
             # Quality/Error stats
             unresolved_vars_count: int
@@ -3880,8 +4009,9 @@ def save_epg_generation_stats(stats: Dict[str, Any]) -> int:
                 event_filtered_final, event_filtered_league_not_enabled,
                 event_filtered_unsupported_sport,
                 event_eligible_streams, event_matched_streams,
+                event_matchup_memo_lookups, event_matchup_memo_hits,
                 unresolved_vars_count, coverage_gaps_count, warnings_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             stats.get('file_path', ''),
             stats.get('file_size', 0),
@@ -3920,6 +4050,8 @@ def save_epg_generation_stats(stats: Dict[str, Any]) -> int:
             stats.get('event_filtered_unsupported_sport', 0),
             stats.get('event_eligible_streams', 0),
             stats.get('event_matched_streams', 0),
+            stats.get('event_matchup_memo_lookups', 0),
+            stats.get('event_matchup_memo_hits', 0),
             # Quality stats
             stats.get('unresolved_vars_count', 0),
             stats.get('coverage_gaps_count', 0),
@@ -3992,6 +4124,7 @@ def get_epg_stats_summary() -> Dict[str, Any]:
             - events: dict with team_based and event_based counts
             - filler: dict with pregame, postgame, idle counts (broken down by type)
             - quality: dict with unresolved_vars, coverage_gaps, warnings_count
+            - matchup_memo: dict with lookups, hits, hit_rate (multi-sport matching)
     """
     latest = get_latest_epg_stats()
 
@@ -4021,6 +4154,7 @@ def get_epg_stats_summary() -> Dict[str, Any]:
                 'coverage_gaps': 0,
                 'warnings_count': 0,
             },
+            'matchup_memo': {'lookups': 0, 'hits': 0, 'hit_rate': 0.0},
             'generation_time': 0,
         }
 
@@ -4044,6 +4178,9 @@ def get_epg_stats_summary() -> Dict[str, Any]:
     # Event-based doesn't have idle
     total_idle = team_idle
 
+    memo_lookups = latest.get('event_matchup_memo_lookups', 0) or 0
+    memo_hits = latest.get('event_matchup_memo_hits', 0) or 0
+
     return {
         'last_generated': latest.get('generated_at'),
         'total_channels': latest.get('num_channels', 0) or 0,
@@ -4081,6 +4218,11 @@ def get_epg_stats_summary() -> Dict[str, Any]:
             'coverage_gaps': latest.get('coverage_gaps_count', 0) or 0,
             'warnings_count': len(latest.get('warnings', [])),
         },
+        'matchup_memo': {
+            'lookups': memo_lookups,
+            'hits': memo_hits,
+            'hit_rate': memo_hits / memo_lookups if memo_lookups else 0.0,
+        },
         'generation_time': latest.get('generation_time_seconds', 0) or 0,
     }
 
@@ -4288,6 +4430,32 @@ def log_channel_history(
     """, (managed_channel_id, change_type, change_source, field_name, old_value, new_value, notes))
 
 
+def log_channel_history_batch(entries: List[Dict[str, Any]]):
+    """
+    Log several channel history entries in one transaction.
+
+    Args:
+        entries: List of dicts with log_channel_history() arguments
+                 (managed_channel_id and change_type required)
+    """
+    if not entries:
+        return
+
+    with db_connection() as conn:
+        conn.executemany("""
+            INSERT INTO managed_channel_history
+            (managed_channel_id, change_type, change_source, field_name, old_value, new_value, notes)
+            VALUES (:managed_channel_id, :change_type, :change_source, :field_name, :old_value, :new_value, :notes)
+        """, [
+            {
+                'change_source': None, 'field_name': None, 'old_value': None,
+                'new_value': None, 'notes': None, **entry
+            }
+            for entry in entries
+        ])
+        conn.commit()
+
+
 def get_channel_history(managed_channel_id: int, limit: int = 100) -> List[Dict[str, Any]]:
     """Get history for a specific channel."""
     return db_fetch_all("""
@@ -4569,6 +4737,62 @@ def update_channel_sync_status(
     """, (status, notes, channel_id)) > 0
 
 
+def update_channel_sync_status_batch(updates: List[tuple]) -> int:
+    """
+    Update several channels' sync status in one transaction.
+
+    Args:
+        updates: List of (channel_id, status, notes) tuples
+
+    Returns:
+        Number of channels updated
+    """
+    if not updates:
+        return 0
+
+    with db_connection() as conn:
+        cursor = conn.executemany("""
+            UPDATE managed_channels
+            SET sync_status = ?, sync_notes = ?, last_verified_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, [(status, notes, channel_id) for channel_id, status, notes in updates])
+        conn.commit()
+        return cursor.rowcount
+
+
+def mark_channel_sync_failures(errors: List[Dict[str, Any]]) -> int:
+    """
+    Mark managed channels whose deferred Dispatcharr writes failed as drifted.
+
+    The lifecycle records a staged update as done when it's made, so a write
+    that fails when the sync plan is flushed leaves the database ahead of
+    Dispatcharr. Drifted channels are corrected by the next reconciliation.
+
+    Args:
+        errors: ChannelSyncPlan.errors (dicts with the Dispatcharr channel_id,
+            operation and error)
+
+    Returns:
+        Number of channels updated
+    """
+    notes: Dict[int, List[str]] = {}
+    for error in errors:
+        notes.setdefault(error['channel_id'], []).append(
+            f"Dispatcharr update failed ({error.get('operation')}): {error.get('error')}"
+        )
+    if not notes:
+        return 0
+
+    with db_connection() as conn:
+        cursor = conn.executemany("""
+            UPDATE managed_channels
+            SET sync_status = 'drifted', sync_notes = ?, last_verified_at = CURRENT_TIMESTAMP
+            WHERE dispatcharr_channel_id = ? AND deleted_at IS NULL
+        """, [('; '.join(channel_notes), channel_id) for channel_id, channel_notes in notes.items()])
+        conn.commit()
+        return cursor.rowcount
+
+
 # =============================================================================
 # Channel Lifecycle V2 - Parent/Child Group Functions
 # =============================================================================
@@ -5129,3 +5353,181 @@ def get_matched_streams_summary() -> Dict:
             'by_league': by_league,
             'timestamp': timestamp
         }
+
+
+# =============================================================================
+# Process Leases (single elected scheduler across worker processes)
+# =============================================================================
+
+def acquire_process_lease(name: str, owner: str, ttl_seconds: float) -> bool:
+    """
+    Take or renew a named lease.
+
+    The lease is granted if nobody holds it, the caller already holds it, or
+    the holder hasn't renewed it within ttl_seconds (e.g. its process died).
+    Holders must call this again well within ttl_seconds to keep it.
+
+    Args:
+        name: Lease name (e.g., 'scheduler')
+        owner: Unique id of the calling process
+        ttl_seconds: Age after which another owner's lease counts as abandoned
+
+    Returns:
+        True if owner holds the lease after the call
+    """
+    now = time.time()
+    with db_connection() as conn:
+        # Single statement, so two processes can't both take a free lease
+        conn.execute("""
+            INSERT INTO process_leases (name, owner, acquired_at, heartbeat_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET
+                acquired_at = CASE WHEN process_leases.owner = excluded.owner
+                                   THEN process_leases.acquired_at ELSE excluded.acquired_at END,
+                owner = excluded.owner,
+                heartbeat_at = excluded.heartbeat_at
+            WHERE process_leases.owner = excluded.owner OR process_leases.heartbeat_at < ?
+        """, (name, owner, now, now, now - ttl_seconds))
+        conn.commit()
+        row = conn.execute("SELECT owner FROM process_leases WHERE name = ?", (name,)).fetchone()
+        return row is not None and row['owner'] == owner
+
+
+def release_process_lease(name: str, owner: str) -> bool:
+    """Release a lease if owner holds it. Returns True if it was released."""
+    with db_connection() as conn:
+        cursor = conn.execute(
+            "DELETE FROM process_leases WHERE name = ? AND owner = ?",
+            (name, owner)
+        )
+        conn.commit()
+        return cursor.rowcount > 0
+
+
+def get_process_lease(name: str) -> Optional[Dict[str, Any]]:
+    """Get the current holder of a lease (owner, acquired_at, heartbeat_at) or None."""
+    with db_connection() as conn:
+        row = conn.execute("SELECT * FROM process_leases WHERE name = ?", (name,)).fetchone()
+        return dict(row) if row else None
+
+
+# =============================================================================
+# Generation Requests (manual generation queued for the scheduler process)
+# =============================================================================
+
+GENERATION_REQUEST_ACTIVE = ('queued', 'running')
+
+
+def _generation_request_dict(row) -> Dict[str, Any]:
+    request = dict(row)
+    for field in ('progress', 'result'):
+        request[field] = json.loads(request[field]) if request.get(field) else None
+    return request
+
+
+def queue_generation_request(triggered_by: str) -> int:
+    """
+    Queue an EPG generation for the scheduler process.
+
+    Requests coalesce: if one is already queued or running, its ID is
+    returned instead of queueing another.
+
+    Returns:
+        Request ID
+    """
+    with db_connection() as conn:
+        # BEGIN IMMEDIATE so two web workers can't both queue one
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT id FROM generation_requests WHERE status IN (?, ?) ORDER BY id LIMIT 1",
+            GENERATION_REQUEST_ACTIVE
+        ).fetchone()
+        if row:
+            conn.commit()
+            return row['id']
+        cursor = conn.execute(
+            "INSERT INTO generation_requests (triggered_by, status, requested_at) VALUES (?, 'queued', ?)",
+            (triggered_by, time.time())
+        )
+        conn.commit()
+        return cursor.lastrowid
+
+
+def claim_generation_request() -> Optional[Dict[str, Any]]:
+    """Mark the oldest queued request running and return it (None if none are queued)."""
+    with db_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT * FROM generation_requests WHERE status = 'queued' ORDER BY id LIMIT 1"
+        ).fetchone()
+        if row is None:
+            conn.commit()
+            return None
+        conn.execute(
+            "UPDATE generation_requests SET status = 'running', started_at = ? WHERE id = ?",
+            (time.time(), row['id'])
+        )
+        conn.commit()
+    request = _generation_request_dict(row)
+    request['status'] = 'running'
+    return request
+
+
+def update_generation_request(
+    request_id: int,
+    progress: Optional[Dict[str, Any]] = None,
+    status: Optional[str] = None,
+    result: Optional[Dict[str, Any]] = None
+):
+    """
+    Record a request's progress and/or outcome.
+
+    Args:
+        request_id: Generation request ID
+        progress: Latest progress update (status, message, percent, extra)
+        status: New status ('complete' or 'error' also set finished_at)
+        result: generate_all_epg() result
+    """
+    updates, params = [], []
+    if progress is not None:
+        updates.append("progress = ?")
+        params.append(json.dumps(progress, default=str))
+    if status is not None:
+        updates.append("status = ?")
+        params.append(status)
+        if status not in GENERATION_REQUEST_ACTIVE:
+            updates.append("finished_at = ?")
+            params.append(time.time())
+    if result is not None:
+        updates.append("result = ?")
+        params.append(json.dumps(result, default=str))
+    if not updates:
+        return
+    db_execute(f"UPDATE generation_requests SET {', '.join(updates)} WHERE id = ?", tuple(params) + (request_id,))
+
+
+def get_generation_request(request_id: int) -> Optional[Dict[str, Any]]:
+    """Get a generation request (progress and result decoded) or None."""
+    with db_connection() as conn:
+        row = conn.execute("SELECT * FROM generation_requests WHERE id = ?", (request_id,)).fetchone()
+        return _generation_request_dict(row) if row else None
+
+
+def get_latest_generation_request() -> Optional[Dict[str, Any]]:
+    """Get the most recent generation request or None."""
+    with db_connection() as conn:
+        row = conn.execute("SELECT * FROM generation_requests ORDER BY id DESC LIMIT 1").fetchone()
+        return _generation_request_dict(row) if row else None
+
+
+def fail_generation_requests(statuses: tuple, message: str) -> int:
+    """Mark requests in the given statuses as failed (e.g. abandoned by a stopped process)."""
+    placeholders = ', '.join('?' * len(statuses))
+    with db_connection() as conn:
+        cursor = conn.execute(f"""
+            UPDATE generation_requests
+            SET status = 'error', finished_at = ?, result = ?
+            WHERE status IN ({placeholders})
+        """, (time.time(), json.dumps({'success': False, 'error': message})) + tuple(statuses))
+        conn.commit()
+        return cursor.rowcount
@@ -419,6 +419,10 @@ CREATE TABLE IF NOT EXISTS epg_history (
     event_filtered_league_not_enabled INTEGER DEFAULT 0, -- League not enabled
     event_filtered_unsupported_sport INTEGER DEFAULT 0,  -- Unsupported sports
 
+    -- Multi-sport Matchup Memo (added in migration 36)
+    event_matchup_memo_lookups INTEGER DEFAULT 0,        -- Streams checked against the memo
+    event_matchup_memo_hits INTEGER DEFAULT 0,           -- Streams that reused a memoized result
+
     -- Quality/Error Stats
     unresolved_vars_count INTEGER DEFAULT 0,
     coverage_gaps_count INTEGER DEFAULT 0,
@@ -1151,6 +1155,57 @@ CREATE TABLE IF NOT EXISTS epg_matched_streams (
 CREATE INDEX IF NOT EXISTS idx_ems_generation ON epg_matched_streams(generation_id);
 CREATE INDEX IF NOT EXISTS idx_ems_group ON epg_matched_streams(group_id);
 
+-- =============================================================================
+-- ESPN RESPONSE CACHE (v35)
+-- Persistent tier of the ESPN response cache (api/espn_cache.py).
+-- Keyed by request URL; expires_at is a unix epoch (NULL = never expires).
+-- ETag / Last-Modified are kept so expired rows can be revalidated with 304s.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS espn_response_cache (
+    url TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,                  -- 'schedule', 'team_info', 'summary', etc.
+    response_data TEXT NOT NULL,             -- Full JSON response from ESPN
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_erc_expires ON espn_response_cache(expires_at);
+
+-- =============================================================================
+-- PROCESS LEASES (v37)
+-- Named leases held by one process at a time (e.g. 'scheduler': the process
+-- that runs scheduled EPG generation when several workers share the DB).
+-- heartbeat_at is a unix epoch; a lease not renewed within its TTL is taken over.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS process_leases (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    acquired_at REAL NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+
+-- =============================================================================
+-- GENERATION REQUESTS (v38)
+-- Manual/API EPG generations queued by web workers in production mode and run
+-- by the process holding the 'scheduler' lease. progress/result are JSON.
+-- status: queued, running, complete, error
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS generation_requests (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    triggered_by TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    requested_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    progress TEXT,
+    result TEXT
+);
+
 -- =============================================================================
 -- END OF SCHEMA
 -- =============================================================================
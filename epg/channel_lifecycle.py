@@ -12,6 +12,7 @@ EPG Association Flow (matching Dispatcharr's internal pattern):
 5. Call set_channel_epg(channel_id, epg_data_id) to associate
 """
 
+import functools
 import logging
 import threading
 from datetime import datetime, timedelta
@@ -431,6 +432,44 @@ def calculate_delete_time(
         return None
 
 
+def record_sync_plan_errors(plan) -> int:
+    """
+    Mark managed channels whose writes failed when a sync plan was flushed.
+
+    Args:
+        plan: Flushed ChannelSyncPlan (None = nothing was flushed)
+
+    Returns:
+        Number of managed channels marked drifted
+    """
+    if plan is None or not plan.errors:
+        return 0
+    from database import mark_channel_sync_failures
+    marked = mark_channel_sync_failures(plan.errors)
+    logger.warning(f"{len(plan.errors)} Dispatcharr channel write(s) failed - {marked} channel(s) marked drifted")
+    return marked
+
+
+def _deferred_channel_writes(method):
+    """
+    Run a lifecycle step inside a Dispatcharr sync plan.
+
+    Channel updates and profile changes made by the step are diffed and sent
+    as one PATCH per channel when it returns. During an EPG generation the
+    step joins the generation's plan (on the generation thread or a worker
+    bound to it), which is flushed after lifecycle processing. Elsewhere
+    (e.g. a UI action) the step gets its own plan.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.channel_api.begin_sync_plan()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            record_sync_plan_errors(self.channel_api.end_sync_plan())
+    return wrapper
+
+
 class ChannelLifecycleManager:
     """
     Manages channel creation and deletion for event-based EPG.
@@ -1040,11 +1079,13 @@ class ChannelLifecycleManager:
         except Exception as e:
             logger.debug(f"Error syncing settings for channel {existing.get('channel_name')}: {e}")
 
+    @_deferred_channel_writes
     def process_matched_streams(
         self,
         matched_streams: List[Dict],
         group: Dict,
-        template: Optional[Dict] = None
+        template: Optional[Dict] = None,
+        template_engine = None
     ) -> Dict[str, Any]:
         """
         Process matched streams and create/update channels as needed.
@@ -1059,6 +1100,8 @@ class ChannelLifecycleManager:
             matched_streams: List of dicts with 'stream', 'teams', 'event' keys
             group: Event EPG group configuration
             template: Optional event template
+            template_engine: Optional EventTemplateEngine shared with EPG generation
+                for the same group refresh (reuses its per-event variables)
 
         Returns:
             Dict with:
@@ -1081,8 +1124,8 @@ class ChannelLifecycleManager:
         from epg.event_template_engine import EventTemplateEngine
         from utils.keyword_matcher import check_exception_keyword, get_all_exception_keywords
 
-        # Create template engine for channel name resolution
-        template_engine = EventTemplateEngine()
+        # Create template engine for channel name resolution (unless one is shared)
+        template_engine = template_engine or EventTemplateEngine()
 
         # Load global exception keywords (system + user)
         exception_keywords = get_all_exception_keywords()
@@ -1684,6 +1727,7 @@ class ChannelLifecycleManager:
 
         return results
 
+    @_deferred_channel_writes
     def process_child_group_streams(
         self,
         child_group: Dict,
@@ -1837,6 +1881,7 @@ class ChannelLifecycleManager:
 
         return results
 
+    @_deferred_channel_writes
     def enforce_stream_keyword_placement(self) -> Dict[str, Any]:
         """
         Enforce correct stream placement based on exception keywords.
@@ -2009,6 +2054,7 @@ class ChannelLifecycleManager:
 
         return results
 
+    @_deferred_channel_writes
     def enforce_keyword_channel_ordering(self) -> Dict[str, Any]:
         """
         Ensure keyword (sub-consolidated) channels come AFTER the main channel for the same event.
@@ -2094,6 +2140,7 @@ class ChannelLifecycleManager:
 
         return results
 
+    @_deferred_channel_writes
     def enforce_cross_group_consolidation(self) -> Dict[str, Any]:
         """
         Consolidate multi-sport group channels into single-league group channels.
@@ -2251,6 +2298,7 @@ class ChannelLifecycleManager:
 
         return results
 
+    @_deferred_channel_writes
     def cleanup_deleted_streams(
         self,
         group: Dict,
@@ -2745,6 +2793,7 @@ class ChannelLifecycleManager:
 
         return results
 
+    @_deferred_channel_writes
     def reassign_group_channels(self, group: Dict) -> Dict[str, Any]:
         """
         Reassign ALL channels in a group to their correct range.
@@ -2857,6 +2906,13 @@ class ChannelLifecycleManager:
             # Always reassign to compact channels at start of range
             # Check if channel is already at the correct position
             if current_number == next_number:
+                # Still staged: the sync plan drops it if Dispatcharr agrees
+                # and corrects the channel if its number drifted there
+                with self._dispatcharr_lock:
+                    self.channel_api.update_channel(
+                        channel['dispatcharr_channel_id'],
+                        {'channel_number': current_number}
+                    )
                 logger.debug(f"Channel {current_number} already at correct position")
                 results['already_correct'].append({
                     'channel_id': channel['dispatcharr_channel_id'],
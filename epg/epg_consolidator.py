@@ -328,11 +328,32 @@ def finalize_epg_generation(final_output_path: str = None) -> Dict[str, Any]:
     # Archive them
     archived = archive_intermediate_files(files_to_archive)
 
+    # Drop fragment indexes for groups that no longer produce a file
+    # (indexes of archived files are kept for the next cycle to reuse)
+    from epg.xmltv_fragments import remove_orphaned_indexes
+    indexes_deleted = remove_orphaned_indexes(data_dir)
+
+    # Precompress the final guide so the first poll after generation doesn't
+    # have to; archived event files no longer need their compressed copies
+    from epg.precompressed import publish, remove_published
+    for event_file in event_files:
+        remove_published(event_file)
+    published = publish(paths['combined'])
+
+    # Build the dashboard stats index now rather than on the first poll
+    from epg.epg_index import get_epg_index
+    try:
+        get_epg_index(paths['combined'])
+    except Exception as e:
+        logger.warning(f"Could not build EPG stats index: {e}")
+
     logger.info(f"Finalized EPG: archived {archived} event files, cleaned {old_deleted} old archives")
 
     return {
         'files_archived': archived,
-        'old_archives_deleted': old_deleted
+        'old_archives_deleted': old_deleted,
+        'indexes_deleted': indexes_deleted,
+        'etag': published.etag if published else None
     }
 
 
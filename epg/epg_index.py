@@ -0,0 +1,310 @@
+"""
+EPG Stats Index - compact summary of the merged guide for dashboard endpoints.
+
+/api/epg-stats/live used to ET.parse the whole teamarr.xml on every dashboard
+poll and strptime every programme's times. The EPG management page's
+content analysis walked every programme again to find gaps and unreplaced
+{variables}.
+
+The guide only changes when it's regenerated, so its summary is built once:
+- game programmes (teamarr:*-event metadata, deduplicated by channel+start+stop)
+  as (start, stop, type, channel, title), sorted by start epoch
+- the content analysis (channels, programme count, coverage gaps, unreplaced
+  variables, date range)
+
+The summary is saved next to the guide (<guide>.stats) and kept in memory.
+It is valid for the guide's size/mtime and rebuilt when the file changes.
+Time-window queries are bisect lookups on the sorted start times.
+
+Usage:
+    from epg.epg_index import get_epg_index
+
+    index = get_epg_index('/app/data/teamarr.xml')
+    for start_ts, stop_ts, stat_key, channel, title in index.games_between(day_start, day_end):
+        ...
+"""
+
+import calendar
+import copy
+import json
+import logging
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from epg.xmltv_writer import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index layout changes
+INDEX_VERSION = 1
+
+INDEX_SUFFIX = '.stats'
+
+_VARIABLE_RE = re.compile(r'\{[^}]+\}')
+
+# (start_ts, stop_ts, stat_key, channel, title) - stat_key is 'team' or 'event'
+Game = Tuple[float, float, str, str, str]
+
+
+@dataclass
+class EPGIndex:
+    """Summary of one version of the merged guide."""
+    size: int
+    mtime_ns: int
+    analysis: Dict[str, Any]
+    games: List[Game]                                      # Sorted by start_ts
+    _starts: List[float] = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        self._starts = [game[0] for game in self.games]
+
+    def games_between(self, start_ts: float, end_ts: float) -> List[Game]:
+        """Games starting in [start_ts, end_ts)."""
+        return self.games[bisect_left(self._starts, start_ts):bisect_left(self._starts, end_ts)]
+
+    def get_analysis(self) -> Dict[str, Any]:
+        """Copy of the content analysis (callers may modify it)."""
+        return copy.deepcopy(self.analysis)
+
+
+def parse_xmltv_epoch(time_str: str) -> Optional[float]:
+    """
+    Parse an XMLTV time ("YYYYMMDDHHmmss +ZZZZ") to a unix timestamp.
+
+    Returns:
+        Epoch seconds, or None if the value isn't a valid XMLTV time
+    """
+    if not time_str:
+        return None
+    parts = time_str.split()
+    dt_str = parts[0]
+    tz_str = parts[1] if len(parts) > 1 else '+0000'
+    if len(dt_str) != 14 or not dt_str.isdigit():
+        return None
+    try:
+        # Validate the calendar date (timegm would silently normalize Feb 30)
+        wall = datetime(int(dt_str[0:4]), int(dt_str[4:6]), int(dt_str[6:8]),
+                        int(dt_str[8:10]), int(dt_str[10:12]), int(dt_str[12:14]))
+        tz_sign = 1 if tz_str[0] == '+' else -1
+        offset = tz_sign * (int(tz_str[1:3]) * 3600 + int(tz_str[3:5]) * 60)
+    except (ValueError, IndexError):
+        return None
+    return calendar.timegm(wall.timetuple()) - offset
+
+
+def _analyze(root: ET.Element) -> Dict[str, Any]:
+    """Content analysis shown on the EPG management page."""
+    analysis = {
+        'total_programs': 0,
+        'total_events': 0,
+        'filler_programs': {
+            'pregame': 0,
+            'postgame': 0,
+            'idle': 0
+        },
+        'unreplaced_variables': [],
+        'channels': len(root.findall('channel')),
+        'coverage_gaps': [],
+        'date_range': None
+    }
+
+    programs = root.findall('.//programme')
+    analysis['total_programs'] = len(programs)
+
+    # Track program times per channel for gap detection
+    seen_variables = set()
+    channel_programs: Dict[str, List[Dict[str, str]]] = {}
+
+    for programme in programs:
+        title_elem = programme.find('title')
+        desc_elem = programme.find('desc')
+        title = title_elem.text if title_elem is not None else ''
+        desc = desc_elem.text if desc_elem is not None else ''
+
+        # Check for unreplaced variables in title and description
+        for text in (title, desc):
+            if text:
+                for var in _VARIABLE_RE.findall(text):
+                    if var not in seen_variables:
+                        seen_variables.add(var)
+                        analysis['unreplaced_variables'].append(var)
+
+        channel_programs.setdefault(programme.get('channel', ''), []).append({
+            'start': programme.get('start', ''),
+            'stop': programme.get('stop', ''),
+            'title': title
+        })
+
+    # Detect coverage gaps (programs that don't connect properly)
+    for channel, progs in channel_programs.items():
+        progs_sorted = sorted(progs, key=lambda x: x['start'])
+        for current, following in zip(progs_sorted, progs_sorted[1:]):
+            if current['stop'] == following['start']:
+                continue
+            try:
+                # Wall-clock difference (format: YYYYMMDDHHMMSS +0000)
+                stop_time = datetime.strptime(current['stop'][:14], '%Y%m%d%H%M%S')
+                start_time = datetime.strptime(following['start'][:14], '%Y%m%d%H%M%S')
+            except ValueError:
+                continue
+            gap_minutes = (start_time - stop_time).total_seconds() / 60
+
+            # Only report gaps > 1 minute (to avoid floating point rounding)
+            if gap_minutes > 1:
+                analysis['coverage_gaps'].append({
+                    'channel': channel,
+                    'gap_minutes': int(gap_minutes),
+                    'after_program': current['title'],
+                    'after_stop': current['stop'],
+                    'before_program': following['title'],
+                    'before_start': following['start']
+                })
+
+    if programs:
+        analysis['date_range'] = {
+            'start': min(p.get('start', '') for p in programs)[:8],  # YYYYMMDD
+            'end': max(p.get('stop', '') for p in programs)[:8]
+        }
+
+    return analysis
+
+
+def _extract_games(root: ET.Element) -> List[Game]:
+    """Game programmes (teamarr event metadata), deduplicated and sorted by start."""
+    games = []
+    # Same event from different groups has the same channel+start+stop
+    seen_programmes = set()
+
+    for programme in root.iter('programme'):
+        teamarr_type = None
+        for child in programme:
+            if child.tag is ET.Comment:
+                comment_text = child.text or ''
+                if comment_text.startswith('teamarr:'):
+                    teamarr_type = comment_text[8:]
+                    break
+
+        # Skip if no teamarr metadata or if it's filler
+        if not teamarr_type or 'filler' in teamarr_type:
+            continue
+
+        start_str = programme.get('start')
+        stop_str = programme.get('stop')
+        channel_id = programme.get('channel', '')
+
+        prog_key = (channel_id, start_str, stop_str)
+        if prog_key in seen_programmes:
+            continue
+        seen_programmes.add(prog_key)
+
+        start_ts = parse_xmltv_epoch(start_str)
+        stop_ts = parse_xmltv_epoch(stop_str)
+        if start_ts is None or stop_ts is None:
+            continue
+
+        title_elem = programme.find('title')
+        games.append((
+            start_ts,
+            stop_ts,
+            'team' if teamarr_type == 'teams-event' else 'event',
+            channel_id,
+            title_elem.text if title_elem is not None else ''
+        ))
+
+    games.sort(key=lambda game: game[0])
+    return games
+
+
+def build_epg_index(epg_path: str) -> EPGIndex:
+    """
+    Parse the guide once and build its summary.
+
+    Raises:
+        OSError: If the guide can't be read
+        ET.ParseError: If the guide isn't valid XML
+    """
+    st = os.stat(epg_path)
+    # Comments enabled to read teamarr metadata
+    parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
+    root = ET.parse(epg_path, parser).getroot()
+    return EPGIndex(st.st_size, st.st_mtime_ns, _analyze(root), _extract_games(root))
+
+
+def _load_sidecar(epg_path: str, st: os.stat_result) -> Optional[EPGIndex]:
+    try:
+        with open(epg_path + INDEX_SUFFIX, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (data.get('version') != INDEX_VERSION or data.get('size') != st.st_size
+            or data.get('mtime_ns') != st.st_mtime_ns):
+        return None
+    return EPGIndex(st.st_size, st.st_mtime_ns, data['analysis'], [tuple(game) for game in data['games']])
+
+
+def _save_sidecar(epg_path: str, index: EPGIndex):
+    try:
+        with atomic_write(epg_path + INDEX_SUFFIX) as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'size': index.size,
+                'mtime_ns': index.mtime_ns,
+                'analysis': index.analysis,
+                'games': index.games,
+            }, f)
+    except OSError as e:
+        logger.warning(f"Could not write EPG stats index for {epg_path}: {e}")
+
+
+# epg_path -> index of the guide's last seen version
+_memory_cache: Dict[str, EPGIndex] = {}
+_cache_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+
+def _matches(index: Optional[EPGIndex], st: os.stat_result) -> bool:
+    return index is not None and index.size == st.st_size and index.mtime_ns == st.st_mtime_ns
+
+
+def get_epg_index(epg_path: str, rebuild: bool = False) -> Optional[EPGIndex]:
+    """
+    Get the summary of the current guide, rebuilding it only if the file changed.
+
+    Args:
+        epg_path: Path to the merged guide (teamarr.xml)
+        rebuild: Build (and save) even if the sidecar looks current
+
+    Returns:
+        EPGIndex, or None if the guide doesn't exist
+    """
+    try:
+        st = os.stat(epg_path)
+    except OSError:
+        return None
+
+    with _cache_lock:
+        index = _memory_cache.get(epg_path)
+    if not rebuild and _matches(index, st):
+        return index
+
+    # One build at a time - concurrent dashboard polls wait for it instead of parsing too
+    with _build_lock:
+        with _cache_lock:
+            index = _memory_cache.get(epg_path)
+        if rebuild or not _matches(index, st):
+            index = None if rebuild else _load_sidecar(epg_path, st)
+            if index is None:
+                index = build_epg_index(epg_path)
+                _save_sidecar(epg_path, index)
+                logger.debug(f"Built EPG stats index: {len(index.games)} games, "
+                             f"{index.analysis['total_programs']} programmes")
+            with _cache_lock:
+                _memory_cache[epg_path] = index
+    return index
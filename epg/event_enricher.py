@@ -38,7 +38,7 @@ class EventEnricher:
     and produces a fully-enriched event dict with consistent structure.
 
     Caching:
-    - Scoreboard data cached by (league, date) - cleared per generation
+    - Scoreboard data read from ESPNClient's shared (prefetched) snapshot
     - Enriched events cached by event_id - cleared per generation
     - Team stats uses ESPNClient's built-in 6-hour cache
     """
@@ -55,14 +55,13 @@ class EventEnricher:
         self.db_connection_func = db_connection_func
 
         # Caches (cleared per generation)
-        self._scoreboard_cache: Dict[str, Dict] = {}  # key: "sport:league:YYYYMMDD"
+        # Scoreboards are read from ESPNClient's shared, prefetched snapshot
         self._enriched_events: Dict[str, Dict] = {}   # key: event_id
 
         # League config cache
         self._league_config_cache: Dict[str, Dict] = {}
 
         # Thread safety
-        self._scoreboard_lock = threading.Lock()
         self._enriched_lock = threading.Lock()
 
     # =========================================================================
@@ -71,8 +70,6 @@ class EventEnricher:
 
     def clear_caches(self):
         """Clear all caches. Call at start of EPG generation."""
-        with self._scoreboard_lock:
-            self._scoreboard_cache.clear()
         with self._enriched_lock:
             self._enriched_events.clear()
         self._league_config_cache.clear()
@@ -80,7 +77,10 @@ class EventEnricher:
 
     def _get_scoreboard_cached(self, sport: str, league: str, date_str: str) -> Optional[Dict]:
         """
-        Get scoreboard with caching.
+        Get scoreboard from the generation-wide snapshot.
+
+        Reads ESPNClient's shared scoreboard cache (pre-filled by the
+        scoreboard prefetch plan); dates outside the plan are fetched on first use.
 
         Args:
             sport: Sport type (e.g., 'football')
@@ -90,25 +90,7 @@ class EventEnricher:
         Returns:
             Scoreboard data dict or None
         """
-        cache_key = f"{sport}:{league}:{date_str}"
-
-        # Fast path: check cache without lock
-        if cache_key in self._scoreboard_cache:
-            return self._scoreboard_cache[cache_key]
-
-        # Slow path: acquire lock
-        with self._scoreboard_lock:
-            # Double-check after lock
-            if cache_key in self._scoreboard_cache:
-                return self._scoreboard_cache[cache_key]
-
-            # Fetch from ESPN
-            scoreboard_data = self.espn.get_scoreboard(sport, league, date_str)
-
-            # Cache result (even None to avoid re-fetching failures)
-            self._scoreboard_cache[cache_key] = scoreboard_data
-
-            return scoreboard_data
+        return self.espn.get_scoreboard(sport, league, date_str)
 
     def _get_league_config(self, league_code: str) -> Optional[Dict]:
         """Get league configuration with caching."""
@@ -5,6 +5,8 @@ Generates XMLTV files for streams matched to ESPN events.
 Reuses core XMLTV formatting from the team-based generator.
 """
 
+import io
+import itertools
 import os
 import logging
 from datetime import datetime, timedelta, timezone
@@ -12,6 +14,8 @@ from typing import List, Dict, Any, Optional
 from zoneinfo import ZoneInfo
 
 from epg.xmltv_generator import XMLTVGenerator
+from epg.xmltv_fragments import get_fragment_index
+from epg.xmltv_writer import XML_DECLARATION, XMLTV_DOCTYPE, atomic_write, write_xmltv, write_xmltv_serialized
 from epg.event_template_engine import EventTemplateEngine, build_event_context
 
 logger = logging.getLogger(__name__)
@@ -38,18 +42,20 @@ class EventEPGGenerator:
         'soccer': 2.0,
     }
 
-    def __init__(self, timezone: str = 'America/Detroit'):
+    def __init__(self, timezone: str = 'America/Detroit', template_engine: Optional[EventTemplateEngine] = None):
         """
         Initialize Event EPG Generator.
 
         Args:
             timezone: Default timezone for display (IANA format)
+            template_engine: Optional engine shared with channel creation for the
+                same group refresh (reuses its per-event variables)
         """
         self.timezone = timezone
         # Reuse XMLTVGenerator for formatting helpers only
         # Watermarking is handled by the consolidator
         self._xmltv = XMLTVGenerator()
-        self._template_engine = EventTemplateEngine()
+        self._template_engine = template_engine or EventTemplateEngine()
 
     def _get_event_duration(
         self,
@@ -230,11 +236,10 @@ class EventEPGGenerator:
                     epg_start_datetime, days_ahead, exception_keyword
                 )
 
-        # Convert to pretty XML
-        xml_str = self._xmltv._prettify(tv)
-        xml_with_doctype = self._xmltv._add_doctype(xml_str)
-
-        return xml_with_doctype
+        # Serialize with declaration and DOCTYPE (element by element, no DOM re-parse)
+        out = io.StringIO()
+        write_xmltv(out, tv.attrib, tv)
+        return out.getvalue()
 
     def _get_channel_id(self, stream: Dict, event: Dict = None) -> str:
         """
@@ -956,7 +961,8 @@ def generate_event_epg(
     data_dir: str = None,
     settings: Dict = None,
     template: Dict = None,
-    epg_start_datetime: Optional[datetime] = None
+    epg_start_datetime: Optional[datetime] = None,
+    template_engine: Optional[EventTemplateEngine] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to generate event EPG.
@@ -969,6 +975,7 @@ def generate_event_epg(
         settings: Optional settings dict (for timezone, etc.)
         template: Optional event template for customizing programme content
         epg_start_datetime: Optional EPG start datetime (for filler spanning multiple days)
+        template_engine: Optional EventTemplateEngine shared with channel creation
 
     Returns:
         Dict with:
@@ -982,7 +989,7 @@ def generate_event_epg(
         - postgame_count: int (postgame filler programmes)
     """
     try:
-        generator = EventEPGGenerator()
+        generator = EventEPGGenerator(template_engine=template_engine)
 
         xml_content = generator.generate(
             matched_streams,
@@ -1047,6 +1054,10 @@ def merge_xmltv_files(
     Combines channels and programmes from multiple sources,
     removing duplicates by channel ID.
 
+    Each file's channels/programmes come pre-serialized from its fragment
+    index (see epg/xmltv_fragments.py), so only files whose contents changed
+    since the last merge are parsed.
+
     Args:
         file_paths: List of XMLTV file paths to merge
         output_path: Path for merged output file
@@ -1056,14 +1067,14 @@ def merge_xmltv_files(
         Dict with success status and stats
     """
     import xml.etree.ElementTree as ET
-    from xml.dom import minidom
     from config import VERSION
 
     try:
-        # Create root element
-        tv = ET.Element('tv')
-        tv.set('generator-info-name', generator_name)
-        tv.set('generator-info-url', 'https://github.com/egyptiangio/teamarr')
+        # Root element attributes
+        tv_attrib = {
+            'generator-info-name': generator_name,
+            'generator-info-url': 'https://github.com/egyptiangio/teamarr',
+        }
 
         # Collect all channels and programmes separately first
         # XMLTV spec requires all <channel> elements before all <programme> elements
@@ -1071,6 +1082,7 @@ def merge_xmltv_files(
         seen_programmes = set()  # Track (channel, start, stop) to dedupe programmes
         all_channels = []
         all_programmes = []
+        reparsed_count = 0
 
         for file_path in file_paths:
             if not os.path.exists(file_path):
@@ -1078,76 +1090,53 @@ def merge_xmltv_files(
                 continue
 
             try:
-                # Parse with comments enabled to preserve teamarr metadata
-                parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
-                tree = ET.parse(file_path, parser)
-                root = tree.getroot()
-
-                # Collect channels (skip duplicates)
-                for channel in root.findall('channel'):
-                    channel_id = channel.get('id')
-                    if channel_id and channel_id not in seen_channels:
-                        all_channels.append(channel)
-                        seen_channels.add(channel_id)
-
-                # Collect programmes (skip duplicates by channel+start+stop)
-                for programme in root.findall('programme'):
-                    prog_key = (
-                        programme.get('channel', ''),
-                        programme.get('start', ''),
-                        programme.get('stop', '')
-                    )
-                    if prog_key not in seen_programmes:
-                        all_programmes.append(programme)
-                        seen_programmes.add(prog_key)
-
-            except ET.ParseError as e:
+                index, reparsed = get_fragment_index(file_path)
+                reparsed_count += reparsed
+            except (ET.ParseError, OSError) as e:
                 logger.warning(f"Error parsing {file_path}: {e}")
                 continue
 
-        # Add all channels first, then all programmes (per XMLTV spec)
-        for channel in all_channels:
-            tv.append(channel)
-        for programme in all_programmes:
-            tv.append(programme)
+            # Collect channels (skip duplicates)
+            for channel_id, channel_xml in index.channels:
+                if channel_id and channel_id not in seen_channels:
+                    all_channels.append(channel_xml)
+                    seen_channels.add(channel_id)
 
-        total_programmes = len(all_programmes)
-
-        # Convert to pretty XML
-        rough_string = ET.tostring(tv, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        pretty = reparsed.toprettyxml(indent='  ')
+            # Collect programmes (skip duplicates by channel+start+stop)
+            for channel_id, start, stop, programme_xml in index.programmes:
+                prog_key = (channel_id, start, stop)
+                if prog_key not in seen_programmes:
+                    all_programmes.append(programme_xml)
+                    seen_programmes.add(prog_key)
 
-        # Clean up XML
-        lines = [line for line in pretty.split('\n') if line.strip()]
-        if lines and lines[0].startswith('<?xml'):
-            lines = lines[1:]
-        xml_str = '\n'.join(lines)
+        total_programmes = len(all_programmes)
 
-        # Add declaration, watermark, and doctype
-        declaration = '<?xml version="1.0" encoding="UTF-8"?>'
+        # Declaration, watermark, and doctype
         watermark = (
             '<!--\n'
             f'  Generated with Teamarr v{VERSION} - Dynamic EPG Generator for Sports Channels\n'
             '  https://github.com/egyptiangio/teamarr\n'
             '-->'
         )
-        doctype = '<!DOCTYPE tv SYSTEM "xmltv.dtd">'
-        final_xml = f"{declaration}\n{watermark}\n{doctype}\n{xml_str}"
+        header = f"{XML_DECLARATION}\n{watermark}\n{XMLTV_DOCTYPE}"
 
-        # Write output
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(final_xml)
+        # Stream all channels first, then all programmes (per XMLTV spec) to a
+        # temp file, then rename over the output so readers never see a partial guide
+        with atomic_write(output_path) as f:
+            write_xmltv_serialized(f, tv_attrib, itertools.chain(all_channels, all_programmes), header)
 
-        logger.info(f"Merged {len(file_paths)} files -> {output_path} ({len(seen_channels)} channels, {total_programmes} programmes)")
+        logger.info(
+            f"Merged {len(file_paths)} files -> {output_path} ({len(seen_channels)} channels, "
+            f"{total_programmes} programmes, {reparsed_count} files re-parsed)"
+        )
 
         return {
             'success': True,
             'output_path': output_path,
             'channel_count': len(seen_channels),
             'programme_count': total_programmes,
-            'files_merged': len([f for f in file_paths if os.path.exists(f)])
+            'files_merged': len([f for f in file_paths if os.path.exists(f)]),
+            'files_reparsed': reparsed_count
         }
 
     except Exception as e:
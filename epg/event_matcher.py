@@ -79,11 +79,6 @@ class EventMatcher:
         # Cache for league config
         self._league_config: Dict[str, Dict] = {}
 
-        # Scoreboard cache: key = "sport:league:YYYYMMDD" → scoreboard data
-        # Thread-safe with double-checked locking
-        self._scoreboard_cache: Dict[str, Optional[Dict]] = {}
-        self._scoreboard_cache_lock = threading.Lock()
-
         # Counters for monitoring scoreboard-first effectiveness
         self._scoreboard_hits = 0
         self._scoreboard_misses = 0
@@ -94,11 +89,6 @@ class EventMatcher:
         """Get league configuration (sport, api_path) using shared module."""
         return get_league_config(league_code, self.db_connection_func, self._league_config)
 
-    def clear_scoreboard_cache(self):
-        """Clear scoreboard cache. Call at start of each EPG generation."""
-        with self._scoreboard_cache_lock:
-            self._scoreboard_cache.clear()
-
     def get_matching_stats(self) -> Dict[str, int]:
         """
         Get scoreboard-first matching statistics.
@@ -124,7 +114,10 @@ class EventMatcher:
 
     def _get_scoreboard_cached(self, sport: str, api_league: str, date_str: str) -> Optional[Dict]:
         """
-        Get scoreboard data with thread-safe caching.
+        Get scoreboard data from the generation-wide snapshot.
+
+        Reads ESPNClient's shared scoreboard cache (pre-filled by the
+        scoreboard prefetch plan); dates outside the plan are fetched on first use.
 
         Args:
             sport: Sport name (e.g., 'soccer', 'football')
@@ -134,27 +127,11 @@ class EventMatcher:
         Returns:
             Scoreboard data dict or None if fetch failed
         """
-        cache_key = f"{sport}:{api_league}:{date_str}"
-
-        # Fast path: check without lock
-        if cache_key in self._scoreboard_cache:
-            return self._scoreboard_cache[cache_key]
-
-        # Slow path: acquire lock and fetch
-        with self._scoreboard_cache_lock:
-            # Double-check after acquiring lock
-            if cache_key in self._scoreboard_cache:
-                return self._scoreboard_cache[cache_key]
-
-            # Fetch from API
-            try:
-                scoreboard_data = self.espn.get_scoreboard(sport, api_league, date_str)
-                self._scoreboard_cache[cache_key] = scoreboard_data
-                return scoreboard_data
-            except Exception as e:
-                logger.warning(f"Error fetching scoreboard for {cache_key}: {e}")
-                self._scoreboard_cache[cache_key] = None
-                return None
+        try:
+            return self.espn.get_scoreboard(sport, api_league, date_str)
+        except Exception as e:
+            logger.warning(f"Error fetching scoreboard for {sport}:{api_league}:{date_str}: {e}")
+            return None
 
     def _filter_matching_events(
         self,
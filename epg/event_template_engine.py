@@ -14,11 +14,17 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 
+from epg.template_engine import compile_template
 from utils import to_pascal_case
 from utils.time_format import format_time as fmt_time, get_time_settings
 
 logger = logging.getLogger(__name__)
 
+# Matches {variable_name} (no .next/.last suffixes for events)
+EVENT_VARIABLE_PATTERN = re.compile(r'\{([a-z_][a-z0-9_]*)\}', re.IGNORECASE)
+
+_MULTIPLE_SPACES = re.compile(r'  +')
+
 
 class EventTemplateEngine:
     """
@@ -28,12 +34,17 @@ class EventTemplateEngine:
     perspective-based (team/opponent) like the team-based engine.
     """
 
-    def __init__(self):
-        pass
-
     # Variables that should be gracefully removed with surrounding chars when empty
     OPTIONAL_VARS = {'exception_keyword', 'exception_keyword_title'}
 
+    def __init__(self):
+        # Event-level variables, keyed by _event_cache_key().
+        # An engine serves one group refresh (EPG, fillers and channel names),
+        # so this holds the group's unique events for one generation.
+        self._event_variables: Dict[tuple, tuple] = {}  # key -> (event, variables)
+        # (template, empty optional vars) -> compiled template with those vars removed
+        self._compiled: Dict[tuple, Any] = {}
+
     def resolve(self, template: str, context: Dict[str, Any]) -> str:
         """
         Resolve all template variables in a string.
@@ -51,40 +62,51 @@ class EventTemplateEngine:
         # Build all variables from context
         variables = self._build_variable_dict(context)
 
-        # First pass: Remove optional variables with their surrounding brackets/parens when empty
-        # Pattern matches: (optional_var), [optional_var], or just the var with surrounding spaces
-        for var_name in self.OPTIONAL_VARS:
-            var_value = variables.get(var_name, '')
-            if not var_value:
+        empty_optional = frozenset(
+            var_name for var_name in self.OPTIONAL_VARS if not variables.get(var_name, '')
+        )
+        result = self._compile(template, empty_optional).render(variables)
+
+        # Clean up any double spaces left behind
+        return _MULTIPLE_SPACES.sub(' ', result).strip()
+
+    def _compile(self, template: str, empty_optional: frozenset):
+        """
+        Compile a template for one combination of empty optional variables.
+
+        Args:
+            template: Template string
+            empty_optional: Optional variables that are empty for this context
+
+        Returns:
+            CompiledTemplate of the template with those variables removed
+        """
+        key = (template, empty_optional)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            # First pass: Remove optional variables with their surrounding brackets/parens when empty
+            # Pattern matches: (optional_var), [optional_var], or just the var with surrounding spaces
+            stripped = template
+            for var_name in sorted(empty_optional):
                 # Remove patterns like "({var})" or "( {var} )" or "[ {var} ]" etc.
-                template = re.sub(
+                stripped = re.sub(
                     r'\s*[\(\[]\s*\{' + var_name + r'\}\s*[\)\]]\s*',
                     '',
-                    template,
+                    stripped,
                     flags=re.IGNORECASE
                 )
                 # Also remove standalone " - {var}" or " {var}" patterns
-                template = re.sub(
+                stripped = re.sub(
                     r'\s*[-–—]\s*\{' + var_name + r'\}',
                     '',
-                    template,
+                    stripped,
                     flags=re.IGNORECASE
                 )
 
-        # Second pass: Replace all remaining {variable} patterns
-        pattern = r'\{([a-z_][a-z0-9_]*)\}'
-
-        def replace_variable(match):
-            var_name = match.group(1)
-            var_value = variables.get(var_name, '')
-            return str(var_value)
-
-        result = re.sub(pattern, replace_variable, template, flags=re.IGNORECASE)
-
-        # Clean up any double spaces left behind
-        result = re.sub(r'  +', ' ', result).strip()
-
-        return result
+            # Second pass (at render): Replace all remaining {variable} patterns
+            compiled = compile_template(stripped, EVENT_VARIABLE_PATTERN)
+            self._compiled[key] = compiled
+        return compiled
 
     def _build_variable_dict(self, context: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -96,6 +118,59 @@ class EventTemplateEngine:
                 - stream: Dispatcharr stream info
                 - group_info: Event EPG group configuration
 
+        Returns:
+            Dictionary of variable_name: value pairs
+        """
+        key = self._event_cache_key(context)
+        cached = self._event_variables.get(key) if key is not None else None
+        if cached is not None:
+            variables = cached[1]
+        else:
+            variables = self._build_event_variables(context)
+            if key is not None:
+                # Keep the event alive so its id() in the key can't be reused
+                self._event_variables[key] = (context['event'], variables)
+
+        return {**variables, **self._build_stream_variables(context)}
+
+    def _event_cache_key(self, context: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Key of everything the event-level variables depend on.
+
+        Streams of the same event share the event dict, so the key uses its
+        identity. Live fields are included because postgame enrichment updates
+        status and scores in place.
+
+        Returns:
+            Hashable key, or None if the event has no ID (not cached)
+        """
+        event = context.get('event', {}) or {}
+        if not event.get('id'):
+            return None
+
+        group_info = context.get('group_info', {}) or {}
+        time_format_settings = context.get('time_format_settings', {})
+        home_team = event.get('home_team', {}) or {}
+        away_team = event.get('away_team', {}) or {}
+        return (
+            event['id'],
+            id(event),
+            group_info.get('assigned_sport', ''),
+            group_info.get('assigned_league', ''),
+            context.get('epg_timezone', 'America/Detroit'),
+            get_time_settings(time_format_settings) if time_format_settings else None,
+            repr(event.get('status')),
+            repr(home_team.get('score')),
+            repr(away_team.get('score')),
+        )
+
+    def _build_stream_variables(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build the variables that differ between streams of the same event.
+
+        Args:
+            context: Event context (see _build_variable_dict)
+
         Returns:
             Dictionary of variable_name: value pairs
         """
@@ -103,6 +178,45 @@ class EventTemplateEngine:
 
         event = context.get('event', {}) or {}
         stream = context.get('stream', {}) or {}
+
+        # =====================================================================
+        # STREAM INFO
+        # =====================================================================
+
+        variables['stream_name'] = stream.get('name', '')
+        variables['stream_id'] = str(stream.get('id', ''))
+
+        # Channel ID (tvg_id) - use ESPN event ID for consistency with channel creation
+        # Format: teamarr-event-{espn_event_id}
+        if event.get('id'):
+            variables['channel_id'] = f"teamarr-event-{event['id']}"
+        else:
+            variables['channel_id'] = stream.get('tvg_id') or f"event-{stream.get('id', 'unknown')}"
+
+        # =====================================================================
+        # EXCEPTION KEYWORD (for sub-consolidation)
+        # =====================================================================
+
+        exception_keyword = context.get('exception_keyword', '')
+        variables['exception_keyword'] = exception_keyword or ''
+        # Title case version for display (e.g., "Prime Vision")
+        variables['exception_keyword_title'] = exception_keyword.title() if exception_keyword else ''
+
+        return variables
+
+    def _build_event_variables(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build the variables that depend only on the event, group and settings.
+
+        Args:
+            context: Event context (see _build_variable_dict)
+
+        Returns:
+            Dictionary of variable_name: value pairs
+        """
+        variables = {}
+
+        event = context.get('event', {}) or {}
         group_info = context.get('group_info', {}) or {}
         epg_timezone = context.get('epg_timezone', 'America/Detroit')
         time_format_settings = context.get('time_format_settings', {})
@@ -485,29 +599,6 @@ class EventTemplateEngine:
         weather = event.get('weather', {}) or {}
         variables['weather'] = weather.get('display', '')
 
-        # =====================================================================
-        # STREAM INFO
-        # =====================================================================
-
-        variables['stream_name'] = stream.get('name', '')
-        variables['stream_id'] = str(stream.get('id', ''))
-
-        # Channel ID (tvg_id) - use ESPN event ID for consistency with channel creation
-        # Format: teamarr-event-{espn_event_id}
-        if event.get('id'):
-            variables['channel_id'] = f"teamarr-event-{event['id']}"
-        else:
-            variables['channel_id'] = stream.get('tvg_id') or f"event-{stream.get('id', 'unknown')}"
-
-        # =====================================================================
-        # EXCEPTION KEYWORD (for sub-consolidation)
-        # =====================================================================
-
-        exception_keyword = context.get('exception_keyword', '')
-        variables['exception_keyword'] = exception_keyword or ''
-        # Title case version for display (e.g., "Prime Vision")
-        variables['exception_keyword_title'] = exception_keyword.title() if exception_keyword else ''
-
         return variables
 
     def select_description(self, description_options: Any, context: Dict[str, Any]) -> str:
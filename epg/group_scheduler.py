@@ -0,0 +1,120 @@
+"""
+Event Group Scheduler - process event EPG groups concurrently.
+
+Groups used to be processed one after another, so one slow group (a
+4,000-stream soccer group) held up every group behind it. Fetching and
+matching streams only touches the group's own data, so it can overlap with
+other groups. What has to stay ordered is everything that touches shared
+state: channel numbering (AUTO ranges depend on earlier groups' stream
+counts), channel creation, child groups adding streams to their parent's
+channels, and multi-sport overlap checks against other groups' channels.
+
+GroupTurns keeps that part in processing order: each group waits for its
+turn (all earlier groups finished) before its ordered section, and holds the
+turn until it returns. Groups that need other groups' channels while
+matching (multi-sport) take their turn before starting.
+
+Stream matching for all running groups shares one worker pool, so
+concurrency doesn't multiply the number of matching threads.
+
+Usage:
+    from epg.group_scheduler import run_event_groups
+
+    for index, group, result, error in run_event_groups(groups, process_group):
+        ...
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Groups processed at the same time
+EVENT_GROUP_WORKERS = 4
+
+# Stream matching threads shared by all running groups
+STREAM_MATCH_WORKERS = 100
+
+
+class GroupTurns:
+    """
+    Lets concurrently processed groups enter their ordered section in order.
+
+    Group i may enter once every group before it has finished (whether or
+    not it reached its own ordered section).
+    """
+
+    def __init__(self):
+        self._finished = set()
+        self._next = 0  # Lowest index that hasn't finished
+        self._condition = threading.Condition()
+
+    def wait(self, index: int):
+        """Block until every group before index has finished."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._next >= index)
+
+    def finish(self, index: int):
+        """Mark a group finished, releasing the next group's turn."""
+        with self._condition:
+            self._finished.add(index)
+            while self._next in self._finished:
+                self._finished.discard(self._next)
+                self._next += 1
+            self._condition.notify_all()
+
+
+def run_event_groups(
+    groups: List[Dict],
+    process_group: Callable[[int, Dict, Callable[[], None], ThreadPoolExecutor], Any],
+    exclusive: Optional[Callable[[Dict], bool]] = None,
+    max_workers: int = EVENT_GROUP_WORKERS
+) -> Iterator[Tuple[int, Dict, Any, Optional[str]]]:
+    """
+    Process groups concurrently, keeping their ordered sections in list order.
+
+    Args:
+        groups: Groups in processing order (parents before children)
+        process_group: Callable(index, group, wait_for_turn, stream_executor) -> result.
+            Must call wait_for_turn() before touching shared state; the turn is
+            held until it returns.
+        exclusive: Optional predicate - matching groups take their turn before
+            process_group is called (they read other groups' channels while matching)
+        max_workers: Groups processed at the same time
+
+    Yields:
+        (index, group, result, error) as groups complete - result is None and
+        error is set if process_group raised
+    """
+    if not groups:
+        return
+
+    turns = GroupTurns()
+
+    with ThreadPoolExecutor(max_workers=STREAM_MATCH_WORKERS, thread_name_prefix='stream-match') as stream_executor:
+
+        def run(index: int, group: Dict):
+            try:
+                if exclusive and exclusive(group):
+                    turns.wait(index)
+                return process_group(index, group, lambda: turns.wait(index), stream_executor)
+            finally:
+                turns.finish(index)
+
+        workers = min(len(groups), max_workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='event-group') as group_executor:
+            # Submitted in order, so a group only waits on groups that already started
+            futures = {
+                group_executor.submit(run, index, group): (index, group)
+                for index, group in enumerate(groups)
+            }
+            for future in as_completed(futures):
+                index, group = futures[future]
+                try:
+                    yield index, group, future.result(), None
+                except Exception as e:
+                    logger.warning(f"Error refreshing event group '{group.get('group_name')}': {e}")
+                    yield index, group, None, str(e)
@@ -44,9 +44,11 @@ def get_league_config(
     """
     league_lower = league_code.lower()
 
-    # Check cache first
-    if cache is not None and league_lower in cache:
-        return cache[league_lower]
+    # Check cache first (single lookup - caches are shared across match threads)
+    if cache is not None:
+        cached = cache.get(league_lower)
+        if cached is not None:
+            return cached
 
     # Database lookup
     if db_connection_func:
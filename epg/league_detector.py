@@ -38,6 +38,8 @@ Usage:
 """
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Set, Tuple
 from dataclasses import dataclass
@@ -479,6 +481,27 @@ class LeagueDetector:
     Uses tiered detection with fallback strategies.
     """
 
+    # Extra threads for _search_schedules, per stream matching thread. The
+    # calling stream thread always searches too, so a saturated pool never
+    # leaves a stream slower than a sequential search.
+    SCHEDULE_SEARCH_WORKERS_PER_STREAM = 1
+
+    # Pool for _search_schedules, shared by all instances and created on first
+    # use (a detector is created per stream, so a pool per call would spawn
+    # and tear down threads for every stream)
+    _search_executor: Optional[ThreadPoolExecutor] = None
+    _search_executor_lock = threading.Lock()
+
+    # Schedule search resolution caches, shared by all instances (a detector is
+    # created per stream). Cleared at the start of each EPG generation.
+    # Key: league code, Value: (sport, api_league) or None if not searchable
+    _league_api_cache: Dict[str, Optional[Tuple[str, str]]] = {}
+    # Key: (team_name, league code), Value: ESPN team ID or None
+    _team_id_cache: Dict[tuple, Optional[str]] = {}
+    # Key: (team1_name, team2_name, league slug), Value: get_soccer_team_ids_for_league result
+    _soccer_ids_cache: Dict[tuple, Optional[Dict[str, Any]]] = {}
+    _resolution_cache_lock = threading.Lock()
+
     def __init__(
         self,
         espn_client=None,
@@ -514,6 +537,28 @@ class LeagueDetector:
             for pattern, leagues in SPORT_INDICATORS.items()
         ]
 
+    @classmethod
+    def _get_search_executor(cls) -> ThreadPoolExecutor:
+        """Get or create the shared schedule search pool."""
+        if cls._search_executor is None:
+            with cls._search_executor_lock:
+                if cls._search_executor is None:
+                    from epg.group_scheduler import STREAM_MATCH_WORKERS
+                    cls._search_executor = ThreadPoolExecutor(
+                        max_workers=STREAM_MATCH_WORKERS * cls.SCHEDULE_SEARCH_WORKERS_PER_STREAM,
+                        thread_name_prefix='league-search'
+                    )
+        return cls._search_executor
+
+    @classmethod
+    def clear_resolution_cache(cls):
+        """Clear memoized league configs and team IDs. Call this at the start of each EPG generation."""
+        with cls._resolution_cache_lock:
+            cls._league_api_cache.clear()
+            cls._team_id_cache.clear()
+            cls._soccer_ids_cache.clear()
+        logger.debug("League detector resolution cache cleared")
+
     def is_league_enabled(self, league: str) -> bool:
         """Check if a league is in the enabled list for this detector."""
         return league in self.enabled_leagues
@@ -729,7 +774,9 @@ class LeagueDetector:
         Find soccer leagues where both teams exist using the soccer_team_leagues cache.
 
         Unlike TeamLeagueCache (which uses team IDs), this queries by team name
-        since we may not have ESPN team IDs yet during detection.
+        since we may not have ESPN team IDs yet during detection. Lookups go
+        through the in-memory SoccerTeamNameIndex, which holds the normalized
+        (accent/number/article-stripped) forms of every cached team name.
 
         Args:
             team1: First team name
@@ -738,14 +785,13 @@ class LeagueDetector:
         Returns:
             List of soccer league slugs where both teams exist
         """
-        from database import get_connection
+        from epg.soccer_multi_league import SoccerMultiLeague
 
         if not team1 or not team2:
             return []
 
-        conn = get_connection()
         try:
-            cursor = conn.cursor()
+            index = SoccerMultiLeague.get_name_index()
 
             # Normalize team names for fuzzy matching
             # Apply name variants first (inter milan → internazionale, etc.)
@@ -763,16 +809,10 @@ class LeagueDetector:
                 3. Number-stripped match (SV Elversberg -> SV 07 Elversberg)
                 4. Article-stripped match (Atlético de Madrid -> Atlético Madrid)
                 """
-                leagues = set()
                 team_lower = team_name.lower().strip()
 
                 # Tier 0a: Exact abbreviation match (e.g., PSG, ATH, BAR)
-                cursor.execute("""
-                    SELECT DISTINCT league_slug FROM soccer_team_leagues
-                    WHERE LOWER(team_abbrev) = ?
-                """, (team_lower,))
-                for row in cursor.fetchall():
-                    leagues.add(row[0])
+                leagues = index.leagues_for_abbrev(team_lower)
 
                 if leagues:
                     logger.debug(f"Found leagues via abbreviation match: '{team_name}'")
@@ -780,55 +820,35 @@ class LeagueDetector:
 
                 # Tier 1: Direct match with abbreviation variants (st/st., mt/mt.)
                 for variant in get_abbreviation_variants(team_name):
-                    # Note: INSTR(search, db_name) checks if db_name is a substring of search.
+                    # The DB name may also be a substring of the search.
                     # Only allow this for db names >= 6 chars to avoid "Sport", "Port" false positives
-                    cursor.execute("""
-                        SELECT DISTINCT league_slug FROM soccer_team_leagues
-                        WHERE LOWER(team_name) LIKE ?
-                           OR LOWER(team_name) LIKE ?
-                           OR (INSTR(?, LOWER(team_name)) > 0 AND LENGTH(team_name) >= 6)
-                    """, (f"%{variant}%", f"{variant}%", variant))
-                    for row in cursor.fetchall():
-                        leagues.add(row[0])
+                    leagues |= index.leagues_containing('name', variant)
+                    leagues |= index.leagues_contained_in('name', variant, min_length=6)
 
                 if leagues:
                     return leagues
 
                 # Tier 2: Accent-normalized match
                 # Handles "Atletico" (stream) matching "Atlético" (DB)
-                # SQLite can't strip accents natively, so we fetch candidates and filter
-                search_normalized = strip_accents(team_name)
                 # Always try accent-normalized search - the search term may not have accents
                 # but the DB values do (Atletico in stream, Atlético in DB)
-                cursor.execute("""
-                    SELECT league_slug, team_name FROM soccer_team_leagues
-                """)
-                for row in cursor.fetchall():
-                    db_normalized = strip_accents(row[1].lower())
-                    # Check if search is in DB or DB is in search
-                    # But only allow short DB names (< 6 chars) in search if they're exact word matches
-                    if search_normalized in db_normalized:
-                        leagues.add(row[0])
-                    elif db_normalized in search_normalized and len(db_normalized) >= 6:
-                        # Only allow substring match for longer team names to avoid
-                        # "Sport" or "Port" matching everything
-                        leagues.add(row[0])
+                search_normalized = strip_accents(team_name)
+                leagues = index.leagues_containing('accent', search_normalized)
+                # Only allow substring match for longer team names to avoid
+                # "Sport" or "Port" matching everything
+                leagues |= index.leagues_contained_in('accent', search_normalized, min_length=6)
                 if leagues:
                     logger.debug(f"Found leagues via accent-stripped search: '{team_name}' -> '{search_normalized}'")
                     return leagues
 
                 # Tier 3: Strip numbers from both search term and DB values
                 # Handles "SV Elversberg" matching "SV 07 Elversberg"
-                # IMPORTANT: Always run DB-side stripping even if search has no numbers,
-                # because the DB value might have numbers (e.g., "SV 07 Elversberg")
+                # IMPORTANT: Always match against the number-stripped DB value even if
+                # the search has no numbers, because the DB value might have numbers
                 stripped = normalize_team_name(team_name, strip_articles=False)
 
                 if stripped:
-                    cursor.execute(f"""
-                        SELECT DISTINCT league_slug FROM soccer_team_leagues
-                        WHERE {SQL_STRIP_NUMBERS} LIKE ?
-                    """, (f"%{stripped}%",))
-                    leagues = {row[0] for row in cursor.fetchall()}
+                    leagues = index.leagues_containing('digits', stripped)
                     if leagues:
                         logger.debug(f"Found leagues via number-stripped search: '{team_name}' -> '{stripped}'")
                         return leagues
@@ -839,17 +859,8 @@ class LeagueDetector:
                 normalized = normalize_team_name(team_name, strip_articles=True)
 
                 if normalized and normalized != stripped:
-                    # Search for normalized name anywhere in DB team name (accent-stripped)
-                    cursor.execute("""
-                        SELECT league_slug, team_name FROM soccer_team_leagues
-                    """)
-                    for row in cursor.fetchall():
-                        db_normalized = strip_accents(row[1].lower())
-                        # Strip articles from DB value too for comparison
-                        db_articles_stripped = re.sub(r'\b(de|del|da|do|di|du)\b', '', db_normalized, flags=re.I)
-                        db_articles_stripped = re.sub(r'\s+', ' ', db_articles_stripped).strip()
-                        if normalized in db_articles_stripped:
-                            leagues.add(row[0])
+                    # Search for normalized name anywhere in the accent/article-stripped DB name
+                    leagues = index.leagues_containing('articles', normalized)
                     if leagues:
                         logger.debug(f"Found leagues via article-stripped search: '{team_name}' -> '{normalized}'")
                         return leagues
@@ -863,12 +874,7 @@ class LeagueDetector:
 
                 if suffix_stripped and suffix_stripped != team_name:
                     # Try direct match with suffix stripped
-                    cursor.execute("""
-                        SELECT DISTINCT league_slug FROM soccer_team_leagues
-                        WHERE LOWER(team_name) LIKE ?
-                           OR LOWER(team_name) = ?
-                    """, (f"%{suffix_stripped}%", suffix_stripped))
-                    leagues = {row[0] for row in cursor.fetchall()}
+                    leagues = index.leagues_containing('name', suffix_stripped)
                     if leagues:
                         logger.debug(f"Found leagues via suffix-stripped search: '{team_name}' -> '{suffix_stripped}'")
                         return leagues
@@ -911,8 +917,6 @@ class LeagueDetector:
         except Exception as e:
             logger.debug(f"Error querying soccer_team_leagues: {e}")
             return []
-        finally:
-            conn.close()
 
     def get_soccer_team_ids_for_league(
         self,
@@ -2352,6 +2356,13 @@ class LeagueDetector:
         """
         Search schedules across multiple leagues for a team matchup.
 
+        Leagues are searched in parallel (ambiguous names like "Miami" can
+        produce 6-10 candidates): the first on the calling thread, the rest
+        on the shared search pool. Searches the pool hasn't started by the
+        time the caller gets to them are taken back and run inline. Results
+        are merged in candidate order so callers break ties the same way as
+        a sequential search.
+
         Args:
             team1_name: Team name (will be resolved to ID per-league)
             team2_name: Team name (will be resolved to ID per-league)
@@ -2362,159 +2373,247 @@ class LeagueDetector:
         Returns:
             List of ScheduleMatch objects
         """
+        now = datetime.now(ZoneInfo('UTC'))
+
+        def search(league: str) -> List[ScheduleMatch]:
+            try:
+                return self._search_league_schedule(
+                    league, team1_name, team2_name, now, target_datetime, tolerance_minutes
+                )
+            except Exception as e:
+                logger.warning(f"Error searching {league} schedule: {e}")
+                return []
+
+        if len(candidates) <= 1:
+            per_league = [search(league) for league in candidates]
+        else:
+            executor = self._get_search_executor()
+            futures = [executor.submit(search, league) for league in candidates[1:]]
+            per_league = [search(candidates[0])]
+            for league, future in zip(candidates[1:], futures):
+                # Not started yet (pool busy with other streams) - run it here
+                per_league.append(search(league) if future.cancel() else future.result())
+
+        matches = []
+        for league_matches in per_league:
+            matches.extend(league_matches)
+        return matches
+
+    def _resolve_league_api(self, league: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolve a league code to its ESPN (sport, api_league), memoized per generation.
+
+        Returns:
+            (sport, api_league) or None if the league can't be searched
+        """
+        with self._resolution_cache_lock:
+            if league in self._league_api_cache:
+                return self._league_api_cache[league]
+
+        from database import get_connection
         from epg.league_config import get_league_config, parse_api_path
+
+        resolved = None
+        config = get_league_config(league, get_connection)
+        if config:
+            sport, api_league = parse_api_path(config['api_path'])
+            if sport:
+                resolved = (sport, api_league)
+        else:
+            # Fallback for soccer leagues not in league_config but in soccer cache
+            # ESPN soccer API path is simply "soccer/{league_slug}"
+            conn_check = get_connection()
+            try:
+                cursor_check = conn_check.cursor()
+                cursor_check.execute(
+                    "SELECT 1 FROM soccer_leagues_cache WHERE league_slug = ?",
+                    (league,)
+                )
+                is_soccer = cursor_check.fetchone() is not None
+            finally:
+                conn_check.close()
+
+            if is_soccer:
+                resolved = ('soccer', league)
+                logger.debug(f"Using soccer fallback for league {league}")
+
+        with self._resolution_cache_lock:
+            self._league_api_cache[league] = resolved
+        return resolved
+
+    def _resolve_team_id(self, team_name: str, league: str) -> Optional[str]:
+        """TeamLeagueCache.get_team_id_for_league, memoized per generation."""
         from epg.team_league_cache import TeamLeagueCache
 
+        key = (team_name, league)
+        with self._resolution_cache_lock:
+            if key in self._team_id_cache:
+                return self._team_id_cache[key]
+
+        team_id = TeamLeagueCache.get_team_id_for_league(team_name, league)
+
+        with self._resolution_cache_lock:
+            self._team_id_cache[key] = team_id
+        return team_id
+
+    def _resolve_soccer_team_ids(self, team1_name: str, team2_name: str, league: str) -> Optional[Dict[str, Any]]:
+        """get_soccer_team_ids_for_league, memoized per generation."""
+        key = (team1_name, team2_name, league)
+        with self._resolution_cache_lock:
+            if key in self._soccer_ids_cache:
+                return self._soccer_ids_cache[key]
+
+        soccer_ids = self.get_soccer_team_ids_for_league(team1_name, team2_name, league)
+
+        with self._resolution_cache_lock:
+            self._soccer_ids_cache[key] = soccer_ids
+        return soccer_ids
+
+    def _search_league_schedule(
+        self,
+        league: str,
+        team1_name: str,
+        team2_name: str,
+        now: datetime,
+        target_datetime: datetime = None,
+        tolerance_minutes: int = None
+    ) -> List[ScheduleMatch]:
+        """
+        Search one league's scoreboards and team schedule for a team matchup.
+
+        Args:
+            league: League code to search
+            team1_name: Team name (resolved to this league's ID)
+            team2_name: Team name (resolved to this league's ID)
+            now: Reference time for the search window
+            target_datetime: Specific datetime to match (None = search all)
+            tolerance_minutes: Time tolerance for matching (None = any time)
+
+        Returns:
+            List of ScheduleMatch objects for this league
+        """
         matches = []
-        now = datetime.now(ZoneInfo('UTC'))
         cutoff_future = now + timedelta(days=self.lookahead_days)
         cutoff_past = now - timedelta(days=1)  # Include games from yesterday
 
-        for league in candidates:
-            try:
-                from database import get_connection
-                config = get_league_config(league, get_connection)
-                if config:
-                    sport, api_league = parse_api_path(config['api_path'])
-                    if not sport:
-                        continue
-                else:
-                    # Fallback for soccer leagues not in league_config but in soccer cache
-                    # ESPN soccer API path is simply "soccer/{league_slug}"
-                    from database import get_connection
-                    conn_check = get_connection()
-                    cursor_check = conn_check.cursor()
-                    cursor_check.execute(
-                        "SELECT 1 FROM soccer_leagues_cache WHERE league_slug = ?",
-                        (league,)
-                    )
-                    is_soccer = cursor_check.fetchone() is not None
-                    conn_check.close()
+        resolved = self._resolve_league_api(league)
+        if not resolved:
+            return []
+        sport, api_league = resolved
+
+        # Resolve team IDs for THIS specific league
+        # Critical: same team name can have different IDs in different leagues
+        # e.g., Iowa State Cyclones = ID 66 in volleyball, ID 20535 in women's soccer
+        if sport == 'soccer':
+            # Use soccer cache for soccer leagues
+            soccer_ids = self._resolve_soccer_team_ids(team1_name, team2_name, league)
+            if soccer_ids:
+                team1_id = soccer_ids['team1_id']
+                team2_id = soccer_ids['team2_id']
+            else:
+                logger.debug(f"Could not resolve teams '{team1_name}' vs '{team2_name}' in soccer league {league}")
+                return []
+        else:
+            # Use non-soccer cache for other sports
+            team1_id = self._resolve_team_id(team1_name, league)
+            team2_id = self._resolve_team_id(team2_name, league)
 
-                    if is_soccer:
-                        sport = 'soccer'
-                        api_league = league
-                        logger.debug(f"Using soccer fallback for league {league}")
-                    else:
-                        continue
+            if not team1_id:
+                logger.debug(f"Could not resolve team1 '{team1_name}' in {league}")
+                return []
+            if not team2_id:
+                logger.debug(f"Could not resolve team2 '{team2_name}' in {league}")
+                return []
 
-                # Resolve team IDs for THIS specific league
-                # Critical: same team name can have different IDs in different leagues
-                # e.g., Iowa State Cyclones = ID 66 in volleyball, ID 20535 in women's soccer
-                if sport == 'soccer':
-                    # Use soccer cache for soccer leagues
-                    soccer_ids = self.get_soccer_team_ids_for_league(team1_name, team2_name, league)
-                    if soccer_ids:
-                        team1_id = soccer_ids['team1_id']
-                        team2_id = soccer_ids['team2_id']
-                    else:
-                        logger.debug(f"Could not resolve teams '{team1_name}' vs '{team2_name}' in soccer league {league}")
-                        continue
-                else:
-                    # Use non-soccer cache for other sports
-                    team1_id = TeamLeagueCache.get_team_id_for_league(team1_name, league)
-                    team2_id = TeamLeagueCache.get_team_id_for_league(team2_name, league)
+        # Collect events from both schedule AND scoreboard
+        # Schedule API has future games, but some events (NCAA tournaments)
+        # only appear on scoreboard. Fetch scoreboard for multiple days.
+        all_events = []
+        existing_ids = set()
 
-                    if not team1_id:
-                        logger.debug(f"Could not resolve team1 '{team1_name}' in {league}")
-                        continue
-                    if not team2_id:
-                        logger.debug(f"Could not resolve team2 '{team2_name}' in {league}")
-                        continue
+        # 1. Check scoreboard for lookahead window (NCAA tournaments may only be here)
+        # Start from -1 (yesterday) to handle timezone edge cases
+        for day_offset in range(-1, min(self.lookahead_days, 7)):
+            check_date = now + timedelta(days=day_offset)
+            date_str = check_date.strftime('%Y%m%d')
+            scoreboard = self.espn.get_scoreboard(sport, api_league, date_str)
+            if scoreboard and 'events' in scoreboard:
+                for event in scoreboard.get('events', []):
+                    event_id = event.get('id')
+                    if event_id and event_id not in existing_ids:
+                        all_events.append(event)
+                        existing_ids.add(event_id)
+
+        # 2. Also check team schedule (may have additional future games)
+        schedule = self.espn.get_team_schedule(sport, api_league, team1_id)
+        if schedule and 'events' in schedule:
+            for event in schedule.get('events', []):
+                event_id = event.get('id')
+                if event_id and event_id not in existing_ids:
+                    all_events.append(event)
+                    existing_ids.add(event_id)
+
+        if not all_events:
+            return []
 
-                # Collect events from both schedule AND scoreboard
-                # Schedule API has future games, but some events (NCAA tournaments)
-                # only appear on scoreboard. Fetch scoreboard for multiple days.
-                all_events = []
-                existing_ids = set()
-
-                # 1. Check scoreboard for lookahead window (NCAA tournaments may only be here)
-                # Start from -1 (yesterday) to handle timezone edge cases
-                for day_offset in range(-1, min(self.lookahead_days, 7)):
-                    check_date = now + timedelta(days=day_offset)
-                    date_str = check_date.strftime('%Y%m%d')
-                    scoreboard = self.espn.get_scoreboard(sport, api_league, date_str)
-                    if scoreboard and 'events' in scoreboard:
-                        for event in scoreboard.get('events', []):
-                            event_id = event.get('id')
-                            if event_id and event_id not in existing_ids:
-                                all_events.append(event)
-                                existing_ids.add(event_id)
-
-                # 2. Also check team schedule (may have additional future games)
-                schedule = self.espn.get_team_schedule(sport, api_league, team1_id)
-                if schedule and 'events' in schedule:
-                    for event in schedule.get('events', []):
-                        event_id = event.get('id')
-                        if event_id and event_id not in existing_ids:
-                            all_events.append(event)
-                            existing_ids.add(event_id)
-
-                if not all_events:
+        for event in all_events:
+            try:
+                event_date_str = event.get('date', '')
+                if not event_date_str:
                     continue
 
-                for event in all_events:
-                    try:
-                        event_date_str = event.get('date', '')
-                        if not event_date_str:
-                            continue
+                event_date = datetime.fromisoformat(
+                    event_date_str.replace('Z', '+00:00')
+                )
 
-                        event_date = datetime.fromisoformat(
-                            event_date_str.replace('Z', '+00:00')
-                        )
+                # Skip events outside window
+                if event_date < cutoff_past or event_date > cutoff_future:
+                    continue
+
+                # Check if team2 is in this game
+                competitions = event.get('competitions', [])
+                if not competitions:
+                    continue
+
+                competitors = competitions[0].get('competitors', [])
+                team_ids = [
+                    str(c.get('team', {}).get('id', c.get('id')))
+                    for c in competitors
+                ]
 
-                        # Skip events outside window
-                        if event_date < cutoff_past or event_date > cutoff_future:
-                            continue
-
-                        # Check if team2 is in this game
-                        competitions = event.get('competitions', [])
-                        if not competitions:
-                            continue
-
-                        competitors = competitions[0].get('competitors', [])
-                        team_ids = [
-                            str(c.get('team', {}).get('id', c.get('id')))
-                            for c in competitors
-                        ]
-
-                        if str(team2_id) not in team_ids:
-                            continue
-
-                        # Calculate time difference
-                        if target_datetime:
-                            time_diff = abs((event_date - target_datetime).total_seconds() / 60)
-
-                            # Apply tolerance filter
-                            if tolerance_minutes and time_diff > tolerance_minutes:
-                                continue
-                        else:
-                            time_diff = abs((event_date - now).total_seconds() / 60)
-
-                        # Extract home/away
-                        home_id = away_id = None
-                        for c in competitors:
-                            tid = str(c.get('team', {}).get('id', c.get('id')))
-                            if c.get('homeAway') == 'home':
-                                home_id = tid
-                            else:
-                                away_id = tid
-
-                        matches.append(ScheduleMatch(
-                            league=league,
-                            event_id=event.get('id'),
-                            event_date=event_date,
-                            home_team_id=home_id,
-                            away_team_id=away_id,
-                            time_diff_minutes=time_diff
-                        ))
-
-                    except Exception as e:
-                        logger.debug(f"Error parsing event in {league}: {e}")
+                if str(team2_id) not in team_ids:
+                    continue
+
+                # Calculate time difference
+                if target_datetime:
+                    time_diff = abs((event_date - target_datetime).total_seconds() / 60)
+
+                    # Apply tolerance filter
+                    if tolerance_minutes and time_diff > tolerance_minutes:
                         continue
+                else:
+                    time_diff = abs((event_date - now).total_seconds() / 60)
+
+                # Extract home/away
+                home_id = away_id = None
+                for c in competitors:
+                    tid = str(c.get('team', {}).get('id', c.get('id')))
+                    if c.get('homeAway') == 'home':
+                        home_id = tid
+                    else:
+                        away_id = tid
+
+                matches.append(ScheduleMatch(
+                    league=league,
+                    event_id=event.get('id'),
+                    event_date=event_date,
+                    home_team_id=home_id,
+                    away_team_id=away_id,
+                    time_diff_minutes=time_diff
+                ))
 
             except Exception as e:
-                logger.warning(f"Error searching {league} schedule: {e}")
+                logger.debug(f"Error parsing event in {league}: {e}")
                 continue
 
         return matches
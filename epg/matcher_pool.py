@@ -0,0 +1,95 @@
+"""
+Matcher Pool - one TeamMatcher/EventMatcher set shared for a whole EPG generation.
+
+Stream matching used to call create_matcher() and create_event_matcher() for
+every stream "for thread safety". Each call built a new ESPNClient,
+EventEnricher and league-config dicts. All of that was thrown away after one
+stream, and each new instance had to fill its caches again.
+
+The matchers don't need to be per-thread:
+- Team lists, scoreboards and schedules live in class/module-level caches
+  guarded by locks
+- EventMatcher's counters and EventEnricher's enriched-event cache have
+  their own locks
+- League-config dicts only ever gain identical entries (get_league_config
+  reads them with a single dict.get)
+
+So a single set is built per (generation, lookahead_days) and shared by
+every match worker of every group in that generation. Enriched events are
+cached for the generation, so a matcher set is never reused across
+generations. Refreshes outside a generation (generation=None) get a new set
+each time.
+
+Usage:
+    from epg.matcher_pool import MatcherPool
+
+    team_matcher, event_matcher = MatcherPool.get(generation, lookahead_days)
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MatcherPool:
+    """Generation-scoped TeamMatcher/EventMatcher sets, shared across threads."""
+
+    _generation: Optional[int] = None
+    _matchers: Dict[int, Tuple] = {}  # lookahead_days -> (TeamMatcher, EventMatcher)
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _create(lookahead_days: int) -> Tuple:
+        """Build a TeamMatcher and EventMatcher sharing one ESPNClient."""
+        from api.espn_client import ESPNClient
+        from database import get_connection
+        from epg.team_matcher import TeamMatcher
+        from epg.event_matcher import EventMatcher
+        from epg.event_enricher import EventEnricher
+
+        espn = ESPNClient()
+        team_matcher = TeamMatcher(espn, db_connection_func=get_connection)
+        event_matcher = EventMatcher(
+            espn,
+            db_connection_func=get_connection,
+            lookahead_days=lookahead_days,
+            enricher=EventEnricher(espn, db_connection_func=get_connection)
+        )
+        return team_matcher, event_matcher
+
+    @classmethod
+    def get(cls, generation: Optional[int], lookahead_days: int) -> Tuple:
+        """
+        Get the shared (team_matcher, event_matcher) for a generation.
+
+        Args:
+            generation: EPG generation counter (None = not pooled, new set)
+            lookahead_days: Event lookahead setting for the EventMatcher
+
+        Returns:
+            Tuple of (TeamMatcher, EventMatcher)
+        """
+        if generation is None:
+            return cls._create(lookahead_days)
+
+        with cls._lock:
+            if generation != cls._generation:
+                # New generation - drop the previous generation's enriched events
+                cls._matchers = {}
+                cls._generation = generation
+            matchers = cls._matchers.get(lookahead_days)
+            if matchers is None:
+                matchers = cls._create(lookahead_days)
+                cls._matchers[lookahead_days] = matchers
+                logger.debug(f"Created shared matchers for generation {generation} (lookahead {lookahead_days}d)")
+            return matchers
+
+    @classmethod
+    def clear(cls):
+        """Drop all pooled matchers."""
+        with cls._lock:
+            cls._matchers = {}
+            cls._generation = None
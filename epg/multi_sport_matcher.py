@@ -15,8 +15,11 @@ Tiered Detection Flow:
   Tier 4b+: Both teams matched but no game → Search schedules for RAW opponent name
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any, Union
+import copy
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
+from typing import Callable, Optional, Dict, List, Any, Union
 from utils.logger import get_logger
 from utils.match_result import (
     ResultCategory, FilteredReason, FailedReason, MatchedTier,
@@ -136,6 +139,99 @@ class MatcherConfig:
                 self.custom_regex_time_enabled)
 
 
+class MatchupMemo:
+    """
+    Generation-scoped memo of match outcomes keyed by normalized matchup.
+
+    The same matchup often appears many times across providers and feeds
+    ("NHL: Predators vs Panthers", "(ESP) Predators vs Panthers", ...). The
+    fingerprint cache is keyed on exact stream id + name, so each of them
+    would redo detection, disambiguation and schedule search. With a memo,
+    the first stream for a key does the work and later ones reuse its
+    result; concurrent streams for the same key wait for the first one
+    instead of duplicating it.
+
+    Create one per EPG generation and share it across groups - the key
+    includes the matcher config, so groups with different settings don't
+    share results.
+    """
+
+    def __init__(self):
+        self._results: Dict[tuple, MatchResult] = {}
+        self._inflight: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+
+    def get_or_match(
+        self,
+        key: tuple,
+        stream: Dict,
+        match: Callable[[], MatchResult]
+    ) -> MatchResult:
+        """
+        Return the memoized result for key (rebound to stream), or run match().
+
+        Error results are not memoized; a stream waiting on a failed match
+        runs its own.
+        """
+        with self._lock:
+            self.lookups += 1
+            cached = self._results.get(key)
+            if cached is not None:
+                self.hits += 1
+            else:
+                future = self._inflight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = Future()
+                    self._inflight[key] = future
+
+        if cached is not None:
+            return self._rebind(cached, stream)
+
+        if not is_leader:
+            cached = future.result()
+            if cached is None:
+                return match()
+            with self._lock:
+                self.hits += 1
+            return self._rebind(cached, stream)
+
+        cached = None
+        try:
+            result = match()
+            if not result.error:
+                # Store a private copy - callers are free to modify what they get back
+                cached = replace(copy.deepcopy(replace(result, stream={})), exception_keyword=None)
+                with self._lock:
+                    self._results[key] = cached
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_result(cached)
+        return result
+
+    @staticmethod
+    def _rebind(cached: MatchResult, stream: Dict) -> MatchResult:
+        """Copy a memoized result for another stream (per-stream fields recomputed)."""
+        result = copy.deepcopy(cached)
+        result.stream = stream
+        result.exception_keyword = stream.get('exception_keyword')
+        logger.debug(f"[MEMO] {stream.get('name', '')[:60]} → reused matchup result")
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup/hit counts and hit rate (0.0-1.0)."""
+        with self._lock:
+            lookups, hits = self.lookups, self.hits
+        return {
+            'lookups': lookups,
+            'hits': hits,
+            'hit_rate': hits / lookups if lookups else 0.0
+        }
+
+
 class MultiSportMatcher:
     """
     Matches streams to ESPN events using tiered multi-sport detection.
@@ -167,7 +263,8 @@ class MultiSportMatcher:
         team_matcher,
         event_matcher,
         league_detector,
-        config: MatcherConfig
+        config: MatcherConfig,
+        memo: Optional[MatchupMemo] = None
     ):
         """
         Initialize MultiSportMatcher.
@@ -177,11 +274,13 @@ class MultiSportMatcher:
             event_matcher: EventMatcher instance for finding ESPN events
             league_detector: LeagueDetector instance for tiered league detection
             config: MatcherConfig with enabled leagues, regex settings, etc.
+            memo: Optional generation-scoped MatchupMemo (None = match every stream)
         """
         self.team_matcher = team_matcher
         self.event_matcher = event_matcher
         self.league_detector = league_detector
         self.config = config
+        self.memo = memo
 
     def match_stream(self, stream: Dict) -> MatchResult:
         """
@@ -216,6 +315,65 @@ class MultiSportMatcher:
                 result.reason = raw_matchup.get('reason', 'NO_TEAMS')
                 return result
 
+        except Exception as e:
+            import traceback
+            logger.warning(f"Error matching multi-sport stream '{stream_name}': {e}")
+            logger.debug(f"Full traceback for '{stream_name}':\n{traceback.format_exc()}")
+            result.error = True
+            result.error_message = str(e)
+            return result
+
+        if self.memo is None:
+            return self._match_raw_matchup(stream, raw_matchup)
+
+        return self.memo.get_or_match(
+            self._memo_key(raw_matchup),
+            stream,
+            lambda: self._match_raw_matchup(stream, raw_matchup)
+        )
+
+    def _memo_key(self, raw_matchup: Dict) -> tuple:
+        """
+        MatchupMemo key: normalized teams, date/time, indicators and matcher config.
+
+        Time is included along with the date so doubleheaders don't collapse
+        into one result.
+        """
+        def normalize(name: Optional[str]) -> str:
+            return ' '.join((name or '').lower().split())
+
+        config = self.config
+        return (
+            normalize(raw_matchup['team1']),
+            normalize(raw_matchup['team2']),
+            raw_matchup['game_date'],
+            raw_matchup['game_time'],
+            raw_matchup['detected_league'],
+            raw_matchup['detected_sport'],
+            tuple(sorted(config.enabled_leagues or [])),
+            config.soccer_enabled,
+            config.include_final_events,
+            config.custom_regex_teams if config.custom_regex_teams_enabled else None,
+            config.custom_regex_date if config.custom_regex_date_enabled else None,
+            config.custom_regex_time if config.custom_regex_time_enabled else None,
+        )
+
+    def _match_raw_matchup(self, stream: Dict, raw_matchup: Dict) -> MatchResult:
+        """
+        Run tiered detection and event lookup for an extracted matchup.
+
+        Args:
+            stream: Stream dict with at least 'name' key
+            raw_matchup: Successful extract_raw_matchup() result for the stream
+
+        Returns:
+            MatchResult with match status and details
+        """
+        result = MatchResult(stream=stream)
+        stream_name = stream.get('name', '')
+        result.exception_keyword = stream.get('exception_keyword')
+
+        try:
             raw_team1 = raw_matchup['team1']
             raw_team2 = raw_matchup['team2']
             game_date = raw_matchup['game_date']
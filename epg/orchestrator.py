@@ -34,11 +34,6 @@ class EPGOrchestrator:
         self.api_calls = 0
         self._api_calls_lock = threading.Lock()  # Thread-safe counter
 
-        # Scoreboard cache by (sport, league, date) - cleared each generation
-        # Prevents duplicate fetches for same date across different methods
-        self._scoreboard_cache = {}
-        self._scoreboard_cache_lock = threading.Lock()
-
     def _increment_api_calls(self, count: int = 1):
         """Thread-safe increment of API call counter"""
         with self._api_calls_lock:
@@ -46,35 +41,15 @@ class EPGOrchestrator:
 
     def _get_scoreboard_cached(self, api_sport: str, api_league: str, date_str: str) -> Optional[Dict]:
         """
-        Get scoreboard with caching to avoid duplicate fetches.
+        Get scoreboard from the generation-wide snapshot.
 
-        Caches by (sport, league, date). Cache is cleared at start of each EPG generation.
+        Reads ESPNClient's shared scoreboard cache, which generate_all_epg
+        pre-fills from the scoreboard prefetch plan (see epg/scoreboard_plan.py).
+        Dates outside the plan are fetched on first use.
         """
-        cache_key = f"{api_sport}:{api_league}:{date_str}"
-
-        # Fast path: check cache without lock
-        if cache_key in self._scoreboard_cache:
-            return self._scoreboard_cache[cache_key]
-
-        # Slow path: acquire lock
-        with self._scoreboard_cache_lock:
-            # Double-check after lock
-            if cache_key in self._scoreboard_cache:
-                return self._scoreboard_cache[cache_key]
-
-            # Fetch from ESPN
-            scoreboard_data = self.espn.get_scoreboard(api_sport, api_league, date_str)
+        if not self.espn.is_scoreboard_cached(api_sport, api_league, date_str):
             self._increment_api_calls()
-
-            # Cache result (even None to avoid re-fetching failures)
-            self._scoreboard_cache[cache_key] = scoreboard_data
-
-            return scoreboard_data
-
-    def _clear_scoreboard_cache(self):
-        """Clear scoreboard cache. Call at start of each EPG generation."""
-        with self._scoreboard_cache_lock:
-            self._scoreboard_cache.clear()
+        return self.espn.get_scoreboard(api_sport, api_league, date_str)
 
     def _round_to_last_hour(self, dt: datetime) -> datetime:
         """Round datetime down to the last top of hour"""
@@ -168,9 +143,6 @@ class EPGOrchestrator:
         start_time = datetime.now()
         self.api_calls = 0
 
-        # Clear caches at start of generation
-        self._clear_scoreboard_cache()
-
         # Get active teams with templates
         teams_list = self._get_teams_with_templates()
 
@@ -188,6 +160,10 @@ class EPGOrchestrator:
         # Get settings
         settings = self._get_settings()
 
+        # Warm team info and schedules for all teams in one concurrent batch,
+        # so the per-team workers below read from cache instead of fetching lazily
+        self._prefetch_team_data(teams_list)
+
         # Calculate EPG start datetime (single source of truth)
         epg_tz = ZoneInfo(epg_timezone)
 
@@ -374,6 +350,29 @@ class EPGOrchestrator:
         competition['broadcasts'] = normalized_broadcasts
         return competition
 
+    def _prefetch_team_data(self, teams_list: List[Dict[str, Any]]):
+        """
+        Prefetch team info and schedules for all teams via ESPNClient.prefetch.
+
+        Soccer teams are skipped for schedules - their schedules come from
+        every competition the team plays in (see _fetch_soccer_multi_league_schedules).
+        """
+        keys = []
+        for team in teams_list:
+            api_sport, api_league = self._get_api_path(team)
+            team_id = team['espn_team_id']
+            keys.append(('team_info', api_sport, api_league, team_id))
+            if not is_soccer_league(team.get('league', '')):
+                keys.append(('schedule', api_sport, api_league, team_id))
+
+        try:
+            fetched = self.espn.prefetch(keys)
+            self._increment_api_calls(fetched)
+            logger.info(f"Prefetched ESPN data for {len(teams_list)} teams ({fetched} API calls)")
+        except Exception as e:
+            # Not fatal - workers fall back to lazy fetching
+            logger.warning(f"ESPN prefetch failed, falling back to lazy fetching: {e}")
+
     def _get_api_path(self, team: dict) -> tuple[str, str]:
         """
         Determine API sport and league from team configuration
@@ -0,0 +1,242 @@
+"""
+Precompressed EPG Files - content-hash ETags and compressed siblings for served guides.
+
+Dispatcharr and IPTV players poll /teamarr.xml and /event-epg/<id>.xml
+frequently. The guides are several MB and usually unchanged between polls,
+and each poll used to stream the whole uncompressed file.
+
+For a served file (e.g. teamarr.xml) this module keeps:
+- teamarr.xml.gz    gzip sibling (mtime=0, so identical content -> identical bytes)
+- teamarr.xml.br    brotli sibling, only if the optional `brotli` package is installed
+- teamarr.xml.meta  JSON: sha256 of the XML plus the size/mtime it was computed for
+
+The sha256 is the ETag, so a client that already has the guide gets a 304.
+Otherwise the client's Accept-Encoding picks the precompressed sibling.
+
+publish() runs at the end of each generation. get_published() is used when
+serving and re-publishes lazily if the XML changed since (e.g. a single-group
+refresh rewrote the merged guide). An unchanged guide costs one stat() per
+request.
+
+Usage:
+    from epg.precompressed import get_published
+
+    published = get_published('/app/data/teamarr.xml')
+    path, encoding = published.select(accept_encodings)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+from epg.xmltv_writer import atomic_write
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bump when the meta layout changes
+META_VERSION = 1
+
+META_SUFFIX = '.meta'
+
+# Content-Encoding -> sibling suffix, in preference order
+ENCODING_SUFFIXES = {
+    'br': '.br',
+    'gzip': '.gz',
+}
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+@dataclass
+class PublishedFile:
+    """A served file's content hash and its precompressed siblings."""
+    path: str
+    sha256: str
+    size: int
+    mtime_ns: int
+    encodings: Dict[str, str] = field(default_factory=dict)  # content-encoding -> path
+
+    @property
+    def etag(self) -> str:
+        """Entity tag of the uncompressed representation."""
+        return self.sha256[:32]
+
+    def select(self, accepted: Iterable[str]) -> Tuple[str, Optional[str]]:
+        """
+        Pick the representation to send.
+
+        Args:
+            accepted: Content-codings the client accepts (from Accept-Encoding)
+
+        Returns:
+            Tuple of (file path, content-encoding or None for identity)
+        """
+        accepted = set(accepted)
+        for encoding in ENCODING_SUFFIXES:
+            if encoding in accepted and encoding in self.encodings:
+                return self.encodings[encoding], encoding
+        return self.path, None
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Entity tag of one representation (each encoding gets its own)."""
+        return f"{self.etag}-{encoding}" if encoding else self.etag
+
+
+# path -> last published state
+_published: Dict[str, PublishedFile] = {}
+_published_lock = threading.Lock()
+_path_locks: Dict[str, threading.Lock] = {}
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _published_lock:
+        return _path_locks.setdefault(path, threading.Lock())
+
+
+def _matches(published: Optional[PublishedFile], st: os.stat_result) -> bool:
+    return published is not None and published.size == st.st_size and published.mtime_ns == st.st_mtime_ns
+
+
+def _load_meta(path: str) -> Optional[PublishedFile]:
+    """Load the meta sidecar if it exists and its siblings are still there."""
+    try:
+        with open(path + META_SUFFIX, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get('version') != META_VERSION:
+        return None
+
+    encodings = {
+        encoding: path + ENCODING_SUFFIXES[encoding]
+        for encoding in data.get('encodings', [])
+        if encoding in ENCODING_SUFFIXES and os.path.exists(path + ENCODING_SUFFIXES[encoding])
+    }
+    return PublishedFile(path, data.get('sha256', ''), data.get('size', -1), data.get('mtime_ns', -1), encodings)
+
+
+def _save_meta(published: PublishedFile):
+    """Write the meta sidecar (best effort)."""
+    try:
+        with atomic_write(published.path + META_SUFFIX) as f:
+            json.dump({
+                'version': META_VERSION,
+                'sha256': published.sha256,
+                'size': published.size,
+                'mtime_ns': published.mtime_ns,
+                'encodings': sorted(published.encodings),
+            }, f)
+    except OSError as e:
+        logger.warning(f"Could not write {published.path}{META_SUFFIX}: {e}")
+
+
+def _compress(encoding: str, content: bytes) -> Optional[bytes]:
+    if encoding == 'gzip':
+        return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    return None
+
+
+def publish(path: str) -> Optional[PublishedFile]:
+    """
+    Hash a served file and (re)write its precompressed siblings if its content changed.
+
+    Args:
+        path: Path of the served XML file
+
+    Returns:
+        PublishedFile, or None if the file doesn't exist
+    """
+    with _lock_for(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        with _published_lock:
+            current = _published.get(path)
+        if not _matches(current, st):
+            current = _load_meta(path)
+        if _matches(current, st):
+            with _published_lock:
+                _published[path] = current
+            return current
+
+        with open(path, 'rb') as f:
+            content = f.read()
+        sha256 = hashlib.sha256(content).hexdigest()
+
+        published = PublishedFile(path, sha256, st.st_size, st.st_mtime_ns)
+        unchanged = current is not None and current.sha256 == sha256
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            sibling = path + suffix
+            if unchanged and encoding in current.encodings:
+                # Same content rewritten (new mtime) - existing sibling is still valid
+                published.encodings[encoding] = sibling
+                continue
+            compressed = _compress(encoding, content)
+            if compressed is None:
+                continue
+            try:
+                with atomic_write(sibling, binary=True) as f:
+                    f.write(compressed)
+                published.encodings[encoding] = sibling
+            except OSError as e:
+                logger.warning(f"Could not write {sibling}: {e}")
+
+        _save_meta(published)
+        with _published_lock:
+            _published[path] = published
+
+        if not unchanged:
+            sizes = ', '.join(f"{enc} {os.path.getsize(p) // 1024}KB" for enc, p in published.encodings.items())
+            logger.debug(f"Precompressed {os.path.basename(path)} ({len(content) // 1024}KB → {sizes})")
+        return published
+
+
+def get_published(path: str) -> Optional[PublishedFile]:
+    """
+    Get a served file's hash and siblings, re-publishing if the file changed.
+
+    Returns:
+        PublishedFile, or None if the file doesn't exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    with _published_lock:
+        published = _published.get(path)
+    if _matches(published, st):
+        return published
+    return publish(path)
+
+
+def remove_published(path: str) -> int:
+    """Delete a file's precompressed siblings and meta. Returns number of files removed."""
+    removed = 0
+    for suffix in list(ENCODING_SUFFIXES.values()) + [META_SUFFIX]:
+        try:
+            os.remove(path + suffix)
+            removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove {path}{suffix}: {e}")
+    with _published_lock:
+        _published.pop(path, None)
+    return removed
@@ -68,6 +68,15 @@ class ReconciliationResult:
         return counts
 
 
+@dataclass
+class ReconciliationSnapshot:
+    """Both sides of a reconciliation run, loaded once."""
+    managed: List[Dict]                     # Active managed channels in the requested groups
+    all_managed: List[Dict]                 # Active managed channels in all groups
+    dispatcharr_channels: List[Dict]        # Every Dispatcharr channel
+    dispatcharr_by_id: Dict[int, Optional[Dict]]  # Dispatcharr id -> channel (None = confirmed missing)
+
+
 class ChannelReconciler:
     """
     Reconciles Teamarr managed channels with Dispatcharr.
@@ -119,20 +128,23 @@ class ChannelReconciler:
         result = ReconciliationResult()
 
         try:
+            # One snapshot of both sides - every detector is an in-memory join over it
+            snapshot = self._load_snapshot(group_ids)
+
             # Step 1: Detect orphans (Teamarr records without Dispatcharr channels)
-            teamarr_orphans = self._detect_orphan_teamarr(group_ids)
+            teamarr_orphans = self._detect_orphan_teamarr(snapshot)
             result.issues_found.extend(teamarr_orphans)
 
             # Step 2: Detect orphans (Dispatcharr channels without Teamarr records)
-            dispatcharr_orphans = self._detect_orphan_dispatcharr(group_ids)
+            dispatcharr_orphans = self._detect_orphan_dispatcharr(snapshot)
             result.issues_found.extend(dispatcharr_orphans)
 
             # Step 3: Detect duplicates
-            duplicates = self._detect_duplicates(group_ids)
+            duplicates = self._detect_duplicates(snapshot)
             result.issues_found.extend(duplicates)
 
             # Step 4: Detect drift (setting mismatches)
-            drift_issues = self._detect_drift(group_ids)
+            drift_issues = self._detect_drift(snapshot)
             result.issues_found.extend(drift_issues)
 
             # Step 5: Apply fixes if auto_fix is enabled
@@ -147,39 +159,68 @@ class ChannelReconciler:
         result.completed_at = datetime.now()
         return result
 
-    def _detect_orphan_teamarr(self, group_ids: List[int] = None) -> List[ReconciliationIssue]:
+    def _load_snapshot(self, group_ids: List[int] = None) -> ReconciliationSnapshot:
         """
-        Detect Teamarr records that have no corresponding Dispatcharr channel.
-
-        Uses UUID as authoritative identifier when available, with channel ID as fallback.
-        Also backfills UUIDs for channels that don't have them yet.
+        Load active managed channels (one query) and Dispatcharr's channels (one paginated fetch).
 
-        These are channels that were created but may have been deleted externally,
-        or where creation partially failed.
+        Managed channels missing from the channel list are looked up individually,
+        so a failed page can't make live channels look orphaned.
         """
-        from database import get_connection, update_managed_channel
-
-        issues = []
+        from database import get_connection
 
         conn = get_connection()
         try:
-            query = """
-                SELECT mc.*, eg.group_name
+            rows = conn.execute("""
+                SELECT mc.*, eg.group_name, eg.id as group_exists,
+                       eg.channel_group_id as expected_group_id,
+                       eg.stream_profile_id as expected_stream_profile_id,
+                       eg.duplicate_event_handling
                 FROM managed_channels mc
                 LEFT JOIN event_epg_groups eg ON mc.event_epg_group_id = eg.id
                 WHERE mc.deleted_at IS NULL
-            """
-            params = []
-            if group_ids:
-                placeholders = ','.join('?' * len(group_ids))
-                query += f" AND mc.event_epg_group_id IN ({placeholders})"
-                params.extend(group_ids)
-
-            channels = [dict(row) for row in conn.execute(query, params).fetchall()]
+                ORDER BY mc.id
+            """).fetchall()
+            all_managed = [dict(row) for row in rows]
         finally:
             conn.close()
 
-        for channel in channels:
+        dispatcharr_channels = self.channel_api.get_channels()
+        dispatcharr_by_id = {channel.get('id'): channel for channel in dispatcharr_channels}
+
+        wanted_groups = set(group_ids) if group_ids else None
+        managed = [
+            channel for channel in all_managed
+            if wanted_groups is None or channel.get('event_epg_group_id') in wanted_groups
+        ]
+
+        for channel in managed:
+            dispatcharr_id = channel.get('dispatcharr_channel_id')
+            if dispatcharr_id and dispatcharr_id not in dispatcharr_by_id:
+                dispatcharr_by_id[dispatcharr_id] = self.channel_api.get_channel(dispatcharr_id)
+
+        return ReconciliationSnapshot(
+            managed=managed,
+            all_managed=all_managed,
+            dispatcharr_channels=dispatcharr_channels,
+            dispatcharr_by_id=dispatcharr_by_id
+        )
+
+    def _detect_orphan_teamarr(self, snapshot: ReconciliationSnapshot) -> List[ReconciliationIssue]:
+        """
+        Detect Teamarr records that have no corresponding Dispatcharr channel.
+
+        Uses UUID as authoritative identifier when available, with channel ID as fallback.
+        Also backfills UUIDs for channels that don't have them yet.
+
+        These are channels that were created but may have been deleted externally,
+        or where creation partially failed.
+        """
+        from database import update_managed_channels_batch
+
+        issues = []
+        uuid_backfills = []
+
+        for channel in snapshot.managed:
             dispatcharr_id = channel.get('dispatcharr_channel_id')
             stored_uuid = channel.get('dispatcharr_uuid')
 
@@ -187,7 +228,7 @@ class ChannelReconciler:
                 continue
 
             # Check if channel exists in Dispatcharr
-            dispatcharr_channel = self.channel_api.get_channel(dispatcharr_id)
+            dispatcharr_channel = snapshot.dispatcharr_by_id.get(dispatcharr_id)
 
             if not dispatcharr_channel:
                 issues.append(ReconciliationIssue(
@@ -206,26 +247,23 @@ class ChannelReconciler:
                     suggested_action='mark_deleted',
                     auto_fixable=self.settings.get('auto_fix_orphan_teamarr', True)
                 ))
-            else:
+            elif not stored_uuid and dispatcharr_channel.get('uuid'):
                 # Channel exists - backfill UUID if we don't have it
-                if not stored_uuid and dispatcharr_channel.get('uuid'):
-                    try:
-                        update_managed_channel(channel['id'], {
-                            'dispatcharr_uuid': dispatcharr_channel['uuid']
-                        })
-                        logger.debug(
-                            f"Backfilled UUID for channel '{channel.get('channel_name')}': "
-                            f"{dispatcharr_channel['uuid']}"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to backfill UUID for channel {channel['id']}: {e}")
+                uuid_backfills.append((channel['id'], {'dispatcharr_uuid': dispatcharr_channel['uuid']}))
+
+        if uuid_backfills:
+            try:
+                update_managed_channels_batch(uuid_backfills)
+                logger.debug(f"Backfilled UUIDs for {len(uuid_backfills)} channel(s)")
+            except Exception as e:
+                logger.warning(f"Failed to backfill UUIDs: {e}")
 
         if issues:
             logger.info(f"Found {len(issues)} Teamarr orphan(s)")
 
         return issues
 
-    def _detect_orphan_dispatcharr(self, group_ids: List[int] = None) -> List[ReconciliationIssue]:
+    def _detect_orphan_dispatcharr(self, snapshot: ReconciliationSnapshot) -> List[ReconciliationIssue]:
         """
         Detect Dispatcharr channels with teamarr-* tvg_id that aren't tracked.
 
@@ -236,36 +274,13 @@ class ChannelReconciler:
         These are channels that may have been created manually or where
         Teamarr's database record was lost.
         """
-        from database import get_connection
-
         issues = []
 
-        # Get all channels from Dispatcharr
-        all_channels = self.channel_api.get_channels()
-
-        # Build sets of known identifiers from our managed_channels
-        conn = get_connection()
-        try:
-            # Try query with UUID column (v2 schema)
-            try:
-                rows = conn.execute("""
-                    SELECT dispatcharr_channel_id, dispatcharr_uuid
-                    FROM managed_channels WHERE deleted_at IS NULL
-                """).fetchall()
-                known_channel_ids = {row[0] for row in rows if row[0]}
-                known_uuids = {row[1] for row in rows if row[1]}
-            except Exception:
-                # UUID column doesn't exist yet - fall back to channel ID only
-                rows = conn.execute("""
-                    SELECT dispatcharr_channel_id
-                    FROM managed_channels WHERE deleted_at IS NULL
-                """).fetchall()
-                known_channel_ids = {row[0] for row in rows if row[0]}
-                known_uuids = set()
-        finally:
-            conn.close()
+        # Known identifiers from all active managed channels (not just the requested groups)
+        known_channel_ids = {c['dispatcharr_channel_id'] for c in snapshot.all_managed if c.get('dispatcharr_channel_id')}
+        known_uuids = {c['dispatcharr_uuid'] for c in snapshot.all_managed if c.get('dispatcharr_uuid')}
 
-        for channel in all_channels:
+        for channel in snapshot.dispatcharr_channels:
             channel_id = channel.get('id')
             channel_uuid = channel.get('uuid')
             tvg_id = channel.get('tvg_id') or ''
@@ -304,7 +319,7 @@ class ChannelReconciler:
 
         return issues
 
-    def _detect_duplicates(self, group_ids: List[int] = None) -> List[ReconciliationIssue]:
+    def _detect_duplicates(self, snapshot: ReconciliationSnapshot) -> List[ReconciliationIssue]:
         """
         Detect multiple channels for the same ESPN event within a group.
 
@@ -313,54 +328,34 @@ class ChannelReconciler:
         - Bug in channel creation
         - Manual channel creation
         """
-        from database import get_connection
-
         issues = []
 
-        conn = get_connection()
-        try:
-            # Find events with multiple channels (excluding 'separate' mode groups)
-            query = """
-                SELECT mc.espn_event_id, mc.event_epg_group_id, eg.group_name,
-                       eg.duplicate_event_handling,
-                       COUNT(*) as channel_count,
-                       GROUP_CONCAT(mc.id) as channel_ids,
-                       GROUP_CONCAT(mc.channel_name) as channel_names
-                FROM managed_channels mc
-                JOIN event_epg_groups eg ON mc.event_epg_group_id = eg.id
-                WHERE mc.deleted_at IS NULL
-                  AND mc.espn_event_id IS NOT NULL
-            """
-            params = []
-            if group_ids:
-                placeholders = ','.join('?' * len(group_ids))
-                query += f" AND mc.event_epg_group_id IN ({placeholders})"
-                params.extend(group_ids)
-
-            query += """
-                GROUP BY mc.espn_event_id, mc.event_epg_group_id
-                HAVING channel_count > 1
-            """
-
-            duplicates = [dict(row) for row in conn.execute(query, params).fetchall()]
-        finally:
-            conn.close()
+        # (espn_event_id, group_id) -> channels, for channels in existing groups
+        by_event: Dict[Tuple[str, int], List[Dict]] = {}
+        for channel in snapshot.managed:
+            if channel.get('espn_event_id') is None or channel.get('group_exists') is None:
+                continue
+            by_event.setdefault((channel['espn_event_id'], channel['event_epg_group_id']), []).append(channel)
+
+        for (espn_event_id, _), channels in by_event.items():
+            if len(channels) < 2:
+                continue
 
-        for dup in duplicates:
             # Skip if group is in 'separate' mode (duplicates are expected)
-            if dup.get('duplicate_event_handling') == 'separate':
+            duplicate_mode = channels[0].get('duplicate_event_handling')
+            if duplicate_mode == 'separate':
                 continue
 
             issues.append(ReconciliationIssue(
                 issue_type='duplicate',
                 severity='warning',
-                espn_event_id=dup['espn_event_id'],
+                espn_event_id=espn_event_id,
                 details={
-                    'group_name': dup.get('group_name'),
-                    'channel_count': dup['channel_count'],
-                    'channel_ids': dup.get('channel_ids', '').split(','),
-                    'channel_names': dup.get('channel_names', '').split(','),
-                    'duplicate_mode': dup.get('duplicate_event_handling')
+                    'group_name': channels[0].get('group_name'),
+                    'channel_count': len(channels),
+                    'channel_ids': [str(c['id']) for c in channels],
+                    'channel_names': [c.get('channel_name') or '' for c in channels],
+                    'duplicate_mode': duplicate_mode
                 },
                 suggested_action='merge',
                 auto_fixable=self.settings.get('auto_fix_duplicates', False)
@@ -371,47 +366,24 @@ class ChannelReconciler:
 
         return issues
 
-    def _detect_drift(self, group_ids: List[int] = None) -> List[ReconciliationIssue]:
+    def _detect_drift(self, snapshot: ReconciliationSnapshot) -> List[ReconciliationIssue]:
         """
         Detect channels where Teamarr's expected state differs from Dispatcharr.
 
         Checks:
         - Channel number mismatch
-        - Channel name mismatch
         - tvg_id mismatch
-        - Stream assignment mismatch
         - Channel group mismatch
         """
-        from database import get_connection
-
         issues = []
 
-        conn = get_connection()
-        try:
-            query = """
-                SELECT mc.*, eg.group_name, eg.channel_group_id as expected_group_id,
-                       eg.stream_profile_id as expected_stream_profile_id
-                FROM managed_channels mc
-                LEFT JOIN event_epg_groups eg ON mc.event_epg_group_id = eg.id
-                WHERE mc.deleted_at IS NULL
-            """
-            params = []
-            if group_ids:
-                placeholders = ','.join('?' * len(group_ids))
-                query += f" AND mc.event_epg_group_id IN ({placeholders})"
-                params.extend(group_ids)
-
-            channels = [dict(row) for row in conn.execute(query, params).fetchall()]
-        finally:
-            conn.close()
-
-        for channel in channels:
+        for channel in snapshot.managed:
             dispatcharr_id = channel.get('dispatcharr_channel_id')
             if not dispatcharr_id:
                 continue
 
             # Get current state from Dispatcharr
-            dispatcharr_channel = self.channel_api.get_channel(dispatcharr_id)
+            dispatcharr_channel = snapshot.dispatcharr_by_id.get(dispatcharr_id)
             if not dispatcharr_channel:
                 continue  # Will be caught by orphan detection
 
@@ -469,119 +441,169 @@ class ChannelReconciler:
         return issues
 
     def _apply_fixes(self, result: ReconciliationResult):
-        """Apply automatic fixes for auto-fixable issues."""
-        from database import mark_managed_channel_deleted, log_channel_history, update_channel_sync_status
+        """
+        Apply automatic fixes for auto-fixable issues.
 
-        for issue in result.issues_found:
-            if not issue.auto_fixable:
-                result.issues_skipped.append({
-                    'issue_type': issue.issue_type,
-                    'channel_name': issue.channel_name,
-                    'reason': 'Auto-fix disabled for this issue type'
-                })
-                continue
+        Drift updates go through one Dispatcharr sync plan (diffed, sent
+        concurrently) and are sent before their sync status is written.
+        Database changes are written in one transaction per kind.
+        """
+        from database import (
+            mark_managed_channels_deleted,
+            log_channel_history_batch,
+            update_channel_sync_status_batch
+        )
 
-            try:
-                if issue.issue_type == 'orphan_teamarr':
-                    # Mark as deleted in Teamarr DB
-                    if issue.managed_channel_id:
-                        mark_managed_channel_deleted(issue.managed_channel_id)
-                        update_channel_sync_status(
-                            issue.managed_channel_id,
-                            'orphaned',
-                            'Channel not found in Dispatcharr - marked deleted'
-                        )
-                        log_channel_history(
-                            managed_channel_id=issue.managed_channel_id,
-                            change_type='deleted',
-                            change_source='reconciliation',
-                            notes='Orphan detected - channel missing from Dispatcharr'
-                        )
-                        result.issues_fixed.append({
-                            'issue_type': issue.issue_type,
-                            'channel_name': issue.channel_name,
-                            'action': 'marked_deleted'
-                        })
-                        logger.info(f"Fixed orphan: marked '{issue.channel_name}' as deleted")
-
-                elif issue.issue_type == 'orphan_dispatcharr':
-                    # Delete from Dispatcharr (if auto_fix_orphan_dispatcharr is enabled)
-                    if self.settings.get('auto_fix_orphan_dispatcharr', False):
-                        delete_result = self.channel_api.delete_channel(issue.dispatcharr_channel_id)
-                        if delete_result.get('success'):
-                            result.issues_fixed.append({
-                                'issue_type': issue.issue_type,
-                                'channel_name': issue.channel_name,
-                                'action': 'deleted_from_dispatcharr'
-                            })
-                            logger.info(f"Fixed orphan: deleted '{issue.channel_name}' from Dispatcharr")
-                        else:
-                            result.errors.append(
-                                f"Failed to delete orphan channel {issue.channel_name}: "
-                                f"{delete_result.get('error')}"
-                            )
-                    else:
-                        result.issues_skipped.append({
-                            'issue_type': issue.issue_type,
-                            'channel_name': issue.channel_name,
-                            'reason': 'auto_fix_orphan_dispatcharr is disabled'
-                        })
+        orphans = []      # orphan_teamarr issues to mark deleted
+        drift = []        # (issue, update_data) staged in Dispatcharr
 
-                elif issue.issue_type == 'drift':
-                    # Sync settings to Dispatcharr
-                    if issue.managed_channel_id and issue.dispatcharr_channel_id:
-                        drift_fields = issue.details.get('drift_fields', [])
-                        update_data = {}
-                        for df in drift_fields:
-                            field_name = df['field']
-                            expected_value = df['expected']
-                            if expected_value is not None:
-                                update_data[field_name] = expected_value
-
-                        if update_data:
-                            update_result = self.channel_api.update_channel(
-                                issue.dispatcharr_channel_id,
-                                update_data
-                            )
-                            if update_result.get('success'):
-                                update_channel_sync_status(
-                                    issue.managed_channel_id,
-                                    'in_sync',
-                                    'Drift corrected by reconciliation'
-                                )
-                                log_channel_history(
-                                    managed_channel_id=issue.managed_channel_id,
-                                    change_type='modified',
-                                    change_source='reconciliation',
-                                    notes=f"Drift corrected: {', '.join(update_data.keys())}"
-                                )
+        with self.channel_api.sync_plan() as plan:
+            for issue in result.issues_found:
+                if not issue.auto_fixable:
+                    result.issues_skipped.append({
+                        'issue_type': issue.issue_type,
+                        'channel_name': issue.channel_name,
+                        'reason': 'Auto-fix disabled for this issue type'
+                    })
+                    continue
+
+                try:
+                    if issue.issue_type == 'orphan_teamarr':
+                        # Mark as deleted in Teamarr DB (batched below)
+                        if issue.managed_channel_id:
+                            orphans.append(issue)
+
+                    elif issue.issue_type == 'orphan_dispatcharr':
+                        # Delete from Dispatcharr (if auto_fix_orphan_dispatcharr is enabled)
+                        if self.settings.get('auto_fix_orphan_dispatcharr', False):
+                            delete_result = self.channel_api.delete_channel(issue.dispatcharr_channel_id)
+                            if delete_result.get('success'):
                                 result.issues_fixed.append({
                                     'issue_type': issue.issue_type,
                                     'channel_name': issue.channel_name,
-                                    'action': 'synced',
-                                    'fields': list(update_data.keys())
+                                    'action': 'deleted_from_dispatcharr'
                                 })
-                                logger.info(
-                                    f"Fixed drift: synced '{issue.channel_name}' "
-                                    f"({', '.join(update_data.keys())})"
-                                )
+                                logger.info(f"Fixed orphan: deleted '{issue.channel_name}' from Dispatcharr")
                             else:
                                 result.errors.append(
-                                    f"Failed to sync channel {issue.channel_name}: "
-                                    f"{update_result.get('error')}"
+                                    f"Failed to delete orphan channel {issue.channel_name}: "
+                                    f"{delete_result.get('error')}"
                                 )
+                        else:
+                            result.issues_skipped.append({
+                                'issue_type': issue.issue_type,
+                                'channel_name': issue.channel_name,
+                                'reason': 'auto_fix_orphan_dispatcharr is disabled'
+                            })
 
-                elif issue.issue_type == 'duplicate':
-                    # Skip duplicates - too complex for auto-fix
-                    result.issues_skipped.append({
-                        'issue_type': issue.issue_type,
-                        'espn_event_id': issue.espn_event_id,
-                        'reason': 'Duplicate resolution requires manual review'
-                    })
+                    elif issue.issue_type == 'drift':
+                        # Sync settings to Dispatcharr
+                        if issue.managed_channel_id and issue.dispatcharr_channel_id:
+                            drift_fields = issue.details.get('drift_fields', [])
+                            update_data = {}
+                            for df in drift_fields:
+                                field_name = df['field']
+                                expected_value = df['expected']
+                                if expected_value is not None:
+                                    update_data[field_name] = expected_value
+
+                            if update_data:
+                                update_result = self.channel_api.update_channel(
+                                    issue.dispatcharr_channel_id,
+                                    update_data
+                                )
+                                if update_result.get('success'):
+                                    drift.append((issue, update_data))
+                                else:
+                                    result.errors.append(
+                                        f"Failed to sync channel {issue.channel_name}: "
+                                        f"{update_result.get('error')}"
+                                    )
+
+                    elif issue.issue_type == 'duplicate':
+                        # Skip duplicates - too complex for auto-fix
+                        result.issues_skipped.append({
+                            'issue_type': issue.issue_type,
+                            'espn_event_id': issue.espn_event_id,
+                            'reason': 'Duplicate resolution requires manual review'
+                        })
 
-            except Exception as e:
-                result.errors.append(f"Error fixing {issue.issue_type} for {issue.channel_name}: {e}")
-                logger.error(f"Fix error: {e}")
+                except Exception as e:
+                    result.errors.append(f"Error fixing {issue.issue_type} for {issue.channel_name}: {e}")
+                    logger.error(f"Fix error: {e}")
+
+            # Send the drift updates now - inside a generation this is the generation's
+            # plan, sent after lifecycle processing - so only writes Dispatcharr
+            # accepted are recorded as in sync
+            failed = {
+                error['channel_id']: error['error']
+                for error in self.channel_api.flush_sync_channels(
+                    [issue.dispatcharr_channel_id for issue, _ in drift]
+                )
+            }
+
+        synced = []
+        for issue, update_data in drift:
+            if plan.dry_run:
+                result.issues_skipped.append({
+                    'issue_type': issue.issue_type,
+                    'channel_name': issue.channel_name,
+                    'reason': 'Channel sync dry run - update logged, not sent'
+                })
+            elif issue.dispatcharr_channel_id in failed:
+                result.errors.append(
+                    f"Failed to sync channel {issue.channel_name}: {failed[issue.dispatcharr_channel_id]}"
+                )
+            else:
+                synced.append((issue, update_data))
+
+        try:
+            if orphans:
+                mark_managed_channels_deleted([issue.managed_channel_id for issue in orphans])
+            update_channel_sync_status_batch(
+                [(issue.managed_channel_id, 'orphaned', 'Channel not found in Dispatcharr - marked deleted')
+                 for issue in orphans] +
+                [(issue.managed_channel_id, 'in_sync', 'Drift corrected by reconciliation')
+                 for issue, _ in synced]
+            )
+            log_channel_history_batch(
+                [{
+                    'managed_channel_id': issue.managed_channel_id,
+                    'change_type': 'deleted',
+                    'change_source': 'reconciliation',
+                    'notes': 'Orphan detected - channel missing from Dispatcharr'
+                } for issue in orphans] +
+                [{
+                    'managed_channel_id': issue.managed_channel_id,
+                    'change_type': 'modified',
+                    'change_source': 'reconciliation',
+                    'notes': f"Drift corrected: {', '.join(update_data.keys())}"
+                } for issue, update_data in synced]
+            )
+        except Exception as e:
+            result.errors.append(f"Error saving reconciliation fixes: {e}")
+            logger.error(f"Fix error: {e}")
+            return
+
+        for issue in orphans:
+            result.issues_fixed.append({
+                'issue_type': issue.issue_type,
+                'channel_name': issue.channel_name,
+                'action': 'marked_deleted'
+            })
+            logger.info(f"Fixed orphan: marked '{issue.channel_name}' as deleted")
+
+        for issue, update_data in synced:
+            result.issues_fixed.append({
+                'issue_type': issue.issue_type,
+                'channel_name': issue.channel_name,
+                'action': 'synced',
+                'fields': list(update_data.keys())
+            })
+            logger.info(
+                f"Fixed drift: synced '{issue.channel_name}' "
+                f"({', '.join(update_data.keys())})"
+            )
 
     def verify_channel(self, managed_channel_id: int) -> Dict[str, Any]:
         """
@@ -0,0 +1,146 @@
+"""
+Scoreboard Prefetch Plan - compute every scoreboard a generation will need, up front.
+
+Team-based EPG (EPGOrchestrator), event matching (EventMatcher) and event
+enrichment (EventEnricher) all read scoreboards by (sport, league, date).
+Rather than each of them fetching lazily one date at a time during tier
+matching, generate_all_epg builds a plan from the configured teams and event
+groups and fetches it in one concurrent burst via ESPNClient.get_many_scoreboards.
+
+The result lives in ESPNClient's class-level scoreboard cache, which is the
+single shared snapshot all three consumers read from for the rest of the
+generation. Anything outside the plan (e.g. a date parsed from a stream name)
+is still fetched lazily on first use.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from epg.league_config import get_league_config, parse_api_path
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# EventMatcher searches from yesterday (UTC) to absorb timezone edge cases
+EVENT_SEARCH_DAYS_BACK = 1
+
+
+def _resolve_api_path(
+    league_code: str,
+    get_connection_func: Callable,
+    config_cache: Dict[str, Dict]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve a league code to its (sport, api_league) pair."""
+    if not league_code:
+        return None, None
+    config = get_league_config(league_code, get_connection_func, config_cache)
+    if not config:
+        return None, None
+    return parse_api_path(config['api_path'])
+
+
+def _date_range(start: datetime, days_back: int, days_ahead: int) -> List[str]:
+    """YYYYMMDD strings from start - days_back through start + days_ahead - 1."""
+    return [
+        (start + timedelta(days=offset)).strftime('%Y%m%d')
+        for offset in range(-days_back, days_ahead)
+    ]
+
+
+def _group_leagues(group: Dict) -> List[str]:
+    """League codes an event group will search (assigned league or enabled leagues)."""
+    from database import normalize_league_codes
+
+    if not group.get('is_multi_sport'):
+        league = group.get('assigned_league')
+        return [league] if league else []
+
+    enabled = group.get('enabled_leagues') or []
+    if isinstance(enabled, str):
+        try:
+            enabled = json.loads(enabled)
+        except (json.JSONDecodeError, TypeError):
+            enabled = []
+
+    # 'soccer_all' fans out over every cached soccer league at match time;
+    # far too broad to prefetch, so only explicit leagues are planned
+    return normalize_league_codes([l for l in enabled if l != 'soccer_all'])
+
+
+def plan_generation_scoreboards(
+    get_connection_func: Callable,
+    teams: Iterable[Dict],
+    groups: Iterable[Dict],
+    days_ahead: int,
+    lookahead_days: int,
+    epg_timezone: str
+) -> Set[Tuple[str, str, str]]:
+    """
+    Compute the set of scoreboards a generation will read.
+
+    Team-based EPG reads every day of the EPG window (local dates) for each
+    team's league. Event groups read from yesterday through the event
+    lookahead window (UTC dates) for each league they match against.
+
+    Args:
+        get_connection_func: Function that returns a database connection
+        teams: Active team rows (flat dicts with the team's own 'league')
+        groups: Enabled event groups
+        days_ahead: EPG window in days (team-based EPG)
+        lookahead_days: Event matching lookahead in days (event groups)
+        epg_timezone: User timezone for team-based EPG dates
+
+    Returns:
+        Set of (sport, api_league, YYYYMMDD) tuples
+    """
+    config_cache: Dict[str, Dict] = {}
+    plan: Set[Tuple[str, str, str]] = set()
+
+    try:
+        tz = ZoneInfo(epg_timezone)
+    except Exception:
+        tz = ZoneInfo('America/Detroit')
+
+    team_dates = _date_range(datetime.now(tz), 0, days_ahead)
+    for team in teams:
+        league = team.get('league')
+        if not league:
+            logger.warning(f"Scoreboard plan: team {team.get('team_name') or team.get('id')!r} has no league, not prefetched")
+            continue
+        sport, api_league = _resolve_api_path(league, get_connection_func, config_cache)
+        if sport and api_league:
+            plan.update((sport, api_league, d) for d in team_dates)
+
+    event_dates = _date_range(datetime.now(ZoneInfo('UTC')), EVENT_SEARCH_DAYS_BACK, lookahead_days)
+    for group in groups:
+        for league in _group_leagues(group):
+            sport, api_league = _resolve_api_path(league, get_connection_func, config_cache)
+            if sport and api_league:
+                plan.update((sport, api_league, d) for d in event_dates)
+
+    return plan
+
+
+def prefetch_generation_scoreboards(espn_client, plan: Set[Tuple[str, str, str]]) -> int:
+    """
+    Fetch every planned scoreboard in one concurrent burst.
+
+    Args:
+        espn_client: ESPNClient whose shared scoreboard cache is filled
+        plan: Output of plan_generation_scoreboards()
+
+    Returns:
+        Number of scoreboards in the plan
+    """
+    if not plan:
+        return 0
+
+    start = datetime.now()
+    espn_client.get_many_scoreboards(sorted(plan))
+    duration = (datetime.now() - start).total_seconds()
+
+    leagues = len({(sport, league) for sport, league, _ in plan})
+    logger.info(f"Prefetched {len(plan)} scoreboards across {leagues} leagues in {duration:.1f}s")
+    return len(plan)
@@ -23,7 +23,7 @@ import re
 import json
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass
 
 from database import get_connection
@@ -156,6 +156,12 @@ LEAGUE_TAG_PATTERNS = {
 # Thread pool size for parallel fetching
 MAX_WORKERS = 100
 
+# Substring queries on the name index are answered from trigram postings
+NGRAM_SIZE = 3
+
+# Articles/prepositions dropped by the article-stripped key (see normalize_team_name)
+_ARTICLES_RE = re.compile(r'\b(de|del|da|do|di|du)\b', re.I)
+
 
 # =============================================================================
 # DATA CLASSES
@@ -211,6 +217,126 @@ class CacheStats:
     staleness_days: int
 
 
+# =============================================================================
+# IN-MEMORY NAME INDEX
+# =============================================================================
+
+def _ngrams(text: str) -> Set[str]:
+    """All NGRAM_SIZE-character substrings of text."""
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class SoccerTeamNameIndex:
+    """
+    In-memory index over the soccer_team_leagues table, keyed by team name.
+
+    LeagueDetector's soccer tiers used to run LIKE/INSTR queries and, for the
+    accent/article fallbacks, fetch the whole table and normalize every row
+    in Python. The normalized forms are now computed once per cache refresh:
+
+    - 'name':     lowercased name
+    - 'accent':   accent-stripped ("Atlético" -> "atletico")
+    - 'digits':   digits removed, like SQL_STRIP_NUMBERS ("SV 07 Elversberg" -> "sv elversberg")
+    - 'articles': accent- and article-stripped ("Atlético de Madrid" -> "atletico madrid")
+
+    Each key gets trigram postings (search text contained in a name) and a
+    hash map (a name contained in the search text), so every tier is a few
+    dict lookups instead of a table scan.
+    """
+
+    KEYS = ('name', 'accent', 'digits', 'articles')
+
+    def __init__(self, rows: List[Tuple[str, str, Optional[str]]]):
+        """
+        Build the index.
+
+        Args:
+            rows: (league_slug, team_name, team_abbrev) tuples
+        """
+        from epg.league_detector import strip_accents
+
+        self._names: List[str] = []
+        self._leagues: List[Set[str]] = []
+        self._abbrevs: Dict[str, Set[str]] = {}
+        self._keys: Dict[str, List[str]] = {key: [] for key in self.KEYS}
+        self._grams: Dict[str, Dict[str, Set[int]]] = {key: {} for key in self.KEYS}
+        self._exact: Dict[str, Dict[str, Set[int]]] = {key: {} for key in self.KEYS}
+
+        positions: Dict[str, int] = {}
+        for league_slug, team_name, team_abbrev in rows:
+            if team_abbrev:
+                self._abbrevs.setdefault(team_abbrev.lower(), set()).add(league_slug)
+
+            team_name = team_name or ''
+            position = positions.get(team_name)
+            if position is not None:
+                self._leagues[position].add(league_slug)
+                continue
+
+            position = positions[team_name] = len(self._names)
+            self._names.append(team_name)
+            self._leagues.append({league_slug})
+
+            lower = team_name.lower()
+            accent = strip_accents(lower)
+            articles = re.sub(r'\s+', ' ', _ARTICLES_RE.sub('', accent)).strip()
+            keys = {
+                'name': lower,
+                'accent': accent,
+                'digits': re.sub(r'[0-9]', '', lower).replace('  ', ' ').strip(),
+                'articles': articles,
+            }
+            for key, value in keys.items():
+                self._keys[key].append(value)
+                self._exact[key].setdefault(value, set()).add(position)
+                for gram in _ngrams(value):
+                    self._grams[key].setdefault(gram, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def leagues_for_abbrev(self, abbrev: str) -> Set[str]:
+        """Leagues of teams whose abbreviation equals abbrev (lowercase)."""
+        return set(self._abbrevs.get(abbrev, ()))
+
+    def leagues_containing(self, key: str, text: str) -> Set[str]:
+        """Leagues of teams whose `key` form contains text."""
+        values = self._keys[key]
+        text_grams = _ngrams(text)
+        if not text_grams:
+            # Too short for trigram lookup - scan (rare: 1-2 character names)
+            candidates = (i for i, value in enumerate(values) if text in value)
+        else:
+            postings = sorted((self._grams[key].get(gram, set()) for gram in text_grams), key=len)
+            matches = set(postings[0])
+            for posting in postings[1:]:
+                if not matches:
+                    break
+                matches &= posting
+            candidates = (i for i in matches if text in values[i])
+        return self._collect(candidates)
+
+    def leagues_contained_in(self, key: str, text: str, min_length: int) -> Set[str]:
+        """
+        Leagues of teams whose `key` form is a substring of text.
+
+        Only names of at least min_length characters count, so short names
+        ("Sport", "Port") don't match every search.
+        """
+        exact = self._exact[key]
+        candidates = set()
+        for start in range(len(text)):
+            for end in range(start + min_length, len(text) + 1):
+                candidates.update(exact.get(text[start:end], ()))
+        return self._collect(candidates)
+
+    def _collect(self, positions) -> Set[str]:
+        leagues = set()
+        for position in positions:
+            leagues.update(self._leagues[position])
+        return leagues
+
+
 # =============================================================================
 # MAIN CLASS
 # =============================================================================
@@ -222,6 +348,67 @@ class SoccerMultiLeague:
     All methods are static/class methods - no instance needed.
     """
 
+    # Team name lookups are served from an in-memory index (built lazily, dropped by
+    # refresh_cache, or by invalidate_stale_name_index once another process refreshes)
+    _name_index: Optional[SoccerTeamNameIndex] = None
+    _name_index_refreshed_at: Optional[str] = None  # soccer_cache_meta.last_full_refresh the index was built from
+    _name_index_lock = threading.Lock()
+
+    @classmethod
+    def get_name_index(cls) -> SoccerTeamNameIndex:
+        """Get the in-memory team name index, loading it from the database on first use."""
+        index = cls._name_index
+        if index is None:
+            with cls._name_index_lock:
+                index = cls._name_index
+                if index is None:
+                    conn = get_connection()
+                    try:
+                        refreshed_at = cls._get_last_refresh(conn)
+                        rows = [tuple(row) for row in conn.execute("""
+                            SELECT league_slug, team_name, team_abbrev
+                            FROM soccer_team_leagues
+                        """).fetchall()]
+                    finally:
+                        conn.close()
+                    index = SoccerTeamNameIndex(rows)
+                    cls._name_index = index
+                    cls._name_index_refreshed_at = refreshed_at
+                    logger.debug(f"Loaded soccer team name index ({len(index)} names, {len(rows)} rows)")
+        return index
+
+    @classmethod
+    def invalidate_name_index(cls):
+        """Drop the in-memory team name index so the next lookup reloads it from the database."""
+        with cls._name_index_lock:
+            cls._name_index = None
+
+    @classmethod
+    def invalidate_stale_name_index(cls):
+        """
+        Drop the in-memory team name index if the cache was refreshed since it was built.
+
+        Compares soccer_cache_meta.last_full_refresh with the value the index
+        was loaded from, so refreshes run by another process are picked up.
+        """
+        if cls._name_index is None:
+            return
+        conn = get_connection()
+        try:
+            refreshed_at = cls._get_last_refresh(conn)
+        finally:
+            conn.close()
+        with cls._name_index_lock:
+            if cls._name_index is not None and refreshed_at != cls._name_index_refreshed_at:
+                cls._name_index = None
+                logger.debug("Soccer cache was refreshed elsewhere - team name index dropped")
+
+    @staticmethod
+    def _get_last_refresh(conn) -> Optional[str]:
+        """last_full_refresh from soccer_cache_meta (None if never refreshed)."""
+        row = conn.execute("SELECT last_full_refresh FROM soccer_cache_meta WHERE id = 1").fetchone()
+        return row[0] if row else None
+
     # ==========================================================================
     # PUBLIC API: Cache Queries
     # ==========================================================================
@@ -512,6 +699,7 @@ class SoccerMultiLeague:
 
             # Step 3: Save to database
             cls._save_cache(team_to_leagues, league_metadata)
+            cls.invalidate_name_index()
 
             # Step 4: Update metadata
             duration = time.time() - start_time
@@ -19,13 +19,16 @@ STATIC FIELDS (cached, never change for an event):
 - Everything else: teams, venue, broadcast, logos, records at game start, etc.
 """
 
+import copy
 import hashlib
 import json
 import logging
 import sqlite3
+import threading
 import time
-from datetime import datetime, date
-from typing import Dict, Optional, Any, Tuple, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from typing import Dict, Iterable, List, Optional, Any, Tuple, TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 if TYPE_CHECKING:
@@ -40,6 +43,12 @@ SQLITE_BUSY_TIMEOUT_MS = 30000
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 0.1  # 100ms base delay, doubles each retry
 
+# Max fingerprints per IN (...) query (SQLite's default variable limit is 999)
+GET_MANY_CHUNK_SIZE = 500
+
+# Thread pool size for event summary fallbacks in fetch_fresh_events()
+SUMMARY_FETCH_WORKERS = 20
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """JSON encoder that handles datetime objects."""
@@ -100,7 +109,10 @@ class StreamMatchCache:
     Manages stream fingerprint cache for EPG generation optimization.
 
     Usage:
-        cache = StreamMatchCache(get_connection)
+        cache = StreamMatchCache(get_connection, buffer_writes=True)
+
+        # Load every stream's entry in one query up front (optional)
+        cache.get_many(group_id, streams)
 
         # Check cache before tier matching
         cached = cache.get(group_id, m3u_account_id, stream_id, stream_name)
@@ -113,19 +125,25 @@ class StreamMatchCache:
             # Cache successful match
             cache.set(group_id, m3u_account_id, stream_id, stream_name,
                      event_id, league, cached_data, generation)
+
+        # Write buffered set()/touch() calls in one transaction
+        cache.flush()
     """
 
     # Number of generations to keep unseen fingerprints before purging
     PURGE_AFTER_GENERATIONS = 5
 
-    def __init__(self, get_connection_func):
+    def __init__(self, get_connection_func, buffer_writes: bool = False):
         """
         Initialize cache with database connection factory.
 
         Args:
             get_connection_func: Function that returns a database connection
+            buffer_writes: Queue set()/touch() in memory until flush() instead of
+                committing each one (for bulk callers like event group refresh)
         """
         self.get_connection = get_connection_func
+        self.buffer_writes = buffer_writes
         self._stats = {
             'hits': 0,
             'misses': 0,
@@ -133,6 +151,14 @@ class StreamMatchCache:
             'purged': 0,
         }
 
+        # Entries loaded by get_many() or buffered by set() (None = known miss), keyed by fingerprint
+        self._prefetched: Dict[str, Optional[Tuple[str, str, Dict]]] = {}
+
+        # Buffered writes: fingerprint -> set() params / touch() generation
+        self._pending_sets: Dict[str, Tuple] = {}
+        self._pending_touches: Dict[str, int] = {}
+        self._buffer_lock = threading.Lock()
+
     def _get_connection_with_timeout(self):
         """Get a database connection with busy_timeout set for concurrent access."""
         conn = self.get_connection()
@@ -191,6 +217,18 @@ class StreamMatchCache:
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
 
+        # Served from get_many() without touching the database
+        with self._buffer_lock:
+            prefetched = fingerprint in self._prefetched
+            entry = self._prefetched.get(fingerprint)
+        if prefetched:
+            if entry:
+                self._stats['hits'] += 1
+                logger.debug(f"[CACHE HIT] stream_id={stream_id} -> event_id={entry[0]}")
+                return entry
+            self._stats['misses'] += 1
+            return None
+
         conn = self._get_connection_with_timeout()
         try:
             cursor = conn.cursor()
@@ -215,6 +253,53 @@ class StreamMatchCache:
         finally:
             conn.close()
 
+    def get_many(self, group_id: int, streams: Iterable[Dict]) -> Dict[str, Tuple[str, str, Dict]]:
+        """
+        Load cached matches for many streams with a single connection.
+
+        Results are kept in memory so the per-stream get() calls that follow
+        (from any thread) don't hit the database.
+
+        Args:
+            group_id: Event group ID
+            streams: Stream dicts with 'id' and 'name'
+
+        Returns:
+            Dict of fingerprint -> (event_id, league, cached_event_data) for hits
+        """
+        fingerprints = list({
+            compute_fingerprint(group_id, stream.get('id'), stream.get('name', ''))
+            for stream in streams
+        })
+        if not fingerprints:
+            return {}
+
+        found: Dict[str, Tuple[str, str, Dict]] = {}
+        conn = self._get_connection_with_timeout()
+        try:
+            cursor = conn.cursor()
+            for i in range(0, len(fingerprints), GET_MANY_CHUNK_SIZE):
+                chunk = fingerprints[i:i + GET_MANY_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT fingerprint, event_id, league, cached_event_data
+                    FROM stream_match_cache
+                    WHERE fingerprint IN ({placeholders})
+                """, chunk)
+                for row in cursor.fetchall():
+                    found[row['fingerprint']] = (
+                        row['event_id'], row['league'], json.loads(row['cached_event_data'])
+                    )
+        finally:
+            conn.close()
+
+        with self._buffer_lock:
+            for fingerprint in fingerprints:
+                self._prefetched[fingerprint] = found.get(fingerprint)
+
+        logger.debug(f"[CACHE] Prefetched {len(found)}/{len(fingerprints)} entries for group {group_id}")
+        return found
+
     def set(
         self,
         group_id: int,
@@ -241,6 +326,24 @@ class StreamMatchCache:
             True if cached successfully
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
+
+        if self.buffer_writes:
+            try:
+                cached_json = json.dumps(cached_data, cls=DateTimeEncoder)
+            except Exception as e:
+                logger.error(f"Failed to cache stream match: {e}")
+                return False
+            with self._buffer_lock:
+                self._pending_sets[fingerprint] = (
+                    fingerprint, group_id, stream_id, stream_name,
+                    event_id, league, cached_json, generation
+                )
+                # Visible to get() before the flush, as an unbuffered write would be
+                self._prefetched[fingerprint] = (event_id, league, cached_data)
+            self._stats['sets'] += 1
+            logger.debug(f"[CACHE SET] stream_id={stream_id} -> event_id={event_id} (buffered)")
+            return True
+
         cached_json = json.dumps(cached_data, cls=DateTimeEncoder)
 
         def do_set(conn):
@@ -294,10 +397,17 @@ class StreamMatchCache:
             generation: Current EPG generation counter
 
         Returns:
-            True if updated
+            True if updated (always True when buffering)
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
 
+        if self.buffer_writes:
+            with self._buffer_lock:
+                self._pending_touches[fingerprint] = max(
+                    generation, self._pending_touches.get(fingerprint, generation)
+                )
+            return True
+
         def do_touch(conn):
             cursor = conn.cursor()
             cursor.execute("""
@@ -314,6 +424,58 @@ class StreamMatchCache:
             logger.warning(f"[CACHE] touch failed after retries: {e}")
             return False
 
+    def flush(self) -> int:
+        """
+        Write all buffered set()/touch() calls in a single transaction.
+
+        Returns:
+            Number of buffered writes flushed (0 if nothing was pending or the write failed)
+        """
+        with self._buffer_lock:
+            pending_sets = list(self._pending_sets.values())
+            pending_touches = [
+                (generation, fingerprint)
+                for fingerprint, generation in self._pending_touches.items()
+                if fingerprint not in self._pending_sets
+            ]
+            self._pending_sets = {}
+            self._pending_touches = {}
+
+        if not pending_sets and not pending_touches:
+            return 0
+
+        def do_flush(conn):
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO stream_match_cache
+                    (fingerprint, group_id, stream_id, stream_name,
+                     event_id, league, cached_event_data, last_seen_generation,
+                     created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                ON CONFLICT (fingerprint)
+                DO UPDATE SET
+                    event_id = excluded.event_id,
+                    league = excluded.league,
+                    cached_event_data = excluded.cached_event_data,
+                    last_seen_generation = excluded.last_seen_generation,
+                    updated_at = CURRENT_TIMESTAMP
+            """, pending_sets)
+            cursor.executemany("""
+                UPDATE stream_match_cache
+                SET last_seen_generation = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE fingerprint = ?
+            """, pending_touches)
+            conn.commit()
+            return len(pending_sets) + len(pending_touches)
+
+        try:
+            flushed = self._execute_with_retry('flush', do_flush)
+            logger.debug(f"[CACHE FLUSH] {len(pending_sets)} sets, {len(pending_touches)} touches")
+            return flushed
+        except sqlite3.OperationalError as e:
+            logger.warning(f"[CACHE] flush failed after retries: {e}")
+            return 0
+
     def purge_stale(self, current_generation: int) -> int:
         """
         Remove cache entries not seen in the last N generations.
@@ -514,11 +676,135 @@ def merge_dynamic_fields(cached_event: Dict, fresh_event: Dict) -> Dict:
     return merged
 
 
+def _summary_event_from_scoreboard(event: Dict) -> Dict:
+    """
+    Reduce a scoreboard event to the shape get_event_summary() returns.
+
+    Keeps merge_dynamic_fields() behaving the same whichever source the
+    fresh data came from.
+    """
+    competitions = event.get('competitions') or [{}]
+    competition = competitions[0]
+    return {
+        'id': str(event.get('id', '')),
+        'uid': event.get('uid', ''),
+        'date': event.get('date', ''),
+        'name': event.get('name', ''),
+        'shortName': event.get('shortName', ''),
+        'competitions': [{
+            'id': competition.get('id', event.get('id')),
+            'date': competition.get('date', ''),
+            'competitors': competition.get('competitors', []),
+            'venue': competition.get('venue', {}),
+            'broadcasts': competition.get('broadcasts', []),
+            'status': competition.get('status', event.get('status', {})),
+            'odds': competition.get('odds', [])
+        }]
+    }
+
+
+def _scoreboard_dates(event_date: str) -> List[str]:
+    """
+    Scoreboard dates (YYYYMMDD) an event can appear on.
+
+    ESPN files events under their US date, so an evening game stored in UTC
+    may be on the previous day's scoreboard.
+    """
+    try:
+        start = datetime.fromisoformat(event_date.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return []
+    return [start.strftime('%Y%m%d'), (start - timedelta(days=1)).strftime('%Y%m%d')]
+
+
+def fetch_fresh_events(
+    espn_client: 'ESPNClient',
+    cached_entries: Iterable[Tuple[str, Dict]],
+    get_connection_func
+) -> Dict[Tuple[str, str], Optional[Dict]]:
+    """
+    Fetch fresh dynamic data for many cache hits at once.
+
+    Events are looked up on their leagues' scoreboards (normally already in
+    the shared per-generation scoreboard cache). Only events missing from the
+    scoreboards fall back to get_event_summary(), once per event ID no matter
+    how many streams point at it.
+
+    Args:
+        espn_client: ESPNClient instance
+        cached_entries: (league, cached_data) pairs from StreamMatchCache
+        get_connection_func: Function that returns a database connection
+
+    Returns:
+        Dict of (league, event_id) -> fresh event (summary shape), or None if
+        it couldn't be fetched. Pass to refresh_cached_event(fresh_events=...).
+    """
+    from epg.league_config import get_league_config, parse_api_path
+
+    config_cache: Dict[str, Dict] = {}
+
+    # (league, event_id) -> (sport, api_sport, api_league, scoreboard dates)
+    wanted: Dict[Tuple[str, str], Tuple] = {}
+
+    for league, cached_data in cached_entries:
+        cached_event = (cached_data or {}).get('event', {})
+        event_id = cached_event.get('id')
+        if not league or not event_id or (league, str(event_id)) in wanted:
+            continue
+        config = get_league_config(league, get_connection_func, config_cache)
+        if not config:
+            continue
+        api_sport, api_league = parse_api_path(config['api_path'])
+        wanted[(league, str(event_id))] = (
+            config['sport'], api_sport, api_league, _scoreboard_dates(cached_event.get('date', ''))
+        )
+
+    if not wanted:
+        return {}
+
+    # One scoreboard per (league, date) - shared with the rest of the generation
+    scoreboard_keys = set()
+    for sport, api_sport, api_league, dates in wanted.values():
+        if api_sport and api_league:
+            scoreboard_keys.update((api_sport, api_league, d) for d in dates)
+
+    scoreboard_events: Dict[Tuple[str, str], Dict] = {}
+    for (_, api_league, _), scoreboard in espn_client.get_many_scoreboards(sorted(scoreboard_keys)).items():
+        for event in (scoreboard or {}).get('events', []):
+            scoreboard_events.setdefault((api_league, str(event.get('id'))), event)
+
+    fresh: Dict[Tuple[str, str], Optional[Dict]] = {}
+    missing = []
+    for (league, event_id), (sport, _, api_league, _) in wanted.items():
+        event = scoreboard_events.get((api_league, event_id)) if api_league else None
+        if event:
+            fresh[(league, event_id)] = _summary_event_from_scoreboard(event)
+        else:
+            missing.append((league, event_id, sport))
+
+    # Fall back to the summary endpoint for events not on a scoreboard
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(len(missing), SUMMARY_FETCH_WORKERS)) as executor:
+            summaries = executor.map(
+                lambda item: espn_client.get_event_summary(item[2], item[0], item[1]),
+                missing
+            )
+            for (league, event_id, _), summary in zip(missing, summaries):
+                fresh[(league, event_id)] = summary
+
+    logger.debug(
+        f"[CACHE] Refreshed {len(wanted)} cached events: {len(wanted) - len(missing)} from "
+        f"{len(scoreboard_keys)} scoreboards, {len(missing)} via summary"
+    )
+    return fresh
+
+
 def refresh_cached_event(
     espn_client: 'ESPNClient',
     cached_data: Dict,
     league: str,
-    get_connection_func
+    get_connection_func,
+    fresh_events: Optional[Dict[Tuple[str, str], Optional[Dict]]] = None
 ) -> Optional[Dict]:
     """
     Refresh a cached event with fresh dynamic data from ESPN.
@@ -531,6 +817,8 @@ def refresh_cached_event(
         cached_data: Dict with 'event' and 'team_result' from cache
         league: League code (e.g., 'nhl', 'nfl')
         get_connection_func: Function that returns a database connection
+        fresh_events: Optional output of fetch_fresh_events(). Events found in it
+            are refreshed without any API or database calls.
 
     Returns:
         Dict with refreshed 'event' and original 'team_result', or None if fetch fails
@@ -544,6 +832,18 @@ def refresh_cached_event(
         logger.warning("[CACHE] No event_id in cached data")
         return None
 
+    # Already fetched in bulk
+    if fresh_events is not None and (league, str(event_id)) in fresh_events:
+        fresh_event = fresh_events[(league, str(event_id))]
+        if not fresh_event:
+            logger.debug(f"[CACHE] Could not fetch fresh data for event {event_id}, using cached")
+            return cached_data  # Return cached data as-is
+        return {
+            # Shared across streams for the same event - each merge gets its own copy
+            'event': merge_dynamic_fields(cached_event, copy.deepcopy(fresh_event)),
+            'team_result': cached_data.get('team_result', {})
+        }
+
     # Get sport from league config
     league_config = get_league_config(league, get_connection_func)
     if not league_config:
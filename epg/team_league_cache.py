@@ -19,6 +19,8 @@ Usage:
     TeamLeagueCache.refresh_cache()
 """
 
+import re
+import threading
 import time
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -52,6 +54,12 @@ NON_SOCCER_LEAGUES = [
 # Thread pool size for parallel fetching
 MAX_WORKERS = 100
 
+# Substring queries are answered from trigram postings
+NGRAM_SIZE = 3
+
+# Punctuation ignored by the normalized (fallback) search
+_PUNCTUATION_RE = re.compile(r"[.'`]")
+
 
 # =============================================================================
 # DATA CLASSES
@@ -78,6 +86,115 @@ class TeamInfo:
     leagues: List[str]
 
 
+# =============================================================================
+# IN-MEMORY INDEX
+# =============================================================================
+
+def _normalize_punctuation(text: str) -> str:
+    """Lowercase and strip periods/apostrophes/backticks ("Mount St. Mary's" -> "mount st marys")."""
+    return _PUNCTUATION_RE.sub('', text.lower())
+
+
+def _ngrams(text: str) -> Set[str]:
+    """All NGRAM_SIZE-character substrings of text."""
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class TeamLeagueIndex:
+    """
+    In-memory trigram index over the team_league_cache table.
+
+    Replaces the LIKE '%x%' scans in get_leagues_for_team / get_team_info,
+    which can't use the idx_tlc_* indexes. Loaded once per process (and after
+    every refresh_cache), then substring queries intersect the trigram
+    postings of the query and verify the few remaining candidates.
+
+    Rows keep table order, so results come back in the same order as the
+    SQL queries they replace.
+    """
+
+    def __init__(self, rows: List[Tuple]):
+        """
+        Build the index.
+
+        Args:
+            rows: (espn_team_id, team_name, team_abbrev, team_short_name, sport, league_code)
+                tuples in table order
+        """
+        self.rows = rows
+
+        # Per-row searchable fields (lowercased, and punctuation-stripped)
+        self._names: List[Tuple[str, str]] = []
+        self._normalized_names: List[Tuple[str, str]] = []
+
+        self._abbrevs: Dict[str, List[int]] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        self._normalized_grams: Dict[str, Set[int]] = {}
+
+        for position, row in enumerate(rows):
+            name = (row[1] or '').lower()
+            short_name = (row[3] or '').lower()
+            self._names.append((name, short_name))
+            for gram in _ngrams(name) | _ngrams(short_name):
+                self._grams.setdefault(gram, set()).add(position)
+
+            normalized = (_normalize_punctuation(name), _normalize_punctuation(short_name))
+            self._normalized_names.append(normalized)
+            for gram in _ngrams(normalized[0]) | _ngrams(normalized[1]):
+                self._normalized_grams.setdefault(gram, set()).add(position)
+
+            if row[2]:
+                self._abbrevs.setdefault(row[2].lower(), []).append(position)
+
+    @staticmethod
+    def _substring_matches(
+        query: str,
+        fields: List[Tuple[str, str]],
+        grams: Dict[str, Set[int]]
+    ) -> Set[int]:
+        """Positions of rows where query is a substring of either field."""
+        query_grams = _ngrams(query)
+        if not query_grams:
+            # Too short for trigram lookup - scan (rare: 1-2 character names)
+            return {i for i, (name, short_name) in enumerate(fields) if query in name or query in short_name}
+
+        postings = sorted((grams.get(gram, set()) for gram in query_grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+
+        return {i for i in candidates if query in fields[i][0] or query in fields[i][1]}
+
+    def search(self, variant: str) -> List[Tuple]:
+        """
+        Rows whose name or short name contains variant, or whose abbreviation equals it.
+
+        Args:
+            variant: Lowercase search string
+
+        Returns:
+            Matching rows in table order
+        """
+        positions = self._substring_matches(variant, self._names, self._grams)
+        positions.update(self._abbrevs.get(variant, ()))
+        return [self.rows[i] for i in sorted(positions)]
+
+    def search_normalized(self, normalized: str) -> List[Tuple]:
+        """
+        Rows whose punctuation-stripped name or short name contains normalized.
+
+        Args:
+            normalized: Lowercase, punctuation-stripped search string
+
+        Returns:
+            Matching rows in table order
+        """
+        positions = self._substring_matches(normalized, self._normalized_names, self._normalized_grams)
+        return [self.rows[i] for i in sorted(positions)]
+
+
 # =============================================================================
 # MAIN CLASS
 # =============================================================================
@@ -90,6 +207,69 @@ class TeamLeagueCache:
     Parallel structure to SoccerMultiLeague.
     """
 
+    # Name lookups are served from an in-memory index (built lazily, dropped by
+    # refresh_cache, or by invalidate_stale_index once another process refreshes)
+    _index: Optional[TeamLeagueIndex] = None
+    _index_refreshed_at: Optional[str] = None  # team_league_cache_meta.last_refresh the index was built from
+    _index_lock = threading.Lock()
+
+    @classmethod
+    def _get_index(cls) -> TeamLeagueIndex:
+        """Get the in-memory name index, loading it from the database on first use."""
+        index = cls._index
+        if index is None:
+            with cls._index_lock:
+                index = cls._index
+                if index is None:
+                    conn = get_connection()
+                    try:
+                        refreshed_at = cls._get_last_refresh(conn)
+                        rows = [tuple(row) for row in conn.execute("""
+                            SELECT espn_team_id, team_name, team_abbrev, team_short_name, sport, league_code
+                            FROM team_league_cache
+                            ORDER BY id
+                        """).fetchall()]
+                    finally:
+                        conn.close()
+                    index = TeamLeagueIndex(rows)
+                    cls._index = index
+                    cls._index_refreshed_at = refreshed_at
+                    logger.debug(f"Loaded team-league name index ({len(rows)} teams)")
+        return index
+
+    @classmethod
+    def invalidate_index(cls):
+        """Drop the in-memory name index so the next lookup reloads it from the database."""
+        with cls._index_lock:
+            cls._index = None
+
+    @classmethod
+    def invalidate_stale_index(cls):
+        """
+        Drop the in-memory name index if the cache was refreshed since it was built.
+
+        refresh_cache() only drops the index in its own process; call this at
+        the start of each EPG generation to pick up refreshes made elsewhere
+        (e.g. from a web worker while generation runs in the scheduler process).
+        """
+        if cls._index is None:
+            return
+        conn = get_connection()
+        try:
+            refreshed_at = cls._get_last_refresh(conn)
+        finally:
+            conn.close()
+        with cls._index_lock:
+            if cls._index is not None and refreshed_at != cls._index_refreshed_at:
+                cls._index = None
+                logger.debug("Team-league cache was refreshed elsewhere - name index dropped")
+
+    @staticmethod
+    def _get_last_refresh(conn) -> Optional[str]:
+        """last_refresh from team_league_cache_meta (None if never refreshed)."""
+        row = conn.execute("SELECT last_refresh FROM team_league_cache_meta WHERE id = 1").fetchone()
+        return row[0] if row else None
+
     # ==========================================================================
     # PUBLIC API: Cache Queries
     # ==========================================================================
@@ -117,42 +297,22 @@ class TeamLeagueCache:
 
         # Get all abbreviation variants (with/without periods in st/st., mt/mt., etc.)
         variants = get_abbreviation_variants(team_name)
-        results = set()
+        index = cls._get_index()
 
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        # Try each variant
+        for variant in variants:
+            results = {row[5] for row in index.search(variant)}
+            if results:
+                return results
 
-            # Try each variant
-            for variant in variants:
-                cursor.execute("""
-                    SELECT DISTINCT league_code FROM team_league_cache
-                    WHERE LOWER(team_name) LIKE ?
-                       OR LOWER(team_abbrev) = ?
-                       OR LOWER(team_short_name) LIKE ?
-                """, (f'%{variant}%', variant, f'%{variant}%'))
-                for row in cursor.fetchall():
-                    results.add(row[0])
+        # Fallback: Also try normalized search (strip ALL punctuation)
+        # This handles cases like "mount st mary's" matching "Mount St. Mary's"
+        team_normalized = _normalize_punctuation(team_name.strip())
 
-                if results:
-                    return results
+        if team_normalized not in variants:
+            return {row[5] for row in index.search_normalized(team_normalized)}
 
-            # Fallback: Also try normalized search (strip ALL punctuation)
-            # This handles cases like "mount st mary's" matching "Mount St. Mary's"
-            import re
-            team_normalized = re.sub(r"[.'`]", '', team_name.lower().strip())
-
-            if team_normalized not in variants:
-                cursor.execute("""
-                    SELECT DISTINCT league_code FROM team_league_cache
-                    WHERE REPLACE(REPLACE(REPLACE(LOWER(team_name), '.', ''), '''', ''), '`', '') LIKE ?
-                       OR REPLACE(REPLACE(REPLACE(LOWER(team_short_name), '.', ''), '''', ''), '`', '') LIKE ?
-                """, (f'%{team_normalized}%', f'%{team_normalized}%'))
-                results = {row[0] for row in cursor.fetchall()}
-
-            return results
-        finally:
-            conn.close()
+        return set()
 
     @classmethod
     def find_candidate_leagues(cls, team1: str, team2: str, enabled_leagues: List[str] = None) -> List[str]:
@@ -202,57 +362,37 @@ class TeamLeagueCache:
 
         # Get all abbreviation variants (with/without periods in st/st., mt/mt., etc.)
         variants = get_abbreviation_variants(team_name)
+        index = cls._get_index()
         rows = []
 
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        # Try each variant
+        for variant in variants:
+            rows = index.search(variant)
+            if rows:
+                break  # Found results, stop searching variants
 
-            # Try each variant
-            for variant in variants:
-                cursor.execute("""
-                    SELECT espn_team_id, team_name, team_abbrev, team_short_name, sport, league_code
-                    FROM team_league_cache
-                    WHERE LOWER(team_name) LIKE ?
-                       OR LOWER(team_abbrev) = ?
-                       OR LOWER(team_short_name) LIKE ?
-                """, (f'%{variant}%', variant, f'%{variant}%'))
-                variant_rows = cursor.fetchall()
-                if variant_rows:
-                    rows.extend(variant_rows)
-                    break  # Found results, stop searching variants
-
-            # Fallback: try normalized search (strip ALL punctuation)
-            if not rows:
-                import re
-                team_normalized = re.sub(r"[.'`]", '', team_name.lower().strip())
-                if team_normalized not in variants:
-                    cursor.execute("""
-                        SELECT espn_team_id, team_name, team_abbrev, team_short_name, sport, league_code
-                        FROM team_league_cache
-                        WHERE REPLACE(REPLACE(REPLACE(LOWER(team_name), '.', ''), '''', ''), '`', '') LIKE ?
-                           OR REPLACE(REPLACE(REPLACE(LOWER(team_short_name), '.', ''), '''', ''), '`', '') LIKE ?
-                    """, (f'%{team_normalized}%', f'%{team_normalized}%'))
-                    rows = cursor.fetchall()
-
-            # Group by team_id
-            teams_by_id = {}
-            for row in rows:
-                team_id = row[0]
-                if team_id not in teams_by_id:
-                    teams_by_id[team_id] = {
-                        'espn_team_id': team_id,
-                        'team_name': row[1],
-                        'team_abbrev': row[2] or '',
-                        'team_short_name': row[3] or '',
-                        'sport': row[4],
-                        'leagues': []
-                    }
-                teams_by_id[team_id]['leagues'].append(row[5])
-
-            return [TeamInfo(**info) for info in teams_by_id.values()]
-        finally:
-            conn.close()
+        # Fallback: try normalized search (strip ALL punctuation)
+        if not rows:
+            team_normalized = _normalize_punctuation(team_name.strip())
+            if team_normalized not in variants:
+                rows = index.search_normalized(team_normalized)
+
+        # Group by team_id
+        teams_by_id = {}
+        for row in rows:
+            team_id = row[0]
+            if team_id not in teams_by_id:
+                teams_by_id[team_id] = {
+                    'espn_team_id': team_id,
+                    'team_name': row[1],
+                    'team_abbrev': row[2] or '',
+                    'team_short_name': row[3] or '',
+                    'sport': row[4],
+                    'leagues': []
+                }
+            teams_by_id[team_id]['leagues'].append(row[5])
+
+        return [TeamInfo(**info) for info in teams_by_id.values()]
 
     @classmethod
     def get_team_id_for_league(cls, team_name: str, league_code: str) -> Optional[str]:
@@ -490,6 +630,7 @@ class TeamLeagueCache:
 
             # Save to database
             cls._save_cache(all_teams)
+            cls.invalidate_index()
 
             # Update metadata
             duration = time.time() - start_time
@@ -18,6 +18,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Tuple
 
 from epg.league_config import get_league_config, parse_api_path, is_college_league
+from epg.team_name_index import TeamNameIndex
 from utils.logger import get_logger
 from utils.regex_helper import REGEX_MODULE
 
@@ -634,9 +635,10 @@ class TeamMatcher:
             for team in teams:
                 team['_search_names'] = self._build_search_names(team)
 
-            # Cache results
+            # Cache results, with a compiled name index for _find_team_in_text
             _shared_team_cache[league_lower] = {
                 'teams': teams,
+                'name_index': TeamNameIndex(teams),
                 'fetched_at': datetime.now()
             }
 
@@ -1092,7 +1094,24 @@ class TeamMatcher:
 
         return (None, -1)
 
-    def _find_team_in_text(self, text: str, teams: List[Dict]) -> Optional[Dict]:
+    def _get_name_index(self, league: str, teams: List[Dict]) -> Optional[TeamNameIndex]:
+        """
+        Get the compiled name index for a league's cached team list.
+
+        Returns None if the team list isn't the one currently cached for the
+        league (the caller then falls back to the linear scan).
+        """
+        cached = _shared_team_cache.get(league.lower())
+        if cached and cached['teams'] is teams:
+            return cached.get('name_index')
+        return None
+
+    def _find_team_in_text(
+        self,
+        text: str,
+        teams: List[Dict],
+        name_index: Optional[TeamNameIndex] = None
+    ) -> Optional[Dict]:
         """
         Find a team match in the given text.
 
@@ -1110,10 +1129,15 @@ class TeamMatcher:
         Args:
             text: Normalized text to search in
             teams: List of team dicts with _search_names, _primary_names, _secondary_names
+            name_index: Compiled TeamNameIndex for teams. When given, all tiers are
+                answered by hash lookups instead of scanning every team's names.
 
         Returns:
             Team dict or None
         """
+        if name_index is not None:
+            return name_index.find(text)
+
         text = text.strip().lower()
         if not text:
             return None
@@ -1459,7 +1483,7 @@ class TeamMatcher:
             return alias_match
 
         # 2. Check ESPN team database
-        team_match = self._find_team_in_text(normalized, teams)
+        team_match = self._find_team_in_text(normalized, teams, self._get_name_index(league, teams))
         if team_match:
             logger.debug(f"ESPN match: '{text}' -> {team_match.get('name')}")
             return team_match
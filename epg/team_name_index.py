@@ -0,0 +1,171 @@
+"""
+Team Name Index - precompiled lookup structure for TeamMatcher._find_team_in_text.
+
+The original matcher loops over every team and every search name for every
+stream, compiling a fresh word-boundary regex per name. For college leagues
+(~360 teams x ~6 names) that is thousands of regex compiles and scans per
+stream.
+
+TeamNameIndex is built once per league (alongside _search_names in
+TeamMatcher._get_teams_for_league) and answers every matching tier with
+hash lookups:
+
+- Exact:        text == name                   -> dict lookup
+- Input prefix: text is a prefix of a name     -> dict of all name prefixes
+- Word match:   name appears as a whole word   -> lookup of every substring
+                                                  between two word boundaries
+- Name prefix:  name is a prefix of text       -> lookup of every text prefix
+
+Results are identical to the loop, including tie-breaking: every dict stores
+the lowest team position, which is the team the loop would have found first.
+"""
+
+from typing import Dict, List, Optional
+
+
+# Minimum name/text length for prefix and word-boundary tiers (matches the loop)
+MIN_MATCH_LENGTH = 3
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the re module's \\w for str patterns."""
+    return ch.isalnum() or ch == '_'
+
+
+def _word_boundaries(text: str) -> List[int]:
+    """Positions in text where the regex \\b assertion holds."""
+    boundaries = []
+    prev_is_word = False
+    for i, ch in enumerate(text):
+        is_word = _is_word_char(ch)
+        if is_word != prev_is_word:
+            boundaries.append(i)
+        prev_is_word = is_word
+    if prev_is_word:
+        boundaries.append(len(text))
+    return boundaries
+
+
+class TeamNameIndex:
+    """
+    Per-league index over teams' _primary_names / _secondary_names.
+
+    Usage:
+        index = TeamNameIndex(teams)   # teams already have _primary_names etc.
+        team = index.find("washington state")
+    """
+
+    def __init__(self, teams: List[Dict]):
+        """
+        Build the index.
+
+        Args:
+            teams: Team dicts with _primary_names and _secondary_names populated
+        """
+        self.teams = teams
+
+        # name -> position of the first team having that name
+        self._exact: Dict[str, int] = {}
+        self._primary: Dict[str, int] = {}
+        self._secondary: Dict[str, int] = {}
+
+        # prefix (len >= MIN_MATCH_LENGTH) of any primary name -> first team position
+        self._primary_prefixes: Dict[str, int] = {}
+
+        self._max_name_length = 0
+
+        for position, team in enumerate(teams):
+            for name in team.get('_primary_names', []):
+                if not name:
+                    continue
+                name = name.lower()
+                self._exact.setdefault(name, position)
+                self._primary.setdefault(name, position)
+                for end in range(MIN_MATCH_LENGTH, len(name) + 1):
+                    self._primary_prefixes.setdefault(name[:end], position)
+                self._max_name_length = max(self._max_name_length, len(name))
+
+            for name in team.get('_secondary_names', []):
+                if not name:
+                    continue
+                name = name.lower()
+                self._exact.setdefault(name, position)
+                self._secondary.setdefault(name, position)
+                self._max_name_length = max(self._max_name_length, len(name))
+
+    def find(self, text: str) -> Optional[Dict]:
+        """
+        Find the best team match in text.
+
+        Same tiers and tie-breaking as TeamMatcher._find_team_in_text's scan.
+
+        Args:
+            text: Normalized text to search in
+
+        Returns:
+            Team dict or None
+        """
+        text = text.strip().lower()
+        if not text:
+            return None
+
+        # Exact match - immediate return
+        position = self._exact.get(text)
+        if position is not None:
+            return self.teams[position]
+
+        # Input is prefix of a primary name
+        input_prefix_pos = None
+        input_prefix_length = 0
+        if len(text) >= MIN_MATCH_LENGTH:
+            input_prefix_pos = self._primary_prefixes.get(text)
+            if input_prefix_pos is not None:
+                input_prefix_length = len(text)
+
+        # Whole word match: every substring that starts and ends on a word boundary.
+        # Secondary (location) names only count for teams the scan would have
+        # reached before it found an input-prefix match.
+        word_pos = None
+        word_length = 0
+        boundaries = _word_boundaries(text)
+        for bi, start in enumerate(boundaries):
+            for end in boundaries[bi + 1:]:
+                length = end - start
+                if length < MIN_MATCH_LENGTH:
+                    continue
+                if length > self._max_name_length:
+                    break
+                candidate = text[start:end]
+
+                position = self._primary.get(candidate)
+                if position is not None:
+                    if length > word_length or (length == word_length and position < word_pos):
+                        word_pos, word_length = position, length
+
+                position = self._secondary.get(candidate)
+                if position is not None and (input_prefix_pos is None or position < input_prefix_pos):
+                    if length > word_length or (length == word_length and position < word_pos):
+                        word_pos, word_length = position, length
+
+        # Primary name is prefix of input (longest wins)
+        name_prefix_pos = None
+        name_prefix_length = 0
+        for end in range(min(len(text), self._max_name_length), MIN_MATCH_LENGTH - 1, -1):
+            position = self._primary.get(text[:end])
+            if position is not None:
+                name_prefix_pos, name_prefix_length = position, end
+                break
+
+        # Return best match, preferring longer matches (same order as the scan)
+        if input_prefix_pos is not None and input_prefix_length >= word_length:
+            return self.teams[input_prefix_pos]
+        if word_pos is not None and word_length > name_prefix_length:
+            return self.teams[word_pos]
+        if input_prefix_pos is not None:
+            return self.teams[input_prefix_pos]
+        if word_pos is not None:
+            return self.teams[word_pos]
+        if name_prefix_pos is not None:
+            return self.teams[name_prefix_pos]
+
+        return None
@@ -1,18 +1,148 @@
 """Template Variable Resolution Engine for Teamarr"""
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import random
 import json
 import re
+import threading
 
 from utils import to_pascal_case
 from utils.time_format import format_time as fmt_time, get_time_settings
 
+# Matches {variable_name}, {variable_name.next} or {variable_name.last}
+# Note: @ is allowed to support {vs_@} variable
+VARIABLE_PATTERN = re.compile(r'\{([a-z_][a-z0-9_@]*(?:\.[a-z]+)?)\}', re.IGNORECASE)
+
+# Variables that should ONLY have .last suffix (no base, no .next)
+LAST_ONLY_VARS = {
+    'final_score', 'opponent_score', 'overtime_text', 'result', 'result_text', 'result_verb',
+    'score', 'score_diff', 'score_differential', 'score_differential_text',
+    'team_score'
+}
+
+# Variables that should have BASE + .next ONLY (no .last)
+BASE_NEXT_ONLY_VARS = {
+    'odds_details', 'odds_provider', 'odds_moneyline', 'odds_opponent_moneyline',
+    'odds_opponent_spread', 'odds_over_under', 'odds_spread'
+}
+
+# Variables that should be BASE ONLY (no .next, no .last)
+BASE_ONLY_VARS = {
+    'away_record', 'away_streak', 'away_win_pct', 'games_back', 'head_coach',
+    'home_record', 'home_streak', 'home_win_pct', 'is_national_broadcast', 'is_playoff',
+    'is_preseason', 'is_ranked', 'is_ranked_matchup', 'is_regular_season', 'last_10_record',
+    'last_5_record', 'league', 'league_id', 'league_name', 'gracenote_category', 'opponent_is_ranked', 'playoff_seed',
+    'pro_conference', 'pro_conference_abbrev', 'pro_division',
+    'soccer_primary_league', 'soccer_primary_league_id', 'sport',
+    'streak', 'team_abbrev', 'team_losses', 'team_name', 'team_name_short', 'team_name_pascal', 'team_papg', 'team_ppg',
+    'team_rank', 'team_record', 'team_ties', 'team_win_pct', 'team_wins'
+}
+
+# Variable suffix -> (context key of the game it describes, variables it excludes)
+# '' is the current game, whose fields live directly in the context
+SUFFIX_GAMES = {
+    '': (None, LAST_ONLY_VARS),
+    'next': ('next_game', BASE_ONLY_VARS | LAST_ONLY_VARS),
+    'last': ('last_game', BASE_ONLY_VARS | BASE_NEXT_ONLY_VARS),
+}
+
+
+class CompiledTemplate:
+    """
+    A template parsed into literal text and the variables between it.
+
+    literals always has one more entry than names:
+    "{team_name} vs {opponent}" -> literals ['', ' vs ', ''], names ('team_name', 'opponent')
+    """
+
+    __slots__ = ('literals', 'names', 'suffixes')
+
+    def __init__(self, template: str, pattern: re.Pattern = VARIABLE_PATTERN):
+        # re.split with one capture group alternates literal, name, literal, ...
+        parts = pattern.split(template)
+        self.literals: List[str] = parts[0::2]
+        self.names: Tuple[str, ...] = tuple(parts[1::2])
+        # Game contexts the template needs ('' = current, 'next', 'last')
+        self.suffixes = frozenset(name.partition('.')[2] for name in self.names)
+
+    def render(self, variables) -> str:
+        """Substitute variables (any object with .get(name, default)); missing ones become ''."""
+        if not self.names:
+            return self.literals[0]
+        out = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            out.append(str(variables.get(name, '')))
+            out.append(literal)
+        return ''.join(out)
+
+
+# (pattern, template string) -> CompiledTemplate (templates come from team/group settings, so this stays small)
+_compiled_templates: Dict[Tuple[re.Pattern, str], CompiledTemplate] = {}
+_compiled_lock = threading.Lock()
+MAX_COMPILED_TEMPLATES = 4096
+
+
+def compile_template(template: str, pattern: re.Pattern = VARIABLE_PATTERN) -> CompiledTemplate:
+    """Get the compiled form of a template, parsing it on first use."""
+    key = (pattern, template)
+    compiled = _compiled_templates.get(key)
+    if compiled is None:
+        compiled = CompiledTemplate(template, pattern)
+        with _compiled_lock:
+            if len(_compiled_templates) >= MAX_COMPILED_TEMPLATES:
+                _compiled_templates.clear()
+            _compiled_templates[key] = compiled
+    return compiled
+
+
+class TemplateVariables:
+    """
+    Template variables for one context, built lazily.
+
+    Each game context (current game, .next, .last) is a provider for the
+    names with its suffix: its variables are built the first time a template
+    asks for one of them, then kept. A title that only uses base variables
+    never builds the next/last game variables.
+    """
+
+    def __init__(self, engine: 'TemplateEngine', context: Dict[str, Any]):
+        self._engine = engine
+        self._context = context
+        self._by_suffix: Dict[str, Dict[str, str]] = {}
+
+    def _variables_for_suffix(self, suffix: str) -> Dict[str, str]:
+        variables = self._by_suffix.get(suffix)
+        if variables is None:
+            variables = self._engine._build_game_variables(self._context, suffix)
+            self._by_suffix[suffix] = variables
+        return variables
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Value of a variable (e.g. "opponent" or "opponent.next"), or default if not available."""
+        key, _, suffix = name.partition('.')
+        if suffix not in SUFFIX_GAMES:
+            return default
+        return self._variables_for_suffix(suffix).get(key, default)
+
+    def as_dict(self) -> Dict[str, str]:
+        """All variables (base + suffixed), building any providers not used yet."""
+        all_variables = {}
+        for suffix in SUFFIX_GAMES:
+            variables = self._variables_for_suffix(suffix)
+            if suffix:
+                all_variables.update((f"{key}.{suffix}", value) for key, value in variables.items())
+            else:
+                all_variables.update(variables)
+        return all_variables
+
+
 class TemplateEngine:
     """Resolves template variables in user-defined strings"""
 
     def __init__(self):
-        pass
+        # Each thread resolves one context's templates back to back, so the
+        # last context's variables are kept per thread
+        self._memo = threading.local()
 
     def _determine_home_away(self, event: dict, our_team_id: str, use_name_fallback: bool = True) -> tuple[bool, dict, dict]:
         """
@@ -61,23 +191,25 @@ class TemplateEngine:
         if not template:
             return ""
 
-        # Build all variables (base + .next + .last)
-        variables = self._build_variable_dict(context)
-
-        # Use regex to find and replace all {variable} or {variable.suffix} patterns
-        # Pattern matches: {variable_name} or {variable_name.next} or {variable_name.last}
-        # Note: @ is allowed to support {vs_@} variable
-        pattern = r'\{([a-z_][a-z0-9_@]*(?:\.[a-z]+)?)\}'
+        compiled = compile_template(template)
+        if not compiled.names:
+            return template
 
-        def replace_variable(match):
-            """Replace function for re.sub()"""
-            var_name = match.group(1)  # e.g., "opponent" or "opponent.next"
-            var_value = variables.get(var_name, '')  # Get value or empty string if not found
-            return str(var_value)
+        # Only the game contexts the template references are built
+        return compiled.render(self._get_variables(context))
 
-        result = re.sub(pattern, replace_variable, template, flags=re.IGNORECASE)
+    def _get_variables(self, context: Dict[str, Any]) -> TemplateVariables:
+        """
+        Get the lazily built variables for a context, memoized per context object.
 
-        return result
+        Contexts are built fresh for each programme and not modified once
+        templates are resolved against them.
+        """
+        memo = self._memo
+        if getattr(memo, 'context', None) is not context:
+            memo.variables = TemplateVariables(self, context)
+            memo.context = context
+        return memo.variables
 
     def _build_variables_from_game_context(
         self,
@@ -95,7 +227,7 @@ class TemplateEngine:
         """
         Generate all 227 variables from a single game context
 
-        This helper is called 3 times by _build_variable_dict() to generate:
+        This helper is called once per game by _build_game_variables() to generate:
         - Base variables (no suffix) - from current game
         - .next variables - from next scheduled game
         - .last variables - from last completed game
@@ -776,12 +908,13 @@ class TemplateEngine:
         """
         Build complete dictionary with base, .next, and .last variables
 
-        This method calls _build_variables_from_game_context() three times:
+        Variables come from _build_variables_from_game_context() for each game:
         1. For current game (no suffix) - 227 base variables
         2. For next game (.next suffix) - 227 variables with .next suffix
         3. For last game (.last suffix) - 227 variables with .last suffix
 
-        Total: 681 variables available in templates
+        Total: 681 variables available in templates. Games already built
+        for resolve() on the same context are reused.
 
         Args:
             context: Full context dictionary from orchestrator containing:
@@ -793,119 +926,45 @@ class TemplateEngine:
         Returns:
             Dictionary of all variables (base + suffixed)
         """
-        # Variables that should ONLY have .last suffix (no base, no .next)
-        LAST_ONLY_VARS = {
-            'final_score', 'opponent_score', 'overtime_text', 'result', 'result_text', 'result_verb',
-            'score', 'score_diff', 'score_differential', 'score_differential_text',
-            'team_score'
-        }
-
-        # Variables that should have BASE + .next ONLY (no .last)
-        BASE_NEXT_ONLY_VARS = {
-            'odds_details', 'odds_provider', 'odds_moneyline', 'odds_opponent_moneyline',
-            'odds_opponent_spread', 'odds_over_under', 'odds_spread'
-        }
+        return self._get_variables(context).as_dict()
 
-        # Variables that should be BASE ONLY (no .next, no .last)
-        BASE_ONLY_VARS = {
-            'away_record', 'away_streak', 'away_win_pct', 'games_back', 'head_coach',
-            'home_record', 'home_streak', 'home_win_pct', 'is_national_broadcast', 'is_playoff',
-            'is_preseason', 'is_ranked', 'is_ranked_matchup', 'is_regular_season', 'last_10_record',
-            'last_5_record', 'league', 'league_id', 'league_name', 'gracenote_category', 'opponent_is_ranked', 'playoff_seed',
-            'pro_conference', 'pro_conference_abbrev', 'pro_division',
-            'soccer_primary_league', 'soccer_primary_league_id', 'sport',
-            'streak', 'team_abbrev', 'team_losses', 'team_name', 'team_name_short', 'team_name_pascal', 'team_papg', 'team_ppg',
-            'team_rank', 'team_record', 'team_ties', 'team_win_pct', 'team_wins'
-        }
-
-        all_variables = {}
+    def _build_game_variables(self, context: Dict[str, Any], suffix: str) -> Dict[str, str]:
+        """
+        Build the variables of one game in the context, keyed without suffix
 
-        # Extract common context components
-        team_config = context.get('team_config', {})
-        team_stats = context.get('team_stats', {})
-        epg_timezone = context.get('epg_timezone', 'America/Detroit')
-        time_format_settings = context.get('time_format_settings', {})
+        Args:
+            context: Full context dictionary from orchestrator
+            suffix: '' for the current game, 'next' or 'last'
 
-        # =====================================================================
-        # BUILD CURRENT GAME VARIABLES (no suffix)
-        # =====================================================================
+        Returns:
+            Variables allowed for that suffix (empty if the context has no such game)
+        """
+        game_key, excluded = SUFFIX_GAMES[suffix]
 
-        current_game = context.get('game', {}) or {}  # Handle None for fillers
-        current_opponent_stats = context.get('opponent_stats', {})
-        current_h2h = context.get('h2h', {})
-        current_streaks = context.get('streaks', {})
-        current_head_coach = context.get('head_coach', '')
-        current_player_leaders = context.get('player_leaders', {})
-
-        current_vars = self._build_variables_from_game_context(
-            game=current_game,
-            team_config=team_config,
-            team_stats=team_stats,
-            opponent_stats=current_opponent_stats,
-            h2h=current_h2h,
-            streaks=current_streaks,
-            head_coach=current_head_coach,
-            player_leaders=current_player_leaders,
-            epg_timezone=epg_timezone,
-            time_format_settings=time_format_settings
+        if game_key is None:
+            # Current game - its fields live directly in the context
+            game_ctx = context
+            game = context.get('game', {}) or {}  # Handle None for fillers
+        else:
+            game_ctx = context.get(game_key, {})
+            if not game_ctx or not game_ctx.get('game'):
+                return {}
+            game = game_ctx.get('game', {})
+
+        variables = self._build_variables_from_game_context(
+            game=game,
+            team_config=context.get('team_config', {}),
+            team_stats=context.get('team_stats', {}),
+            opponent_stats=game_ctx.get('opponent_stats', {}),
+            h2h=game_ctx.get('h2h', {}),
+            streaks=game_ctx.get('streaks', {}),
+            head_coach=game_ctx.get('head_coach', ''),
+            player_leaders=game_ctx.get('player_leaders', {}),
+            epg_timezone=context.get('epg_timezone', 'America/Detroit'),
+            time_format_settings=context.get('time_format_settings', {})
         )
 
-        # Add base variables (no suffix), excluding LAST_ONLY_VARS
-        for key, value in current_vars.items():
-            if key not in LAST_ONLY_VARS:
-                all_variables[key] = value
-
-        # =====================================================================
-        # BUILD NEXT GAME VARIABLES (.next suffix)
-        # =====================================================================
-
-        next_game_ctx = context.get('next_game', {})
-        if next_game_ctx and next_game_ctx.get('game'):
-            next_vars = self._build_variables_from_game_context(
-                game=next_game_ctx.get('game', {}),
-                team_config=team_config,
-                team_stats=team_stats,
-                opponent_stats=next_game_ctx.get('opponent_stats', {}),
-                h2h=next_game_ctx.get('h2h', {}),
-                streaks=next_game_ctx.get('streaks', {}),
-                head_coach=next_game_ctx.get('head_coach', ''),
-                player_leaders=next_game_ctx.get('player_leaders', {}),
-                epg_timezone=epg_timezone,
-                time_format_settings=time_format_settings
-            )
-
-            # Add .next suffix only to allowed variables
-            for key, value in next_vars.items():
-                # Skip if BASE_ONLY or LAST_ONLY
-                if key not in BASE_ONLY_VARS and key not in LAST_ONLY_VARS:
-                    all_variables[f"{key}.next"] = value
-
-        # =====================================================================
-        # BUILD LAST GAME VARIABLES (.last suffix)
-        # =====================================================================
-
-        last_game_ctx = context.get('last_game', {})
-        if last_game_ctx and last_game_ctx.get('game'):
-            last_vars = self._build_variables_from_game_context(
-                game=last_game_ctx.get('game', {}),
-                team_config=team_config,
-                team_stats=team_stats,
-                opponent_stats=last_game_ctx.get('opponent_stats', {}),
-                h2h=last_game_ctx.get('h2h', {}),
-                streaks=last_game_ctx.get('streaks', {}),
-                head_coach=last_game_ctx.get('head_coach', ''),
-                player_leaders=last_game_ctx.get('player_leaders', {}),
-                epg_timezone=epg_timezone,
-                time_format_settings=time_format_settings
-            )
-
-            # Add .last suffix only to allowed variables
-            for key, value in last_vars.items():
-                # Skip if BASE_ONLY or BASE_NEXT_ONLY
-                if key not in BASE_ONLY_VARS and key not in BASE_NEXT_ONLY_VARS:
-                    all_variables[f"{key}.last"] = value
-
-        return all_variables
+        return {key: value for key, value in variables.items() if key not in excluded}
 
     def _normalize_broadcast(self, broadcast) -> dict:
         """
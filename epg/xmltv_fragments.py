@@ -0,0 +1,170 @@
+"""
+XMLTV Fragment Index - pre-serialized channel/programme blocks per EPG fragment.
+
+Consolidation (merge_xmltv_files) runs after the team EPG and after every
+event group, and each run used to ET.parse teams.xml and every
+event_epg_*.xml even though only one of them had changed.
+
+Each fragment now gets a sidecar index (<fragment>.idx) holding:
+- the SHA256 of the fragment's contents
+- every top-level <channel>/<programme>, already serialized exactly as the
+  merged output writes it, with its dedup key
+
+A fragment is only re-parsed when its hash no longer matches the index, so a
+merge costs O(changed fragments) parsing plus hashing and concatenating the
+rest. Indexes are also kept in memory so unchanged fragments don't reload
+their sidecar.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from epg.xmltv_writer import atomic_write, serialize_element
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index layout or the serialization format changes
+INDEX_VERSION = 1
+
+INDEX_SUFFIX = '.idx'
+
+
+@dataclass
+class FragmentIndex:
+    """Serialized top-level elements of one XMLTV fragment."""
+    sha256: str
+    channels: List[Tuple[str, str]]                # (channel_id, xml)
+    programmes: List[Tuple[str, str, str, str]]    # (channel, start, stop, xml)
+
+
+# path -> index of the fragment's last seen contents
+_memory_cache: Dict[str, FragmentIndex] = {}
+_memory_cache_lock = threading.Lock()
+
+
+def index_path_for(fragment_path: str) -> str:
+    """Sidecar index path for a fragment."""
+    return fragment_path + INDEX_SUFFIX
+
+
+def _build_index(content: bytes, sha256: str) -> FragmentIndex:
+    """Parse a fragment and serialize its top-level elements."""
+    # Parse with comments enabled to preserve teamarr metadata
+    parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
+    parser.feed(content)
+    root = parser.close()
+
+    channels = [
+        (channel.get('id') or '', serialize_element(channel))
+        for channel in root.findall('channel')
+    ]
+    programmes = [
+        (
+            programme.get('channel', ''),
+            programme.get('start', ''),
+            programme.get('stop', ''),
+            serialize_element(programme)
+        )
+        for programme in root.findall('programme')
+    ]
+    return FragmentIndex(sha256, channels, programmes)
+
+
+def _load_sidecar(fragment_path: str, sha256: str) -> Optional[FragmentIndex]:
+    """Load the sidecar index if it exists and matches the fragment's hash."""
+    try:
+        with open(index_path_for(fragment_path), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get('version') != INDEX_VERSION or data.get('sha256') != sha256:
+        return None
+
+    return FragmentIndex(
+        sha256,
+        [tuple(c) for c in data.get('channels', [])],
+        [tuple(p) for p in data.get('programmes', [])]
+    )
+
+
+def _save_sidecar(fragment_path: str, index: FragmentIndex):
+    """Write the sidecar index (best effort)."""
+    try:
+        with atomic_write(index_path_for(fragment_path)) as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'sha256': index.sha256,
+                'channels': index.channels,
+                'programmes': index.programmes,
+            }, f)
+    except OSError as e:
+        logger.warning(f"Could not write EPG fragment index for {fragment_path}: {e}")
+
+
+def get_fragment_index(fragment_path: str) -> Tuple[FragmentIndex, bool]:
+    """
+    Get the serialized blocks for a fragment, re-parsing only if it changed.
+
+    Args:
+        fragment_path: Path to an XMLTV fragment (teams.xml, event_epg_*.xml)
+
+    Returns:
+        Tuple of (index, reparsed) - reparsed is True if the fragment was parsed
+
+    Raises:
+        OSError: If the fragment can't be read
+        ET.ParseError: If the fragment changed and isn't valid XML
+    """
+    # Always hash - mtime can be too coarse to notice a same-size rewrite
+    with open(fragment_path, 'rb') as f:
+        content = f.read()
+    sha256 = hashlib.sha256(content).hexdigest()
+
+    with _memory_cache_lock:
+        cached = _memory_cache.get(fragment_path)
+    if cached is not None and cached.sha256 == sha256:
+        return cached, False
+
+    reparsed = False
+    index = _load_sidecar(fragment_path, sha256)
+    if index is None:
+        index = _build_index(content, sha256)
+        _save_sidecar(fragment_path, index)
+        reparsed = True
+
+    with _memory_cache_lock:
+        _memory_cache[fragment_path] = index
+    return index, reparsed
+
+
+def remove_orphaned_indexes(data_dir: str) -> int:
+    """
+    Delete sidecar indexes whose fragment (and its .bak archive) no longer exist.
+
+    Indexes of archived fragments are kept: a regenerated fragment with the
+    same content reuses them.
+
+    Returns:
+        Number of index files deleted
+    """
+    deleted = 0
+    for idx_path in glob.glob(os.path.join(data_dir, '*.xml' + INDEX_SUFFIX)):
+        fragment_path = idx_path[:-len(INDEX_SUFFIX)]
+        if os.path.exists(fragment_path) or os.path.exists(fragment_path + '.bak'):
+            continue
+        try:
+            os.remove(idx_path)
+            deleted += 1
+        except OSError as e:
+            logger.warning(f"Could not remove {idx_path}: {e}")
+        with _memory_cache_lock:
+            _memory_cache.pop(fragment_path, None)
+    return deleted
@@ -1,10 +1,12 @@
 """XMLTV EPG Generator following Gracenote best practices"""
+import io
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
 import hashlib
 
+from epg.xmltv_writer import write_xmltv
+
 class XMLTVGenerator:
     """Generate XMLTV format EPG files"""
 
@@ -41,13 +43,10 @@ class XMLTVGenerator:
             for event in team_events:
                 self._add_programme(tv, team, event, settings)
 
-        # Convert to pretty XML string
-        xml_str = self._prettify(tv)
-
-        # Add DOCTYPE
-        xml_with_doctype = self._add_doctype(xml_str)
-
-        return xml_with_doctype
+        # Serialize with declaration and DOCTYPE (element by element, no DOM re-parse)
+        out = io.StringIO()
+        write_xmltv(out, tv.attrib, tv)
+        return out.getvalue()
 
     def _add_channel(self, parent: ET.Element, team: Dict):
         """Add channel element for a team"""
@@ -182,28 +181,6 @@ class XMLTVGenerator:
 
         return dt.strftime('%Y%m%d%H%M%S +0000')
 
-    def _prettify(self, elem: ET.Element) -> str:
-        """Return pretty-printed XML string"""
-        rough_string = ET.tostring(elem, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        pretty = reparsed.toprettyxml(indent='  ')
-
-        # Remove extra blank lines
-        lines = [line for line in pretty.split('\n') if line.strip()]
-
-        # Remove XML declaration (we'll add it back with DOCTYPE)
-        if lines and lines[0].startswith('<?xml'):
-            lines = lines[1:]
-
-        return '\n'.join(lines)
-
-    def _add_doctype(self, xml_str: str) -> str:
-        """Add XML declaration and DOCTYPE (watermark added by consolidator)"""
-        declaration = '<?xml version="1.0" encoding="UTF-8"?>'
-        doctype = '<!DOCTYPE tv SYSTEM "xmltv.dtd">'
-
-        return f"{declaration}\n{doctype}\n{xml_str}"
-
     def calculate_file_hash(self, xml_content: str) -> str:
         """Calculate SHA256 hash of XML content for change detection"""
         return hashlib.sha256(xml_content.encode('utf-8')).hexdigest()
@@ -0,0 +1,183 @@
+"""
+Streaming XMLTV Writer - serialize XMLTV element by element.
+
+Replaces the ET.tostring() -> minidom.parseString() -> toprettyxml() ->
+split/filter pipeline, which held three or four copies of the full guide in
+memory. Each top-level <channel>/<programme> is serialized on its own and
+written straight to the output (a file or StringIO).
+
+Output matches the old pipeline exactly:
+- 2-space indentation, one element per line
+- Elements whose only child is text stay on one line
+- Elements without children are self-closed (<new/>)
+- Whitespace-only lines are dropped
+- Same escaping as minidom (& < > " in text and attributes)
+
+Usage:
+    from epg.xmltv_writer import atomic_write, write_xmltv
+
+    with atomic_write(output_path) as f:
+        write_xmltv(f, {'generator-info-name': 'Teamarr'}, channels, programmes, header)
+"""
+
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from typing import Dict, IO, Iterable, List
+
+INDENT = '  '
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>'
+XMLTV_DOCTYPE = '<!DOCTYPE tv SYSTEM "xmltv.dtd">'
+
+
+def _escape(data: str) -> str:
+    """Escape text/attribute data the way minidom does."""
+    return (data.replace('&', '&amp;').replace('<', '&lt;')
+            .replace('"', '&quot;').replace('>', '&gt;'))
+
+
+def _render(elem: ET.Element, indent: str, parts: List[str]):
+    """Append the minidom-style pretty serialization of elem to parts."""
+    if elem.tag is ET.Comment:
+        parts.append(f"{indent}<!--{elem.text or ''}-->\n")
+        return
+
+    parts.append(f"{indent}<{elem.tag}")
+    for name, value in elem.attrib.items():
+        parts.append(f' {name}="{_escape(value)}"')
+
+    children = list(elem)
+    if not children:
+        if elem.text:
+            # Single text child: stays inline
+            parts.append(f">{_escape(elem.text)}</{elem.tag}>\n")
+        else:
+            parts.append("/>\n")
+        return
+
+    parts.append(">\n")
+    child_indent = indent + INDENT
+    if elem.text:
+        parts.append(f"{child_indent}{_escape(elem.text)}\n")
+    for child in children:
+        _render(child, child_indent, parts)
+        if child.tail:
+            parts.append(f"{child_indent}{_escape(child.tail)}\n")
+    parts.append(f"{indent}</{elem.tag}>\n")
+
+
+def _without_blank_lines(chunk: str) -> str:
+    """Drop whitespace-only lines (the old pipeline's line filter)."""
+    if '\n' not in chunk.rstrip('\n') and chunk.strip():
+        return chunk
+    lines = [line for line in chunk.split('\n') if line.strip()]
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def serialize_element(elem: ET.Element, level: int = 1) -> str:
+    """
+    Serialize one element (and its subtree) as pretty-printed lines.
+
+    Args:
+        elem: Element to serialize
+        level: Indentation level (1 = direct child of <tv>)
+
+    Returns:
+        Newline-terminated XML text
+    """
+    parts: List[str] = []
+    _render(elem, INDENT * level, parts)
+    return _without_blank_lines(''.join(parts))
+
+
+def write_xmltv(
+    out: IO[str],
+    tv_attrib: Dict[str, str],
+    elements: Iterable[ET.Element],
+    header: str = f"{XML_DECLARATION}\n{XMLTV_DOCTYPE}"
+) -> int:
+    """
+    Stream a complete XMLTV document.
+
+    Args:
+        out: Writable text stream
+        tv_attrib: Attributes for the <tv> root element
+        elements: Top-level elements in output order (channels, then programmes)
+        header: Declaration/comment/DOCTYPE lines written before <tv>
+
+    Returns:
+        Number of top-level elements written
+    """
+    return write_xmltv_serialized(out, tv_attrib, (serialize_element(elem) for elem in elements), header)
+
+
+def write_xmltv_serialized(
+    out: IO[str],
+    tv_attrib: Dict[str, str],
+    blocks: Iterable[str],
+    header: str = f"{XML_DECLARATION}\n{XMLTV_DOCTYPE}"
+) -> int:
+    """
+    Stream a complete XMLTV document from already serialized elements.
+
+    Args:
+        out: Writable text stream
+        tv_attrib: Attributes for the <tv> root element
+        blocks: serialize_element() output for each top-level element, in order
+        header: Declaration/comment/DOCTYPE lines written before <tv>
+
+    Returns:
+        Number of top-level elements written
+    """
+    if header:
+        out.write(header + '\n')
+
+    open_tag = '<tv' + ''.join(f' {name}="{_escape(value)}"' for name, value in tv_attrib.items())
+    count = 0
+    for block in blocks:
+        if count == 0:
+            out.write(open_tag + '>\n')
+        out.write(block)
+        count += 1
+
+    if count:
+        out.write('</tv>')
+    else:
+        out.write(open_tag + '/>')
+    return count
+
+
+@contextmanager
+def atomic_write(path: str, binary: bool = False):
+    """
+    Open a temp file next to path for writing, then atomically rename it over path.
+
+    Readers never see a partially written guide. On error the temp file is
+    removed and path is left untouched.
+
+    Args:
+        path: Destination path
+        binary: Open the temp file in binary mode instead of UTF-8 text
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        # mkstemp creates 0600 - keep the permissions a plain open() would give
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8')) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise